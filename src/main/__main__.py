@@ -17,7 +17,8 @@ import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
-from lothon.conf import settings
+from lothon.conf import settings, app_config
+from lothon import domain
 from lothon.process import analisar_sorteios, simular_jogos, gerar_palpites, \
                            criar_boloes, conferir_apostas, exportar_arquivos
 
@@ -26,7 +27,8 @@ from lothon.process import analisar_sorteios, simular_jogos, gerar_palpites, \
 # ----------------------------------------------------------------------------
 
 # argumentos da linha de comando:
-CMD_LINE_ARGS = "c:aspbrot"
+CMD_LINE_ARGS = "c:aspbrot:w:"
+CMD_LINE_LONG_ARGS = ["workers="]
 
 # Possiveis erros que podem ocorrer na execucao da aplicacao para retorno no sys.exit():
 EXIT_ERROR_INVALID_ARGS = 1
@@ -66,14 +68,18 @@ def print_usage():
           '  -b          Cria boloes de apostas para loterias da Caixa\n'
           '  -r          Confere as apostas com os resultados das loterias\n'
           '  -o          Exporta arquivos CSV com dezenas sorteadas dos concursos\n'
-          '  -t <proc>   Executa teste de funcionamento de algum processo\n')
+          '  -t <proc>   Executa teste de funcionamento de algum processo\n'
+          '  -w <qtd>    Quantidade de processos para avaliar os jogos (--workers <qtd>)\n'
+          '\n'
+          'Processos para Teste:\n'
+          '  parser      Compara o parsing dos resultados com BeautifulSoup e parser incremental\n')
 
 
 # faz o parsing das opcoes e argumentos da linha de comando:
 opts = None
 try:
     # se parsing feito com sucesso - programa ira prosseguir:
-    opts, args = getopt.getopt(sys.argv[1:], CMD_LINE_ARGS)
+    opts, args = getopt.getopt(sys.argv[1:], CMD_LINE_ARGS, CMD_LINE_LONG_ARGS)
 
 except getopt.GetoptError as ex:
     print(f"Erro no parsing dos argumentos da linha de comando: {repr(ex)}")
@@ -98,6 +104,7 @@ opt_result = False   # Flag para conferencia das apostas
 opt_output = False   # Flag para exportacao de arquivos CSV (output)
 opt_testef = False   # Flag para teste de funcionamento
 opt_tstprc = ''      # id do processo a ser executado para testes
+opt_qtdwrk = None    # quantidade de processos para avaliacao dos jogos
 opt_valido = False   # Flag para identificar se argumentos estao ok
 
 # identifica o comando/tarefa/job do Lothon a ser executado:
@@ -129,6 +136,13 @@ for opt, val in opts:
         opt_testef = True
         opt_tstprc = val
         opt_valido = True
+    elif opt in ('-w', '--workers'):
+        # valida a quantidade de processos (zero utiliza um processo por nucleo):
+        if not val.isdigit():
+            print(f"Quantidade de processos invalida: {val}")
+            print_usage()
+            sys.exit(EXIT_ERROR_INVALID_ARGS)
+        opt_qtdwrk = int(val)
 
 # se nenhuma opcao de execucao fornecida na linha de comando foi reconhecida:
 if not opt_valido:
@@ -160,6 +174,10 @@ if not settings.setup_config(opt_cfpath):
     logger.critical("Execucao da aplicacao foi interrompida.")
     sys.exit(EXIT_ERROR_CONFIG_INI)  # aborta se nao puder carregar INI
 
+# a quantidade de processos da linha de comando prevalece sobre o arquivo de configuracao:
+if opt_qtdwrk is not None:
+    app_config.CP_qtd_workers = opt_qtdwrk
+
 # tudo ok, prossegue entao com o processamento:
 logger.info("Aplicacao configurada e inicializada com sucesso.")
 logger.debug(f"Argumentos da linha de comando: {str(opts).strip('[]')}")
@@ -171,6 +189,11 @@ logger.debug(f"Argumentos da linha de comando: {str(opts).strip('[]')}")
 
 # Rotina de testes - processo exclusivo em relacao aos outros processos:
 if opt_testef:
+    # Benchmark do parsing dos arquivos HTML de resultados das loterias:
+    if opt_tstprc == 'parser':
+        logger.debug("Vai executar o benchmark do parsing dos resultados das loterias...")
+        domain.benchmark_concursos()
+
     # Informa que tudo ok ate aqui, Lothon funcionando normalmente:
     logger.info(f"Modulo main() executado com sucesso! opt_testef = {opt_testef}")
     # finaliza por aqui o processamento se esta apenas testando (exclusivo):
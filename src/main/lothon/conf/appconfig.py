@@ -56,12 +56,22 @@ class AppConfig:
     DS_jogos_csv_name: str = ''
     DS_pares_csv_name: str = ''
     DS_sorteios_csv_name: str = ''
+    DS_snapshot_bin_name: str = ''
+    DS_histogramas_bin_name: str = ''
+    DS_plano_csv_name: str = ''
+    DS_fatores_bin_name: str = ''
 
     # Parametrizacao das loterias da Caixa EF:
     LC_loterias_caixa: Optional[list[tuple[str, ...]]] = None
     LC_loteria_htm_name: str = ''
     LC_table_class_find: str = ''
 
+    # Parametrizacao das computacoes sobre as combinacoes de jogos:
+    CP_limite_enumeracao: int = 100_000_000
+    CP_tamanho_amostra: int = 1_000_000
+    CP_nivel_confianca: float = 0.95
+    CP_qtd_workers: int = 0
+
     # Parametrizacao para geracao de palpites e boloes de apostas:
     AP_palpites_csv_name: str = ''
     AP_bolao_csv_name: str = ''
@@ -97,6 +107,10 @@ class AppConfig:
         self.DS_jogos_csv_name = parser.get("DADOS", "jogos_csv_name")
         self.DS_pares_csv_name = parser.get("DADOS", "pares_csv_name")
         self.DS_sorteios_csv_name = parser.get("DADOS", "sorteios_csv_name")
+        self.DS_snapshot_bin_name = parser.get("DADOS", "snapshot_bin_name")
+        self.DS_histogramas_bin_name = parser.get("DADOS", "histogramas_bin_name")
+        self.DS_plano_csv_name = parser.get("DADOS", "plano_csv_name")
+        self.DS_fatores_bin_name = parser.get("DADOS", "fatores_bin_name")
 
         # Parametrizacao das loterias da Caixa EF:
         self.LC_loteria_htm_name = parser.get("LOTERIA_CAIXA", "loteria_htm_name")
@@ -105,6 +119,12 @@ class AppConfig:
         loterias = parser.get("LOTERIA_CAIXA", "loterias_caixa").split(',')
         self.LC_loterias_caixa = [tuple(jogo.strip().split(';')) for jogo in loterias]
 
+        # Parametrizacao das computacoes sobre as combinacoes de jogos:
+        self.CP_limite_enumeracao = parser.getint("COMPUTE", "limite_enumeracao")
+        self.CP_tamanho_amostra = parser.getint("COMPUTE", "tamanho_amostra")
+        self.CP_nivel_confianca = parser.getfloat("COMPUTE", "nivel_confianca")
+        self.CP_qtd_workers = parser.getint("COMPUTE", "qtd_workers")
+
         # Parametrizacao para geracao de boloes de apostas:
         self.AP_palpites_csv_name = parser.get("APOSTAS", "palpites_csv_name")
         self.AP_bolao_csv_name = parser.get("APOSTAS", "bolao_csv_name")
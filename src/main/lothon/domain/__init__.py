@@ -9,6 +9,7 @@ __all__ = [
     'MegaSena',
     'Quina',
     'Concurso',
+    'MatrizSorteios',
     'Faixa',
     'Premio',
     'Bola',
@@ -28,6 +29,8 @@ __all__ = [
     'get_mes_da_sorte',
     'get_time_do_coracao',
     'load_concursos',
+    'load_loterias',
+    'benchmark_concursos',
     'load_pares',
     'export_sorteios',
     'export_boloes'
@@ -38,11 +41,15 @@ __all__ = [
 # ----------------------------------------------------------------------------
 
 # Built-in/Generic modules
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
+import os
+import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.conf import app_config
+from lothon.conf.appconfig import AppConfig
 from lothon.infra import parser_resultados
 from .basico.dezena import Dezena
 from .basico.jogo import Jogo
@@ -53,6 +60,7 @@ from .basico.estrutura import LoteriaStruct
 from .sorteio.bola import Bola
 from .sorteio.serie_sorteio import SerieSorteio
 from .sorteio.concurso import Concurso
+from .sorteio.matriz_sorteios import MatrizSorteios
 from .sorteio.premio import Premio
 from .modalidade.loteria import Loteria
 from .modalidade.dia_de_sorte import DiaDeSorte
@@ -73,6 +81,33 @@ from .bilhete.bolao import Bolao
 from .bilhete.faixa import Faixa
 
 
+# ----------------------------------------------------------------------------
+# VARIAVEIS GLOBAIS
+# ----------------------------------------------------------------------------
+
+# obtem uma instancia do logger para o modulo corrente:
+logger = logging.getLogger(__name__)
+
+# loterias cujos concursos sao carregados dos arquivos HTML de resultados, com a respectiva
+# classe e o nome da variavel singleton a ser preenchida apos o parsing:
+LOTERIAS_RESULTADOS_HTML: dict[str, tuple[type, str]] = {
+    "diadesorte": (DiaDeSorte, "_dia_de_sorte"),
+    "duplasena": (DuplaSena, "_dupla_sena"),
+    "lotofacil": (Lotofacil, "_lotofacil"),
+    "lotomania": (Lotomania, "_lotomania"),
+    "megasena": (MegaSena, "_mega_sena"),
+    "quina": (Quina, "_quina"),
+    "supersete": (SuperSete, "_super_sete"),
+    "timemania": (Timemania, "_timemania"),
+    "mesdasorte": (MesDaSorte, "_mes_da_sorte"),
+    "timedocoracao": (TimeDoCoracao, "_time_do_coracao")
+}
+
+# loterias principais carregadas em paralelo pelos processos, por padrao:
+LOTERIAS_PRINCIPAIS: tuple[str, ...] = ("diadesorte", "duplasena", "lotofacil", "lotomania",
+                                        "megasena", "quina", "supersete", "timemania")
+
+
 # ----------------------------------------------------------------------------
 # ESTRUTURA DE DADOS
 # ----------------------------------------------------------------------------
@@ -103,6 +138,79 @@ def load_concursos(loteria: Loteria) -> int:
     return parser_resultados.parse_concursos_loteria(loteria)
 
 
+# inicializa cada processo do pool com a configuracao INI ja carregada no processo principal:
+def init_worker_loterias(config: AppConfig):
+    vars(app_config).update(vars(config))
+
+
+# efetua o parsing do arquivo HTML de resultados de uma loteria, em processo separado:
+def parse_concursos_worker(id_loteria: str) -> Optional[list[Concurso]]:
+    classe_loteria, _ = LOTERIAS_RESULTADOS_HTML[id_loteria]
+    loteria: Loteria = classe_loteria.from_tuple(get_tuple_loteria(id_loteria))
+    parser_resultados.parse_concursos_loteria(loteria)
+    return loteria.concursos
+
+
+# Efetua leitura dos arquivos HTML de resultados de varias loterias em paralelo, cada uma em
+# seu proprio processo, ja preenchendo as variaveis singleton das loterias:
+def load_loterias(ids_loterias: tuple[str, ...] = LOTERIAS_PRINCIPAIS,
+                  max_workers: Optional[int] = None) -> int:
+    # as loterias ja carregadas (singleton) nao precisam ser processadas novamente:
+    pendentes: list[str] = [id_loteria for id_loteria in ids_loterias
+                            if globals()[LOTERIAS_RESULTADOS_HTML[id_loteria][1]] is None]
+    if len(pendentes) == 0:
+        return 0
+
+    # o paralelismo fica limitado a quantidade de nucleos e de loterias a processar:
+    if max_workers is None:
+        max_workers = min(len(pendentes), os.cpu_count() or 1)
+
+    # se houver apenas um nucleo disponivel, o parsing eh feito sequencialmente:
+    resultados: dict[str, Optional[list[Concurso]]] = {}
+    if max_workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=init_worker_loterias,
+                                     initargs=(app_config,)) as executor:
+                futures = {id_loteria: executor.submit(parse_concursos_worker, id_loteria)
+                           for id_loteria in pendentes}
+                for id_loteria, future in futures.items():
+                    resultados[id_loteria] = future.result()
+
+        # qualquer falha no pool apenas faz o parsing ser efetuado sequencialmente:
+        except Exception as ex:
+            logger.warning(f"Nao foi possivel carregar as loterias em paralelo. ERRO: {repr(ex)}")
+            resultados.clear()
+
+    # preenche as variaveis singleton com os concursos obtidos em cada processo:
+    for id_loteria in pendentes:
+        classe_loteria, nome_singleton = LOTERIAS_RESULTADOS_HTML[id_loteria]
+        loteria: Loteria = classe_loteria.from_tuple(get_tuple_loteria(id_loteria))
+        if id_loteria in resultados:
+            loteria.concursos = resultados[id_loteria]
+        else:
+            parser_resultados.parse_concursos_loteria(loteria)
+        globals()[nome_singleton] = loteria
+
+    logger.info(f"Carregados os concursos de {len(pendentes)} loterias "
+                f"utilizando {max_workers} processo(s).")
+    return len(pendentes)
+
+
+# Compara o parsing dos arquivos HTML de resultados com BeautifulSoup e parser incremental:
+def benchmark_concursos() -> bool:
+    # utiliza novas instancias das loterias, para nao sobrescrever as variaveis singleton:
+    iguais: bool = True
+    for id_loteria in LOTERIAS_PRINCIPAIS:
+        classe_loteria, _ = LOTERIAS_RESULTADOS_HTML[id_loteria]
+        loteria: Loteria = classe_loteria.from_tuple(get_tuple_loteria(id_loteria))
+
+        # verifica se a loteria produziu os mesmos concursos em ambas abordagens:
+        iguais = parser_resultados.benchmark_parser_loteria(loteria) and iguais
+
+    return iguais
+
+
 # Efetua leitura de arquivo CSV contendo relacao de conjuntos pares:
 def load_pares(id_loteria: str) -> list[tuple[int, ...]]:
     return parser_resultados.read_pares_loteria(id_loteria)
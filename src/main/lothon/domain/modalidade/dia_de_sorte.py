@@ -17,8 +17,6 @@ from datetime import date
 from dataclasses import dataclass
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.domain.modalidade.loteria import Loteria
 from lothon.domain.sorteio.concurso import Concurso
@@ -43,21 +41,21 @@ class DiaDeSorte(Loteria):
 
     # --- METODOS ------------------------------------------------------------
 
-    def parse_concurso(self, td: ResultSet) -> Concurso:
-        id_concurso: int = int(td[0].text)
-        data_sorteio: date = parse_dmy(td[2].text)
+    def parse_concurso(self, td: list[str]) -> Concurso:
+        id_concurso: int = int(td[0])
+        data_sorteio: date = parse_dmy(td[2])
 
-        bolas: tuple[int, ...] = (int(td[3].text), int(td[4].text),
-                                  int(td[5].text), int(td[6].text),
-                                  int(td[7].text), int(td[8].text),
-                                  int(td[9].text))
+        bolas: tuple[int, ...] = (int(td[3]), int(td[4]),
+                                  int(td[5]), int(td[6]),
+                                  int(td[7]), int(td[8]),
+                                  int(td[9]))
         # garante a ordenacao das bolas:
         bolas = tuple(sorted(bolas))
 
-        premios: dict[int, Premio] = {7: Premio(7, int(td[11].text), parse_money(td[16].text)),
-                                      6: Premio(6, int(td[12].text), parse_money(td[17].text)),
-                                      5: Premio(5, int(td[13].text), parse_money(td[18].text)),
-                                      4: Premio(4, int(td[14].text), parse_money(td[19].text))}
+        premios: dict[int, Premio] = {7: Premio(7, int(td[11]), parse_money(td[16])),
+                                      6: Premio(6, int(td[12]), parse_money(td[17])),
+                                      5: Premio(5, int(td[13]), parse_money(td[18])),
+                                      4: Premio(4, int(td[14]), parse_money(td[19]))}
 
         return Concurso(id_concurso, data_sorteio, bolas=bolas, premios=premios)
 
@@ -18,8 +18,6 @@ from dataclasses import dataclass
 import logging
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.domain.modalidade.loteria import Loteria
 from lothon.domain.sorteio.concurso import Concurso
@@ -53,48 +51,49 @@ class DuplaSena(Loteria):
     # --- METODOS ------------------------------------------------------------
 
     # override do metodo para parser dos concursos duplos da Dupla Sena:
-    def set_resultados(self, table_body: ResultSet) -> int:
-        # dentro do TBODY tem uma unica TR contendo os dados relacionados em elementos TD:
-        list_concursos: list[Concurso] = []
-        for tbody in table_body:
-            tr = tbody.find("tr", recursive=False)
-            # logger.debug(f"tr = {type(tr)} {len(tr)}")
-            td = tr.find_all("td", recursive=False)
-            # logger.debug(f"td = {type(td)} {len(td)}")
-            # logger.debug(f"td[0] = {type(td[0])} {len(td[0])} {td[0].text}")
+    def set_resultados(self, linhas: list[list[str]], incremental: bool = False) -> int:
+        # no modo incremental, apenas os concursos posteriores ao ultimo ja carregado sao
+        # acrescentados ao final da lista, retornando a quantidade de novos concursos:
+        ultimo_id: int = self.get_ultimo_id_concurso() if incremental else 0
 
+        # cada linha corresponde aos textos dos elementos TD da TR de um TBODY:
+        list_concursos: list[Concurso] = []
+        for td in linhas:
             concursos: list[Concurso] = self.parse_concurso(td)
             # logger.debug(f"concursos = {concursos}")
-            list_concursos.extend(concursos)
+            list_concursos.extend(c for c in concursos if c.id_concurso > ultimo_id)
 
-        self.concursos = list_concursos
+        if incremental and self.concursos is not None:
+            self.concursos.extend(list_concursos)
+        else:
+            self.concursos = list_concursos
         return len(list_concursos)
 
     # nova assinatura com retorno de list de concursos:
-    def parse_concurso(self, td: ResultSet) -> list[Concurso]:
-        id_concurso: int = int(td[0].text)
-        data_sorteio: date = parse_dmy(td[1].text)
+    def parse_concurso(self, td: list[str]) -> list[Concurso]:
+        id_concurso: int = int(td[0])
+        data_sorteio: date = parse_dmy(td[1])
 
-        bolas1: tuple[int, ...] = (int(td[2].text), int(td[3].text),
-                                   int(td[4].text), int(td[5].text),
-                                   int(td[6].text), int(td[7].text))
+        bolas1: tuple[int, ...] = (int(td[2]), int(td[3]),
+                                   int(td[4]), int(td[5]),
+                                   int(td[6]), int(td[7]))
 
-        bolas2: tuple[int, ...] = (int(td[20].text), int(td[21].text),
-                                   int(td[22].text), int(td[23].text),
-                                   int(td[24].text), int(td[25].text))
+        bolas2: tuple[int, ...] = (int(td[20]), int(td[21]),
+                                   int(td[22]), int(td[23]),
+                                   int(td[24]), int(td[25]))
         # garante a ordenacao das bolas:
         bolas1 = tuple(sorted(bolas1))
         bolas2 = tuple(sorted(bolas2))
 
-        premios1: dict[int, Premio] = {6: Premio(6, int(td[9].text), parse_money(td[11].text)),
-                                       5: Premio(5, int(td[14].text), parse_money(td[15].text)),
-                                       4: Premio(4, int(td[16].text), parse_money(td[17].text)),
-                                       3: Premio(3, int(td[18].text), parse_money(td[19].text))}
+        premios1: dict[int, Premio] = {6: Premio(6, int(td[9]), parse_money(td[11])),
+                                       5: Premio(5, int(td[14]), parse_money(td[15])),
+                                       4: Premio(4, int(td[16]), parse_money(td[17])),
+                                       3: Premio(3, int(td[18]), parse_money(td[19]))}
 
-        premios2: dict[int, Premio] = {6: Premio(6, int(td[26].text), parse_money(td[27].text)),
-                                       5: Premio(5, int(td[28].text), parse_money(td[29].text)),
-                                       4: Premio(4, int(td[30].text), parse_money(td[31].text)),
-                                       3: Premio(3, int(td[32].text), parse_money(td[33].text))}
+        premios2: dict[int, Premio] = {6: Premio(6, int(td[26]), parse_money(td[27])),
+                                       5: Premio(5, int(td[28]), parse_money(td[29])),
+                                       4: Premio(4, int(td[30]), parse_money(td[31])),
+                                       3: Premio(3, int(td[32]), parse_money(td[33]))}
 
         return [
             Concurso(id_concurso, data_sorteio, bolas=bolas1, premios=premios1),
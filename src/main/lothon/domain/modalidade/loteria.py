@@ -20,10 +20,9 @@ import logging
 import math
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.domain.sorteio.concurso import Concurso
+from lothon.domain.sorteio.matriz_sorteios import MatrizSorteios
 from lothon.domain.bilhete.faixa import Faixa
 
 
@@ -59,6 +58,8 @@ class Loteria(ABC):
     concursos: Optional[list[Concurso]] = None
 
     sort_index: str = field(init=False, repr=False)
+    matriz_sorteios: Optional[MatrizSorteios] = field(default=None, init=False,
+                                                      repr=False, compare=False)
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -74,25 +75,45 @@ class Loteria(ABC):
     def get_file_resultados(self) -> str:
         return self.nome_loteria
 
-    def set_resultados(self, table_body: ResultSet) -> int:
-        # dentro do TBODY tem uma unica TR contendo os dados relacionados em elementos TD:
-        list_concursos: list[Concurso] = []
-        for tbody in table_body:
-            tr = tbody.find("tr", recursive=False)
-            # logger.debug(f"tr = {type(tr)} {len(tr)}")
-            td = tr.find_all("td", recursive=False)
-            # logger.debug(f"td = {type(td)} {len(td)}")
-            # logger.debug(f"td[0] = {type(td[0])} {len(td[0])} {td[0].text}")
+    def set_resultados(self, linhas: list[list[str]], incremental: bool = False) -> int:
+        # no modo incremental, apenas os concursos posteriores ao ultimo ja carregado sao
+        # acrescentados ao final da lista, retornando a quantidade de novos concursos:
+        ultimo_id: int = self.get_ultimo_id_concurso() if incremental else 0
 
+        # cada linha corresponde aos textos dos elementos TD da TR de um TBODY:
+        list_concursos: list[Concurso] = []
+        for td in linhas:
             concurso: Concurso = self.parse_concurso(td)
             # logger.debug(f"concurso = {concurso}")
-            list_concursos.append(concurso)
+            if concurso.id_concurso > ultimo_id:
+                list_concursos.append(concurso)
 
-        self.concursos = list_concursos
+        if incremental and self.concursos is not None:
+            self.concursos.extend(list_concursos)
+        else:
+            self.concursos = list_concursos
         return len(list_concursos)
 
+    # visao colunar dos concursos, (re)criada apenas se os concursos forem modificados:
+    def get_matriz_sorteios(self) -> Optional[MatrizSorteios]:
+        if self.concursos is None:
+            return None
+
+        matriz: Optional[MatrizSorteios] = self.matriz_sorteios
+        if matriz is None or matriz.qtd_concursos != len(self.concursos) or \
+                (matriz.qtd_concursos > 0 and matriz.ids[-1] != self.concursos[-1].id_concurso):
+            matriz = MatrizSorteios(self.concursos, self.qtd_bolas, self.qtd_bolas_sorteio)
+            self.matriz_sorteios = matriz
+
+        return matriz
+
+    def get_ultimo_id_concurso(self) -> int:
+        if self.concursos is None or len(self.concursos) == 0:
+            return 0
+        return self.concursos[-1].id_concurso
+
     @abstractmethod
-    def parse_concurso(self, td: ResultSet) -> Concurso:
+    def parse_concurso(self, td: list[str]) -> Concurso:
         pass
 
     # ----------------------------------------------------------------------------
@@ -17,8 +17,6 @@ from datetime import date
 from dataclasses import dataclass
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.domain.modalidade.loteria import Loteria
 from lothon.domain.sorteio.concurso import Concurso
@@ -43,26 +41,26 @@ class Lotofacil(Loteria):
 
     # --- METODOS ------------------------------------------------------------
 
-    def parse_concurso(self, td: ResultSet) -> Concurso:
-        id_concurso: int = int(td[0].text)
-        data_sorteio: date = parse_dmy(td[1].text)
-
-        bolas: tuple[int, ...] = (int(td[2].text), int(td[3].text),
-                                  int(td[4].text), int(td[5].text),
-                                  int(td[6].text), int(td[7].text),
-                                  int(td[8].text), int(td[9].text),
-                                  int(td[10].text), int(td[11].text),
-                                  int(td[12].text), int(td[13].text),
-                                  int(td[14].text), int(td[15].text),
-                                  int(td[16].text))
+    def parse_concurso(self, td: list[str]) -> Concurso:
+        id_concurso: int = int(td[0])
+        data_sorteio: date = parse_dmy(td[1])
+
+        bolas: tuple[int, ...] = (int(td[2]), int(td[3]),
+                                  int(td[4]), int(td[5]),
+                                  int(td[6]), int(td[7]),
+                                  int(td[8]), int(td[9]),
+                                  int(td[10]), int(td[11]),
+                                  int(td[12]), int(td[13]),
+                                  int(td[14]), int(td[15]),
+                                  int(td[16]))
         # garante a ordenacao das bolas:
         bolas = tuple(sorted(bolas))
 
-        premios: dict[int, Premio] = {15: Premio(15, int(td[18].text), parse_money(td[24].text)),
-                                      14: Premio(14, int(td[20].text), parse_money(td[25].text)),
-                                      13: Premio(13, int(td[21].text), parse_money(td[26].text)),
-                                      12: Premio(12, int(td[22].text), parse_money(td[27].text)),
-                                      11: Premio(11, int(td[23].text), parse_money(td[28].text))}
+        premios: dict[int, Premio] = {15: Premio(15, int(td[18]), parse_money(td[24])),
+                                      14: Premio(14, int(td[20]), parse_money(td[25])),
+                                      13: Premio(13, int(td[21]), parse_money(td[26])),
+                                      12: Premio(12, int(td[22]), parse_money(td[27])),
+                                      11: Premio(11, int(td[23]), parse_money(td[28]))}
 
         return Concurso(id_concurso, data_sorteio, bolas=bolas, premios=premios)
 
@@ -17,8 +17,6 @@ from datetime import date
 from dataclasses import dataclass
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.domain.modalidade.loteria import Loteria
 from lothon.domain.sorteio.concurso import Concurso
@@ -43,29 +41,29 @@ class Lotomania(Loteria):
 
     # --- METODOS ------------------------------------------------------------
 
-    def parse_concurso(self, td: ResultSet) -> Concurso:
-        id_concurso: int = int(td[0].text)
-        data_sorteio: date = parse_dmy(td[1].text)
-
-        bolas: tuple[int, ...] = (int(td[2].text), int(td[3].text),
-                                  int(td[4].text), int(td[5].text),
-                                  int(td[6].text), int(td[7].text),
-                                  int(td[8].text), int(td[9].text),
-                                  int(td[10].text), int(td[11].text),
-                                  int(td[12].text), int(td[13].text),
-                                  int(td[14].text), int(td[15].text),
-                                  int(td[16].text), int(td[17].text),
-                                  int(td[18].text), int(td[19].text),
-                                  int(td[20].text), int(td[21].text))
+    def parse_concurso(self, td: list[str]) -> Concurso:
+        id_concurso: int = int(td[0])
+        data_sorteio: date = parse_dmy(td[1])
+
+        bolas: tuple[int, ...] = (int(td[2]), int(td[3]),
+                                  int(td[4]), int(td[5]),
+                                  int(td[6]), int(td[7]),
+                                  int(td[8]), int(td[9]),
+                                  int(td[10]), int(td[11]),
+                                  int(td[12]), int(td[13]),
+                                  int(td[14]), int(td[15]),
+                                  int(td[16]), int(td[17]),
+                                  int(td[18]), int(td[19]),
+                                  int(td[20]), int(td[21]))
         # garante a ordenacao das bolas:
         bolas = tuple(sorted(bolas))
 
-        premios: dict[int, Premio] = {20: Premio(20, int(td[23].text), parse_money(td[31].text)),
-                                      19: Premio(19, int(td[26].text), parse_money(td[32].text)),
-                                      18: Premio(18, int(td[27].text), parse_money(td[33].text)),
-                                      17: Premio(17, int(td[28].text), parse_money(td[34].text)),
-                                      16: Premio(16, int(td[29].text), parse_money(td[35].text)),
-                                      15: Premio(15, int(td[30].text), parse_money(td[36].text))}
+        premios: dict[int, Premio] = {20: Premio(20, int(td[23]), parse_money(td[31])),
+                                      19: Premio(19, int(td[26]), parse_money(td[32])),
+                                      18: Premio(18, int(td[27]), parse_money(td[33])),
+                                      17: Premio(17, int(td[28]), parse_money(td[34])),
+                                      16: Premio(16, int(td[29]), parse_money(td[35])),
+                                      15: Premio(15, int(td[30]), parse_money(td[36]))}
 
         return Concurso(id_concurso, data_sorteio, bolas=bolas, premios=premios)
 
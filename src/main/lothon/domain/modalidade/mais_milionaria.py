@@ -17,8 +17,6 @@ from datetime import date
 from dataclasses import dataclass
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.domain.modalidade.loteria import Loteria
 from lothon.domain.sorteio.concurso import Concurso
@@ -42,7 +40,7 @@ class MaisMilionaria(Loteria):
 
     # --- METODOS ------------------------------------------------------------
 
-    def parse_concurso(self, td: ResultSet = None) -> list[Concurso]:
+    def parse_concurso(self, td: list[str] = None) -> list[Concurso]:
         # estes valores foram extraidos diretamente da pagina da loteria +Milionaria:
         self.concursos = [
             Concurso(1, date(2022, 5, 28), (23, 44, 1, 7, 3, 15), {}),
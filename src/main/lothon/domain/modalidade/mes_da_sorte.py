@@ -17,8 +17,6 @@ from datetime import date
 from dataclasses import dataclass
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.conf import app_config
 from lothon.domain.modalidade.loteria import Loteria
@@ -50,18 +48,18 @@ class MesDaSorte(Loteria):
     def get_file_resultados(self) -> str:
         return 'DIA-DE-SORTE'
 
-    def parse_concurso(self, td: ResultSet) -> Concurso:
-        id_concurso: int = int(td[0].text)
-        data_sorteio: date = parse_dmy(td[2].text)
+    def parse_concurso(self, td: list[str]) -> Concurso:
+        id_concurso: int = int(td[0])
+        data_sorteio: date = parse_dmy(td[2])
 
-        mes = td[10].text.strip().lower()
+        mes = td[10].strip().lower()
         if mes not in app_config.MAP_MESES.keys():
             raise ValueError(f"*** ATENCAO: MES-DA-SORTE NAO IDENTIFICADO "
-                             f"NO CONCURSO {td[0].text}: {mes} ***")
+                             f"NO CONCURSO {td[0]}: {mes} ***")
 
         bolas: tuple[int, ...] = (app_config.MAP_MESES[mes],)
 
-        premios: dict[int, Premio] = {1: Premio(1, int(td[15].text), parse_money(td[20].text))}
+        premios: dict[int, Premio] = {1: Premio(1, int(td[15]), parse_money(td[20]))}
 
         return Concurso(id_concurso, data_sorteio, bolas=bolas, premios=premios)
 
@@ -17,8 +17,6 @@ from datetime import date
 from dataclasses import dataclass
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.conf import app_config
 from lothon.domain.modalidade.loteria import Loteria
@@ -50,20 +48,20 @@ class TimeDoCoracao(Loteria):
     def get_file_resultados(self) -> str:
         return 'TIMEMANIA'
 
-    def parse_concurso(self, td: ResultSet) -> Concurso:
-        id_concurso: int = int(td[0].text)
-        data_sorteio: date = parse_dmy(td[1].text)
+    def parse_concurso(self, td: list[str]) -> Concurso:
+        id_concurso: int = int(td[0])
+        data_sorteio: date = parse_dmy(td[1])
 
-        time = strip_accents(td[9].text.strip().lower().replace(" /", "/")
+        time = strip_accents(td[9].strip().lower().replace(" /", "/")
                                                        .replace("/ ", "/")
                                                        .replace("  ", " "))
         if time not in app_config.MAP_CLUBES.keys():
             raise ValueError(f"*** ATENCAO: TIME-DO-CORACAO NAO IDENTIFICADO "
-                             f"NO CONCURSO {td[0].text}: {time} ***")
+                             f"NO CONCURSO {td[0]}: {time} ***")
 
         bolas: tuple[int, ...] = (app_config.MAP_CLUBES[time],)
 
-        premios: dict[int, Premio] = {1: Premio(1, int(td[17].text), parse_money(td[23].text))}
+        premios: dict[int, Premio] = {1: Premio(1, int(td[17]), parse_money(td[23]))}
 
         return Concurso(id_concurso, data_sorteio, bolas=bolas, premios=premios)
 
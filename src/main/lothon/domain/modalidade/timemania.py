@@ -17,8 +17,6 @@ from datetime import date
 from dataclasses import dataclass
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.domain.modalidade.loteria import Loteria
 from lothon.domain.sorteio.concurso import Concurso
@@ -43,22 +41,22 @@ class Timemania(Loteria):
 
     # --- METODOS ------------------------------------------------------------
 
-    def parse_concurso(self, td: ResultSet) -> Concurso:
-        id_concurso: int = int(td[0].text)
-        data_sorteio: date = parse_dmy(td[1].text)
+    def parse_concurso(self, td: list[str]) -> Concurso:
+        id_concurso: int = int(td[0])
+        data_sorteio: date = parse_dmy(td[1])
 
-        bolas: tuple[int, ...] = (int(td[2].text), int(td[3].text),
-                                  int(td[4].text), int(td[5].text),
-                                  int(td[6].text), int(td[7].text),
-                                  int(td[8].text))
+        bolas: tuple[int, ...] = (int(td[2]), int(td[3]),
+                                  int(td[4]), int(td[5]),
+                                  int(td[6]), int(td[7]),
+                                  int(td[8]))
         # garante a ordenacao das bolas:
         bolas = tuple(sorted(bolas))
 
-        premios: dict[int, Premio] = {7: Premio(7, int(td[11].text), parse_money(td[18].text)),
-                                      6: Premio(6, int(td[13].text), parse_money(td[19].text)),
-                                      5: Premio(5, int(td[14].text), parse_money(td[20].text)),
-                                      4: Premio(4, int(td[15].text), parse_money(td[21].text)),
-                                      3: Premio(3, int(td[16].text), parse_money(td[22].text))}
+        premios: dict[int, Premio] = {7: Premio(7, int(td[11]), parse_money(td[18])),
+                                      6: Premio(6, int(td[13]), parse_money(td[19])),
+                                      5: Premio(5, int(td[14]), parse_money(td[20])),
+                                      4: Premio(4, int(td[15]), parse_money(td[21])),
+                                      3: Premio(3, int(td[16]), parse_money(td[22]))}
 
         return Concurso(id_concurso, data_sorteio, bolas=bolas, premios=premios)
 
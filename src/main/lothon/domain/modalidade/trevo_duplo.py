@@ -17,8 +17,6 @@ from datetime import date
 from dataclasses import dataclass
 
 # Libs/Frameworks modules
-from bs4.element import ResultSet
-
 # Own/Project modules
 from lothon.domain.modalidade.loteria import Loteria
 from lothon.domain.sorteio.concurso import Concurso
@@ -48,7 +46,7 @@ class TrevoDuplo(Loteria):
     def get_file_resultados(self) -> str:
         return 'TREVO_DUPLO'
 
-    def parse_concurso(self, td: ResultSet = None) -> list[Concurso]:
+    def parse_concurso(self, td: list[str] = None) -> list[Concurso]:
         # estes valores foram extraidos diretamente da pagina da loteria +Milionaria:
         self.concursos = [
             Concurso(1, date(2022, 5, 28), self.get_bolas('42'), {}),
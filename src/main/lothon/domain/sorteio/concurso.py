@@ -20,6 +20,7 @@ import itertools as itt
 
 # Libs/Frameworks modules
 # Own/Project modules
+from lothon.stats.mascara import to_mascara, count_acertos_dezenas
 from lothon.domain.sorteio.premio import Premio
 
 
@@ -40,6 +41,7 @@ class Concurso:
     premios: dict[int, Premio]
 
     sort_index: int = field(init=False, repr=False)
+    mascara: int = field(init=False, repr=False, compare=False)
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -47,6 +49,8 @@ class Concurso:
         # as dezenas sorteadas sempre estarao ordenadas (ascendente):
         object.__setattr__(self, 'bolas', tuple(sorted(self.bolas)))
         object.__setattr__(self, 'sort_index', self.id_concurso)
+        # mascara de bits das dezenas sorteadas, para conferencia rapida dos acertos:
+        object.__setattr__(self, 'mascara', to_mascara(self.bolas))
 
     # --- METODOS ------------------------------------------------------------
 
@@ -58,10 +62,7 @@ class Concurso:
             return self.premios.get(qt_acertos).qtd_ganhadores
 
     def check_premiacao(self, numeros: tuple[int, ...]) -> Optional[Premio]:
-        acertos: int = 0
-        for numero in numeros:
-            if any(bola for bola in self.bolas if bola == numero):
-                acertos += 1
+        acertos: int = count_acertos_dezenas(numeros, self.mascara)
 
         if acertos in self.premios:
             return self.premios[acertos]
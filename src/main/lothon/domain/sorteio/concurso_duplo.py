@@ -13,11 +13,12 @@ __all__ = [
 # ----------------------------------------------------------------------------
 
 # Built-in/Generic modules
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 # Libs/Frameworks modules
 # Own/Project modules
+from lothon.stats.mascara import to_mascara, count_acertos_dezenas
 from lothon.domain.sorteio.premio import Premio
 from lothon.domain.sorteio.concurso import Concurso
 
@@ -36,16 +37,22 @@ class ConcursoDuplo(Concurso):
     bolas2: tuple[int, ...]
     premios2: dict[int, Premio]
 
+    mascara2: int = field(init=False, repr=False, compare=False)
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __post_init__(self):
+        Concurso.__post_init__(self)
+        # mascara de bits das dezenas do segundo sorteio, para conferencia rapida dos acertos:
+        object.__setattr__(self, 'mascara2', to_mascara(self.bolas2))
+
     # --- METODOS ------------------------------------------------------------
 
     def bolas2_ordenadas(self) -> tuple[int, ...]:
         return tuple(sorted(self.bolas2))
 
     def check_premiacao2(self, numeros: tuple[int, ...]) -> Optional[Premio]:
-        acertos2: int = 0
-        for numero in numeros:
-            if any(bola for bola in self.bolas2 if bola == numero):
-                acertos2 += 1
+        acertos2: int = count_acertos_dezenas(numeros, self.mascara2)
 
         if acertos2 in self.premios2:
             return self.premios2[acertos2]
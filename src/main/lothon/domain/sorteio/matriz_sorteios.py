@@ -0,0 +1,151 @@
+"""
+   Package lothon.domain.sorteio
+   Module  matriz_sorteios.py
+
+   Visao colunar (somente leitura) dos concursos de uma loteria, com as bolas sorteadas,
+   a incidencia das dezenas, os ids, as datas e as premiacoes em arrays contiguos.
+"""
+
+__all__ = [
+    'MatrizSorteios'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from array import array
+
+# Libs/Frameworks modules
+# Own/Project modules
+from lothon.domain.sorteio.concurso import Concurso
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+# cria uma visao 2-D somente leitura do buffer, se houver ao menos uma linha:
+def to_matriz(buffer: bytes, qtd_linhas: int, qtd_colunas: int) -> memoryview:
+    view: memoryview = memoryview(buffer)
+    if qtd_linhas > 0 and qtd_colunas > 0:
+        view = view.cast('B', (qtd_linhas, qtd_colunas))
+    return view
+
+
+# cria uma visao somente leitura do array:
+def to_vetor(valores: array) -> memoryview:
+    return memoryview(valores).toreadonly()
+
+
+# ----------------------------------------------------------------------------
+# CLASSE CONCRETA
+# ----------------------------------------------------------------------------
+
+class MatrizSorteios:
+    """
+    Implementacao de classe para representar os concursos de uma loteria em colunas:
+        bolas       (qtd_concursos x qtd_bolas_sorteio) - uint8
+        incidencia  (qtd_concursos x qtd_bolas + 1)     - 0/1, indexada pela propria bola
+                                                          (coluna zero apenas com a bola zero)
+        ids, datas  (qtd_concursos)                     - uint32, data como ordinal
+        ganhadores, premios por faixa de acertos        - uint32 e double
+    As contagens sao efetuadas sobre fatias dos buffers (bytes), sem iterar os concursos.
+    """
+
+    # --- PROPRIEDADES -------------------------------------------------------
+    __slots__ = ('qtd_concursos', 'qtd_bolas', 'qtd_bolas_sorteio', 'largura',
+                 'buffer_bolas', 'buffer_incidencia',
+                 'bolas', 'incidencia', 'ids', 'datas', 'ganhadores', 'premios')
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __init__(self, concursos: list[Concurso], qtd_bolas: int, qtd_bolas_sorteio: int):
+        self.qtd_concursos: int = len(concursos)
+        self.qtd_bolas: int = qtd_bolas
+        self.qtd_bolas_sorteio: int = qtd_bolas_sorteio
+        self.largura: int = qtd_bolas + 1  # ignora o zero-index
+
+        # as bolas e a incidencia sao montadas em buffers contiguos, linha a linha:
+        bolas: bytearray = bytearray(self.qtd_concursos * qtd_bolas_sorteio)
+        incidencia: bytearray = bytearray(self.qtd_concursos * self.largura)
+        ids: array = array('I')
+        datas: array = array('I')
+        ganhadores: dict[int, array] = {}
+        premios: dict[int, array] = {}
+
+        for idx, concurso in enumerate(concursos):
+            if len(concurso.bolas) != qtd_bolas_sorteio:
+                raise ValueError(f"Concurso {concurso.id_concurso} com {len(concurso.bolas)} "
+                                 f"bolas, mas a loteria sorteia {qtd_bolas_sorteio} bolas.")
+
+            inicio: int = idx * qtd_bolas_sorteio
+            bolas[inicio:inicio + qtd_bolas_sorteio] = bytes(concurso.bolas)
+            linha: int = idx * self.largura
+            for bola in concurso.bolas:
+                incidencia[linha + bola] = 1
+
+            ids.append(concurso.id_concurso)
+            datas.append(concurso.data_sorteio.toordinal())
+
+            # as faixas ausentes em um concurso ficam com zero ganhadores e premio:
+            for acertos, premio in concurso.premios.items():
+                if acertos not in premios:
+                    ganhadores[acertos] = array('I', bytes(4 * self.qtd_concursos))
+                    premios[acertos] = array('d', bytes(8 * self.qtd_concursos))
+                ganhadores[acertos][idx] = premio.qtd_ganhadores
+                premios[acertos][idx] = premio.premio
+
+        # mantem os buffers imutaveis para as contagens, e as visoes somente leitura:
+        self.buffer_bolas: bytes = bytes(bolas)
+        self.buffer_incidencia: bytes = bytes(incidencia)
+        self.bolas: memoryview = to_matriz(self.buffer_bolas, self.qtd_concursos,
+                                           qtd_bolas_sorteio)
+        self.incidencia: memoryview = to_matriz(self.buffer_incidencia, self.qtd_concursos,
+                                                self.largura)
+        self.ids: memoryview = to_vetor(ids)
+        self.datas: memoryview = to_vetor(datas)
+        self.ganhadores: dict[int, memoryview] = {k: to_vetor(v) for k, v in ganhadores.items()}
+        self.premios: dict[int, memoryview] = {k: to_vetor(v) for k, v in premios.items()}
+
+    # --- METODOS ------------------------------------------------------------
+
+    def get_bolas(self, idx: int) -> bytes:
+        inicio: int = idx * self.qtd_bolas_sorteio
+        return self.buffer_bolas[inicio:inicio + self.qtd_bolas_sorteio]
+
+    # quantidade de concursos, no intervalo [inicio:fim], em que a dezena foi sorteada:
+    def get_frequencia(self, dezena: int, inicio: int = 0, fim: int = None) -> int:
+        if fim is None:
+            fim = self.qtd_concursos
+        if fim <= inicio:
+            return 0
+
+        coluna: bytes = self.buffer_incidencia[inicio * self.largura + dezena:
+                                               fim * self.largura:self.largura]
+        return coluna.count(1)
+
+    # frequencia de todas as dezenas no intervalo de concursos, ignorando o zero-index:
+    def get_frequencias(self, inicio: int = 0, fim: int = None) -> list[int]:
+        return [self.get_frequencia(dezena, inicio, fim) for dezena in range(0, self.largura)]
+
+    # quantidade de vezes que cada bola foi sorteada no intervalo, inclusive bolas repetidas
+    # em um mesmo concurso (como as colunas do Super Sete):
+    def get_ocorrencias(self, inicio: int = 0, fim: int = None) -> list[int]:
+        if fim is None:
+            fim = self.qtd_concursos
+
+        trecho: bytes = self.buffer_bolas[inicio * self.qtd_bolas_sorteio:
+                                          fim * self.qtd_bolas_sorteio]
+        return [trecho.count(bola) for bola in range(0, self.largura)]
+
+    # indice do ultimo concurso, antes de fim, em que a dezena foi sorteada (ou -1 se nunca):
+    def get_ultimo_sorteio(self, dezena: int, fim: int = None) -> int:
+        if fim is None:
+            fim = self.qtd_concursos
+
+        coluna: bytes = self.buffer_incidencia[dezena:fim * self.largura:self.largura]
+        return coluna.rfind(1)
+
+# ----------------------------------------------------------------------------
@@ -14,6 +14,7 @@ __all__ = [
 
 # Built-in/Generic modules
 from dataclasses import dataclass, field
+from typing import Optional
 import statistics as stts
 
 # Libs/Frameworks modules
@@ -39,18 +40,54 @@ class SerieSorteio:
     ultimo_atraso: int = field(init=False, default=0)
     atrasos: list[int] = field(init=False, default_factory=list)
 
-    # medidas estatisticas
-    len_sorteios: int = field(init=False, default=0)
-    len_atrasos: int = field(init=False, default=0)
-    max_atraso: int = field(init=False, default=0)
-    min_atraso: int = field(init=False, default=0)
-    mode_atraso: int = field(init=False, default=0)
-    mean_atraso: float = field(init=False, default=0.0)
-    hmean_atraso: float = field(init=False, default=0.0)
-    gmean_atraso: float = field(init=False, default=0.0)
-    median_atraso: float = field(init=False, default=0.0)
-    varia_atraso: float = field(init=False, default=0.0)
-    stdev_atraso: float = field(init=False, default=0.0)
+    # medidas estatisticas dos atrasos, calculadas apenas quando consultadas:
+    stats_atrasos: Optional[tuple] = field(init=False, default=None, repr=False, compare=False)
+
+    # --- PROPRIEDADES CALCULADAS --------------------------------------------
+
+    @property
+    def len_sorteios(self) -> int:
+        return len(self.sorteios)
+
+    @property
+    def len_atrasos(self) -> int:
+        return len(self.atrasos)
+
+    @property
+    def max_atraso(self) -> int:
+        return self.get_stats()[0]
+
+    @property
+    def min_atraso(self) -> int:
+        return self.get_stats()[1]
+
+    @property
+    def mode_atraso(self) -> int:
+        return self.get_stats()[2]
+
+    @property
+    def mean_atraso(self) -> float:
+        return self.get_stats()[3]
+
+    @property
+    def hmean_atraso(self) -> float:
+        return self.get_stats()[4]
+
+    @property
+    def gmean_atraso(self) -> float:
+        return self.get_stats()[5]
+
+    @property
+    def median_atraso(self) -> float:
+        return self.get_stats()[6]
+
+    @property
+    def varia_atraso(self) -> float:
+        return self.get_stats()[7]
+
+    @property
+    def stdev_atraso(self) -> float:
+        return self.get_stats()[8]
 
     # --- METODOS ------------------------------------------------------------
 
@@ -67,6 +104,7 @@ class SerieSorteio:
         if atraso > 0:
             self.ultimo_atraso = atraso
             self.atrasos.append(atraso)
+            self.stats_atrasos = None
 
         # nao registra o ultimo sorteio mais de uma vez:
         if self.ultimo_sorteio != id_concurso:
@@ -87,23 +125,50 @@ class SerieSorteio:
         if atraso > 0:
             self.ultimo_atraso = atraso
             self.atrasos.append(atraso)
+            self.stats_atrasos = None
+
+    # desfaz o last_sorteio() do ultimo concurso, para que a serie receba o concurso seguinte:
+    def undo_last_sorteio(self, id_concurso: int):
+        # o atraso ainda nao fechado foi registrado se o numero nao ocorreu no ultimo concurso:
+        if self.ultimo_sorteio != id_concurso and id_concurso > 0:
+            self.atrasos.pop()
+            self.ultimo_atraso = self.atrasos[-1] if len(self.atrasos) > 0 else 0
+            self.stats_atrasos = None
+
+    # desfaz o add_sorteio() do numero no concurso indicado, se foi o ultimo registrado:
+    def pop_sorteio(self, id_concurso: int, inclusive: bool = False):
+        if self.ultimo_sorteio != id_concurso or len(self.sorteios) == 0:
+            return
+
+        # o atraso registrado no add_sorteio() eh recalculado a partir do sorteio anterior:
+        self.sorteios.pop()
+        self.ultimo_sorteio = self.sorteios[-1] if len(self.sorteios) > 0 else 0
+        dif: int = 0 if inclusive else 1
+        atraso: int = id_concurso - self.ultimo_sorteio - dif
+        if atraso > 0:
+            self.atrasos.pop()
+            self.ultimo_atraso = self.atrasos[-1] if len(self.atrasos) > 0 else 0
+            self.stats_atrasos = None
 
-        # aproveita e atualiza as medidas estatisticas:
-        self.update_stats()
-
-    # atualiza as medidas estatisticas, para nao ficar calculando quando adiciona sorteio:
+    # descarta as medidas estatisticas, para serem recalculadas na proxima consulta:
     def update_stats(self):
-        self.len_sorteios = len(self.sorteios)
-        self.len_atrasos = len(self.atrasos)
-        if self.len_atrasos > 0:
-            self.max_atraso = max(self.atrasos)
-            self.min_atraso = min(self.atrasos)
-            self.mode_atraso = stts.mode(self.atrasos)
-            self.mean_atraso = stts.fmean(self.atrasos)
-            self.hmean_atraso = stts.harmonic_mean(self.atrasos)
-            self.gmean_atraso = stts.geometric_mean(self.atrasos)
-            self.median_atraso = stts.median(self.atrasos)
-            self.varia_atraso = stts.pvariance(self.atrasos)
-            self.stdev_atraso = stts.pstdev(self.atrasos)
+        self.stats_atrasos = None
+
+    # medidas estatisticas dos atrasos, calculadas uma unica vez apos cada alteracao dos atrasos,
+    # para nao ficar calculando quando adiciona ou retira sorteios:
+    def get_stats(self) -> tuple:
+        if self.stats_atrasos is not None:
+            return self.stats_atrasos
+
+        atrasos: list[int] = self.atrasos
+        if len(atrasos) > 0:
+            self.stats_atrasos = (max(atrasos), min(atrasos), stts.mode(atrasos),
+                                  stts.fmean(atrasos), stts.harmonic_mean(atrasos),
+                                  stts.geometric_mean(atrasos), stts.median(atrasos),
+                                  stts.pvariance(atrasos), stts.pstdev(atrasos))
+        else:  # apos retirar sorteios, a serie pode voltar a nao ter atrasos:
+            self.stats_atrasos = (0, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+        return self.stats_atrasos
 
 # ----------------------------------------------------------------------------
@@ -0,0 +1,213 @@
+"""
+   Package lothon.infra
+   Module  cache_concursos.py
+
+   Snapshot binario dos concursos ja processados de cada loteria, identificado pela
+   impressao digital (tamanho, data de modificacao e hash) do arquivo HTML de resultados.
+   Tambem registra o offset do fim da ultima linha processada e o hash do conteudo ate ele,
+   permitindo a ingestao apenas das novas linhas adicionadas ao final do arquivo.
+"""
+
+__all__ = [
+    'Fingerprint',
+    'Snapshot',
+    'fingerprint_arquivo',
+    'carregar_snapshot',
+    'salvar_snapshot'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from collections import namedtuple
+from datetime import date
+from typing import Optional
+import hashlib
+import struct
+import os
+import logging
+
+# Libs/Frameworks modules
+# Own/Project modules
+from lothon.domain.sorteio.concurso import Concurso
+from lothon.domain.sorteio.premio import Premio
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# identificacao e versao do formato binario do snapshot:
+SNAPSHOT_MAGIC: bytes = b'LTHS'
+SNAPSHOT_VERSAO: int = 2
+
+# tamanho dos blocos de leitura do arquivo HTML para calculo do hash:
+TAMANHO_BLOCO_HASH: int = 1024 * 1024  # 1MB
+
+# layouts binarios (little-endian) do cabecalho, dos concursos e das premiacoes:
+#   cabecalho: magic, versao, tamanho, mtime (ns), hash, offset, hash do prefixo, qtd concursos
+#   concurso:  id, data (ordinal), qtd bolas, qtd premios  + bolas (1 byte cada)
+#   premio:    acertos, qtd ganhadores, valor do premio
+STRUCT_CABECALHO: struct.Struct = struct.Struct('<4sHQq16sQ16sI')
+STRUCT_CONCURSO: struct.Struct = struct.Struct('<IIBB')
+STRUCT_PREMIO: struct.Struct = struct.Struct('<BId')
+
+
+# ----------------------------------------------------------------------------
+# VARIAVEIS GLOBAIS
+# ----------------------------------------------------------------------------
+
+# obtem uma instancia do logger para o modulo corrente:
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------------
+# ESTRUTURAS DE DADOS
+# ----------------------------------------------------------------------------
+
+# impressao digital do arquivo HTML de resultados, incluindo o prefixo ja processado:
+Fingerprint = namedtuple('Fingerprint', 'tamanho mtime digest offset digest_prefixo')
+
+# concursos do snapshot e indicacao se o arquivo HTML foi apenas acrescido de novas linhas:
+Snapshot = namedtuple('Snapshot', 'concursos offset incremental')
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+# calcula o hash de todo o arquivo e tambem do prefixo ate o offset, em uma unica leitura:
+def hash_arquivo(path_arquivo: str, offset: int = 0) -> tuple[bytes, bytes]:
+    digest = hashlib.blake2b(digest_size=16)
+    digest_prefixo = digest.copy()
+    with open(path_arquivo, 'rb') as arquivo:
+        lidos: int = 0
+        while bloco := arquivo.read(TAMANHO_BLOCO_HASH):
+            if lidos < offset <= lidos + len(bloco):
+                digest.update(bloco[:offset - lidos])
+                digest_prefixo = digest.copy()
+                digest.update(bloco[offset - lidos:])
+            else:
+                digest.update(bloco)
+            lidos += len(bloco)
+
+    return digest.digest(), digest_prefixo.digest()
+
+
+# calcula o hash apenas do prefixo do arquivo, ate o offset:
+def hash_prefixo(path_arquivo: str, offset: int) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path_arquivo, 'rb') as arquivo:
+        restante: int = offset
+        while restante > 0 and (bloco := arquivo.read(min(restante, TAMANHO_BLOCO_HASH))):
+            digest.update(bloco)
+            restante -= len(bloco)
+
+    return digest.digest()
+
+
+# se informado o stat obtido antes do parsing, um arquivo atualizado durante o parsing
+# tera as novas linhas processadas na proxima ingestao incremental:
+def fingerprint_arquivo(path_arquivo: str, offset: int = 0,
+                        stat: Optional[os.stat_result] = None) -> Fingerprint:
+    if stat is None:
+        stat = os.stat(path_arquivo)
+    digest, digest_prefixo = hash_arquivo(path_arquivo, offset)
+    return Fingerprint(stat.st_size, stat.st_mtime_ns, digest, offset, digest_prefixo)
+
+
+# ----------------------------------------------------------------------------
+# LEITURA E GRAVACAO DO SNAPSHOT
+# ----------------------------------------------------------------------------
+
+def carregar_snapshot(path_snapshot: str, path_htm: str) -> Optional[Snapshot]:
+    # se ainda nao ha snapshot para a loteria, o parsing completo sera necessario:
+    if not os.path.exists(path_snapshot):
+        return None
+
+    try:
+        with open(path_snapshot, 'rb') as arquivo:
+            conteudo: bytes = arquivo.read()
+
+        magic, versao, tamanho, mtime, digest, offset_linhas, digest_prefixo, qtd_concursos = \
+            STRUCT_CABECALHO.unpack_from(conteudo, 0)
+        if magic != SNAPSHOT_MAGIC or versao != SNAPSHOT_VERSAO:
+            logger.warning(f"Formato invalido do snapshot '{path_snapshot}', sera descartado.")
+            return None
+
+        # o snapshot pode ser usado integralmente se o arquivo HTML nao foi modificado,
+        # e com a mesma data de modificacao, nem precisa calcular o hash do conteudo:
+        stat = os.stat(path_htm)
+        if stat.st_size == tamanho and (stat.st_mtime_ns == mtime or
+                                        hash_arquivo(path_htm)[0] == digest):
+            incremental: bool = False
+        # se o conteudo ja processado permanece inalterado, basta processar as novas linhas:
+        elif 0 < offset_linhas < stat.st_size and \
+                hash_prefixo(path_htm, offset_linhas) == digest_prefixo:
+            incremental: bool = True
+        else:
+            return None
+
+        # reconstroi os concursos a partir do conteudo binario:
+        concursos: list[Concurso] = []
+        offset: int = STRUCT_CABECALHO.size
+        for _ in range(0, qtd_concursos):
+            id_concurso, ordinal, qtd_bolas, qtd_premios = \
+                STRUCT_CONCURSO.unpack_from(conteudo, offset)
+            offset += STRUCT_CONCURSO.size
+            bolas: tuple[int, ...] = tuple(conteudo[offset:offset + qtd_bolas])
+            offset += qtd_bolas
+
+            premios: dict[int, Premio] = {}
+            for _p in range(0, qtd_premios):
+                acertos, qtd_ganhadores, premio = STRUCT_PREMIO.unpack_from(conteudo, offset)
+                offset += STRUCT_PREMIO.size
+                premios[acertos] = Premio(acertos, qtd_ganhadores, premio)
+
+            concursos.append(Concurso(id_concurso, date.fromordinal(ordinal), bolas, premios))
+
+        return Snapshot(concursos, offset_linhas, incremental)
+
+    # qualquer erro na leitura apenas invalida o snapshot:
+    except (OSError, struct.error, ValueError) as ex:
+        logger.warning(f"Nao foi possivel ler o snapshot '{path_snapshot}'. ERRO: {repr(ex)}")
+        return None
+
+
+def salvar_snapshot(path_snapshot: str, fingerprint: Fingerprint,
+                    concursos: list[Concurso]) -> int:
+    # valida se possui concursos a serem gravados:
+    if concursos is None or len(concursos) == 0:
+        return -1
+
+    # serializa todos os concursos em um unico buffer binario:
+    conteudo: bytearray = bytearray(STRUCT_CABECALHO.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSAO,
+                                                          fingerprint.tamanho, fingerprint.mtime,
+                                                          fingerprint.digest, fingerprint.offset,
+                                                          fingerprint.digest_prefixo,
+                                                          len(concursos)))
+    for concurso in concursos:
+        conteudo += STRUCT_CONCURSO.pack(concurso.id_concurso,
+                                         concurso.data_sorteio.toordinal(),
+                                         len(concurso.bolas), len(concurso.premios))
+        conteudo += bytes(concurso.bolas)
+        for premio in concurso.premios.values():
+            conteudo += STRUCT_PREMIO.pack(premio.acertos, premio.qtd_ganhadores, premio.premio)
+
+    # grava em arquivo temporario e substitui o snapshot anterior de forma atomica:
+    try:
+        path_temp: str = path_snapshot + '.tmp'
+        with open(path_temp, 'wb') as arquivo:
+            arquivo.write(conteudo)
+        os.replace(path_temp, path_snapshot)
+
+    # o snapshot eh apenas um cache, entao a falha na gravacao nao interrompe o processamento:
+    except OSError as ex:
+        logger.warning(f"Nao foi possivel gravar o snapshot '{path_snapshot}'. ERRO: {repr(ex)}")
+        return -1
+
+    return len(conteudo)
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,121 @@
+"""
+   Package lothon.infra
+   Module  cache_fatores.py
+
+   Arquivo binario com os fatores (float32) de todas as combinacoes de jogos de uma loteria,
+   indexados pelo ordinal do jogo, computados pela cadeia apos o ultimo concurso informado.
+   O arquivo eh aberto via memory-map, sem copiar os fatores para a memoria do processo.
+"""
+
+__all__ = [
+    'salvar_fatores',
+    'abrir_fatores'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from array import array
+from typing import Optional
+import struct
+import mmap
+import sys
+import os
+import logging
+
+# Libs/Frameworks modules
+# Own/Project modules
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# identificacao e versao do formato binario dos fatores:
+FATORES_MAGIC: bytes = b'LTHF'
+FATORES_VERSAO: int = 1
+
+# layout binario (little-endian) do cabecalho, alinhado em 8 bytes:
+#   cabecalho: magic, versao, qtd bolas, qtd bolas sorteio, id do concurso, qtd itens
+#              + itens (float32 little-endian, com o item zero sem uso, pois o ordinal inicia em 1)
+STRUCT_CABECALHO: struct.Struct = struct.Struct('<4sHHHxxIQ')
+
+
+# ----------------------------------------------------------------------------
+# VARIAVEIS GLOBAIS
+# ----------------------------------------------------------------------------
+
+# obtem uma instancia do logger para o modulo corrente:
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------------
+# LEITURA E GRAVACAO DOS FATORES
+# ----------------------------------------------------------------------------
+
+def salvar_fatores(path_fatores: str, qtd_bolas: int, qtd_bolas_sorteio: int, id_concurso: int,
+                   fatores: memoryview) -> int:
+    # valida se possui fatores a serem gravados:
+    if fatores is None or len(fatores) == 0:
+        return -1
+
+    # os itens sao gravados sempre em little-endian:
+    if sys.byteorder != 'little':
+        itens = array('f', fatores)
+        itens.byteswap()
+        fatores = memoryview(itens)
+
+    # grava em arquivo temporario e substitui os fatores anteriores de forma atomica:
+    try:
+        path_temp: str = path_fatores + '.tmp'
+        with open(path_temp, 'wb') as arquivo:
+            arquivo.write(STRUCT_CABECALHO.pack(FATORES_MAGIC, FATORES_VERSAO, qtd_bolas,
+                                                qtd_bolas_sorteio, id_concurso, len(fatores)))
+            arquivo.write(fatores)
+        os.replace(path_temp, path_fatores)
+
+    # os fatores sao apenas um cache, entao a falha na gravacao nao interrompe o processamento:
+    except OSError as ex:
+        logger.warning(f"Nao foi possivel gravar os fatores '{path_fatores}'. ERRO: {repr(ex)}")
+        return -1
+
+    return STRUCT_CABECALHO.size + len(fatores) * fatores.itemsize
+
+
+# retorna os fatores gravados para a loteria e concurso, mapeados do arquivo (somente leitura):
+def abrir_fatores(path_fatores: str, qtd_bolas: int, qtd_bolas_sorteio: int,
+                  id_concurso: int) -> Optional[memoryview]:
+    # se ainda nao ha fatores para o concurso, entao serao computados:
+    if not os.path.exists(path_fatores):
+        return None
+
+    try:
+        with open(path_fatores, 'rb') as arquivo:
+            # o mapeamento permanece valido apos fechar o arquivo, enquanto houver referencias:
+            conteudo: mmap.mmap = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, versao, bolas, bolas_sorteio, concurso, qtd_itens = \
+            STRUCT_CABECALHO.unpack_from(conteudo, 0)
+        if magic != FATORES_MAGIC or versao != FATORES_VERSAO or \
+                (bolas, bolas_sorteio, concurso) != (qtd_bolas, qtd_bolas_sorteio, id_concurso):
+            logger.warning(f"Formato invalido dos fatores '{path_fatores}', serao descartados.")
+            return None
+        if len(conteudo) != STRUCT_CABECALHO.size + qtd_itens * 4:
+            raise ValueError(f"Conteudo truncado com {len(conteudo)} bytes.")
+
+        fatores: memoryview = memoryview(conteudo)[STRUCT_CABECALHO.size:].cast('f')
+        if sys.byteorder != 'little':  # copia os itens apenas se a plataforma for big-endian
+            itens = array('f', fatores)
+            itens.byteswap()
+            fatores = memoryview(itens)
+
+        return fatores
+
+    # qualquer erro na leitura apenas invalida os fatores:
+    except (OSError, struct.error, ValueError) as ex:
+        logger.warning(f"Nao foi possivel ler os fatores '{path_fatores}'. ERRO: {repr(ex)}")
+        return None
+
+# ----------------------------------------------------------------------------
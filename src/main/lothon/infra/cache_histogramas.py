@@ -0,0 +1,134 @@
+"""
+   Package lothon.infra
+   Module  cache_histogramas.py
+
+   Arquivo binario com os histogramas das features de todas as combinacoes de jogos de uma
+   geometria de loteria (quantidade de bolas e de bolas sorteadas), com a versao de cada
+   feature, para que apenas as features alteradas precisem ser recontabilizadas.
+"""
+
+__all__ = [
+    'carregar_histogramas',
+    'salvar_histogramas'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+import struct
+import os
+import logging
+
+# Libs/Frameworks modules
+# Own/Project modules
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# identificacao e versao do formato binario dos histogramas:
+HISTOGRAMAS_MAGIC: bytes = b'LTHH'
+HISTOGRAMAS_VERSAO: int = 2
+
+# layouts binarios (little-endian) do cabecalho e de cada feature:
+#   cabecalho: magic, versao, qtd bolas, qtd bolas sorteio, qtd features
+#   feature:   tamanho da chave, versao da feature, qtd itens, bytes por item  + chave (utf-8)
+#              + itens (inteiros sem sinal, pois C(100,20) nao cabe em 8 bytes)
+STRUCT_CABECALHO: struct.Struct = struct.Struct('<4sHHHI')
+STRUCT_FEATURE: struct.Struct = struct.Struct('<BIIB')
+
+
+# ----------------------------------------------------------------------------
+# VARIAVEIS GLOBAIS
+# ----------------------------------------------------------------------------
+
+# obtem uma instancia do logger para o modulo corrente:
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------------
+# LEITURA E GRAVACAO DOS HISTOGRAMAS
+# ----------------------------------------------------------------------------
+
+# retorna os histogramas gravados para a geometria, por chave: (versao da feature, histograma)
+def carregar_histogramas(path_histogramas: str, qtd_bolas: int,
+                         qtd_bolas_sorteio: int) -> dict[str, tuple[int, list[int]]]:
+    # se ainda nao ha histogramas para a geometria, todos serao contabilizados:
+    if not os.path.exists(path_histogramas):
+        return {}
+
+    try:
+        with open(path_histogramas, 'rb') as arquivo:
+            conteudo: bytes = arquivo.read()
+
+        magic, versao, bolas, bolas_sorteio, qtd_features = \
+            STRUCT_CABECALHO.unpack_from(conteudo, 0)
+        if magic != HISTOGRAMAS_MAGIC or versao != HISTOGRAMAS_VERSAO or \
+                (bolas, bolas_sorteio) != (qtd_bolas, qtd_bolas_sorteio):
+            logger.warning(f"Formato invalido dos histogramas '{path_histogramas}', "
+                           f"serao descartados.")
+            return {}
+
+        # reconstroi os histogramas a partir do conteudo binario:
+        histogramas: dict[str, tuple[int, list[int]]] = {}
+        offset: int = STRUCT_CABECALHO.size
+        for _ in range(0, qtd_features):
+            tam_chave, versao_feature, qtd_itens, tam_item = \
+                STRUCT_FEATURE.unpack_from(conteudo, offset)
+            offset += STRUCT_FEATURE.size
+            chave: str = conteudo[offset:offset + tam_chave].decode('utf-8')
+            offset += tam_chave
+            fim: int = offset + tam_item * qtd_itens
+            if fim > len(conteudo):
+                raise ValueError(f"Conteudo truncado na feature '{chave}'.")
+            itens: list[int] = [int.from_bytes(conteudo[i:i + tam_item], 'little')
+                                for i in range(offset, fim, tam_item)]
+            offset = fim
+            histogramas[chave] = (versao_feature, itens)
+
+        return histogramas
+
+    # qualquer erro na leitura apenas invalida os histogramas:
+    except (OSError, struct.error, ValueError) as ex:
+        logger.warning(f"Nao foi possivel ler os histogramas '{path_histogramas}'. "
+                       f"ERRO: {repr(ex)}")
+        return {}
+
+
+def salvar_histogramas(path_histogramas: str, qtd_bolas: int, qtd_bolas_sorteio: int,
+                       histogramas: dict[str, tuple[int, list[int]]]) -> int:
+    # valida se possui histogramas a serem gravados:
+    if histogramas is None or len(histogramas) == 0:
+        return -1
+
+    # serializa todos os histogramas em um unico buffer binario:
+    conteudo: bytearray = bytearray(STRUCT_CABECALHO.pack(HISTOGRAMAS_MAGIC, HISTOGRAMAS_VERSAO,
+                                                          qtd_bolas, qtd_bolas_sorteio,
+                                                          len(histogramas)))
+    for chave, (versao_feature, itens) in histogramas.items():
+        chave_utf8: bytes = chave.encode('utf-8')
+        tam_item: int = max(1, (max(itens, default=0).bit_length() + 7) // 8)
+        conteudo += STRUCT_FEATURE.pack(len(chave_utf8), versao_feature, len(itens), tam_item)
+        conteudo += chave_utf8
+        for item in itens:
+            conteudo += item.to_bytes(tam_item, 'little')
+
+    # grava em arquivo temporario e substitui os histogramas anteriores de forma atomica:
+    try:
+        path_temp: str = path_histogramas + '.tmp'
+        with open(path_temp, 'wb') as arquivo:
+            arquivo.write(conteudo)
+        os.replace(path_temp, path_histogramas)
+
+    # os histogramas sao apenas um cache, entao a falha na gravacao nao interrompe o processamento:
+    except OSError as ex:
+        logger.warning(f"Nao foi possivel gravar os histogramas '{path_histogramas}'. "
+                       f"ERRO: {repr(ex)}")
+        return -1
+
+    return len(conteudo)
+
+# ----------------------------------------------------------------------------
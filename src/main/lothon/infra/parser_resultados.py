@@ -9,6 +9,7 @@ __all__ = [
     'read_dezenas_csv',
     'read_jogos_csv',
     'parse_concursos_loteria',
+    'benchmark_parser_loteria',
     'exist_jogos_loteria',
     'read_jogos_loteria',
     'read_pares_loteria',
@@ -25,6 +26,7 @@ from datetime import date
 import os
 import glob
 import csv
+import time
 import logging
 
 # Libs/Frameworks modules
@@ -32,6 +34,7 @@ from bs4 import BeautifulSoup
 
 # Own/Project modules
 from lothon.conf import app_config
+from lothon.infra import parser_tabela, cache_concursos
 from lothon.domain.modalidade.loteria import Loteria
 from lothon.domain.basico.jogo import Jogo
 from lothon.util.eve import *
@@ -124,6 +127,21 @@ def read_jogos_csv(file_path: str) -> list[Jogo] | None:
         return None
 
 
+# identifica o path do arquivo HTM de resultados de determinada loteria, se existir:
+def get_path_resultados(nome_loteria: str) -> str | None:
+    loteria_htm_file = app_config.LC_loteria_htm_name.format(nome_loteria)
+    loteria_htm_path = os.path.join(app_config.DS_caixa_path, loteria_htm_file)
+    logger.debug(f"Path do Arquivo HTM da loteria '{nome_loteria}': {loteria_htm_path}")
+
+    # precisa certificar que o arquivo existe antes da leitura:
+    if not os.path.exists(loteria_htm_path):
+        logger.error(f"O arquivo '{loteria_htm_file}' nao foi encontrado na pasta "
+                     f"'{app_config.DS_caixa_path}' para leitura.")
+        return None
+
+    return loteria_htm_path
+
+
 # le arquivo de resultados e retorna conteudo HTML:
 def ler_arquivo_htm(path_arquivo: str) -> str:
     logger.debug(f"Vai abrir para leitura o arquivo texto '{path_arquivo}'.")
@@ -145,14 +163,8 @@ def carregar_resultados(nome_loteria: str):
     logger.debug(f"Vai ler o arquivo HTM da loteria '{nome_loteria}'.")
 
     # identifica o nome e path do arquivo HTM a ser lido:
-    loteria_htm_file = app_config.LC_loteria_htm_name.format(nome_loteria)
-    loteria_htm_path = os.path.join(app_config.DS_caixa_path, loteria_htm_file)
-    logger.debug(f"Path do Arquivo HTM da loteria '{nome_loteria}': {loteria_htm_path}")
-
-    # precisa certificar que o arquivo existe antes da leitura:
-    if not os.path.exists(loteria_htm_path):
-        logger.error(f"O arquivo '{loteria_htm_file}' nao foi encontrado na pasta "
-                     f"'{app_config.DS_caixa_path}' para leitura.")
+    loteria_htm_path = get_path_resultados(nome_loteria)
+    if loteria_htm_path is None:
         return
 
     # carrega completamente o conteudo HTML do arquivo:
@@ -161,6 +173,12 @@ def carregar_resultados(nome_loteria: str):
     return content_htm
 
 
+# identifica o path do arquivo de snapshot binario dos concursos de determinada loteria:
+def get_path_snapshot(id_loteria: str) -> str:
+    loteria_bin_file: str = app_config.DS_snapshot_bin_name.format(id_loteria)
+    return os.path.join(app_config.DS_cache_path, loteria_bin_file)
+
+
 def exist_jogos_loteria(nome_loteria: str) -> bool:
     # identifica o arquivo com os jogos computados da loteria:
     loteria_jogos_file: str = app_config.DS_jogos_csv_name.format(nome_loteria)
@@ -174,52 +192,146 @@ def exist_jogos_loteria(nome_loteria: str) -> bool:
 # LEITURA DE DADOS E PARSING DOS RESULTADOS
 # ----------------------------------------------------------------------------
 
+# extrai as linhas de resultados (textos dos TD) usando o BeautifulSoup, para comparacao:
+def extrair_linhas_soup(content_htm: str, table_class: str) -> list[list[str]] | None:
+    soup = BeautifulSoup(content_htm, 'html.parser')
+    table = soup.find("table", {"class": table_class})
+    if table is None or len(table) == 0:
+        return None
+
+    linhas: list[list[str]] = []
+    for tbody in table.find_all("tbody", recursive=False):
+        tr = tbody.find("tr", recursive=False)
+        linhas.append([td.text for td in tr.find_all("td", recursive=False)])
+
+    return linhas
+
+
 def parse_concursos_loteria(loteria: Loteria) -> int:
     nome_loteria = loteria.get_file_resultados()
     tag_loteria = loteria.get_tag_resultados()
     logger.info(f"Iniciando a carga dos concursos da loteria '{nome_loteria}'.")
 
-    # efetua leitura dos resultados da loteria, verificando se o arquivo existe na pasta 'data'.
-    content_htm = carregar_resultados(nome_loteria)
-    # logger.debug(f"content_htm = {content_htm}")
-    if content_htm is None or len(content_htm) == 0:
+    # verifica se o arquivo de resultados da loteria existe na pasta 'data':
+    loteria_htm_path = get_path_resultados(nome_loteria)
+    if loteria_htm_path is None or os.path.getsize(loteria_htm_path) == 0:
         logger.error(f"Nao foi possivel carregar os resultados da loteria '{nome_loteria}'.")
         return -1
     else:
-        logger.info(f"Foram lidos {formatb(len(content_htm))} caracteres do arquivo de "
-                    f"resultados da loteria '{nome_loteria}'.")
+        logger.info(f"Vai efetuar a leitura de {formatb(os.path.getsize(loteria_htm_path))} "
+                    f"bytes do arquivo de resultados da loteria '{nome_loteria}'.")
 
-    # carrega no BeautifulSoup o HTML contendo uma <TABLE> de resultados:
-    logger.debug(f"Vai efetuar o parsing do conteudo HTML de resultados da "
-                 f"loteria '{nome_loteria}'.")
-    soup = BeautifulSoup(content_htm, 'html.parser')
-    # logger.debug(f"soup.prettify() = {soup.prettify()}")
+    # se o arquivo HTM nao foi modificado, carrega os concursos diretamente do snapshot:
+    loteria_bin_path = get_path_snapshot(loteria.id_loteria)
+    snapshot = cache_concursos.carregar_snapshot(loteria_bin_path, loteria_htm_path)
+    if snapshot is not None and not snapshot.incremental:
+        logger.info(f"Carregados {len(snapshot.concursos)} concursos da loteria '{nome_loteria}' "
+                    f"a partir do snapshot '{loteria_bin_path}'.")
+        loteria.concursos = snapshot.concursos
+        return len(snapshot.concursos)
+
+    # se o arquivo HTM apenas recebeu novas linhas, o parsing inicia apos a ultima ja processada:
+    offset_inicial = 0 if snapshot is None else snapshot.offset
 
-    # pesquisa o elemento <TABLE> contendo a relacao de resultados / concursos da loteria:
-    table_class = app_config.LC_table_class_find.format(tag_loteria)
     # formato do HTML atual:  <table class="tabela-resultado supersete">
-    table = soup.find("table", {"class": table_class})
-    # logger.debug(f"len(table) = {len(table)}")
-    if table is None or len(table) == 0:
+    table_class = app_config.LC_table_class_find.format(tag_loteria)
+
+    # a data de modificacao eh obtida antes do parsing, para o caso do arquivo ser atualizado:
+    stat_htm = os.stat(loteria_htm_path)
+
+    # efetua o parsing incremental do HTML, sem carregar todo o arquivo nem criar o DOM,
+    # localizando nos mesmos blocos o offset do fim da ultima linha (TBODY) para a
+    # proxima ingestao incremental:
+    logger.debug(f"Vai efetuar o parsing do conteudo HTML de resultados da "
+                 f"loteria '{nome_loteria}' a partir do byte {offset_inicial}.")
+    localizador = parser_tabela.LocalizadorLinhas(table_class, offset_inicial)
+    linhas = parser_tabela.extrair_linhas_arquivo(loteria_htm_path, table_class, offset_inicial,
+                                                  localizador)
+    fingerprint = cache_concursos.fingerprint_arquivo(loteria_htm_path, localizador.fim_linhas,
+                                                      stat_htm)
+
+    # se nao encontrou o elemento <TABLE> com a relacao de resultados / concursos da loteria:
+    if linhas is None:
         logger.fatal(f"*** ATENCAO: O formato do arquivo HTM da loteria "
                      f"'{nome_loteria}' foi modificado! ***")
         return -1
     else:
         logger.info(f"Parsing do arquivo HTM da loteria '{nome_loteria}' efetuado com sucesso.")
 
+    # se as linhas localizadas nao conferem com o parser, desabilita a proxima ingestao incremental:
+    if len(linhas) != localizador.qtd_linhas:
+        logger.warning(f"Divergencia na localizacao das linhas do arquivo HTM da loteria "
+                       f"'{nome_loteria}': {localizador.qtd_linhas} TBODY x "
+                       f"{len(linhas)} linhas.")
+        fingerprint = fingerprint._replace(offset=0)
+
+    # apenas as novas linhas sao processadas e acrescentadas aos concursos do snapshot:
+    if snapshot is not None:
+        loteria.concursos = snapshot.concursos
+        qtd_anteriores = len(snapshot.concursos)
+        qtd_novos = loteria.set_resultados(linhas, incremental=True)
+        logger.info(f"Acrescentados {qtd_novos} novos concursos aos {qtd_anteriores} concursos "
+                    f"do snapshot da loteria '{nome_loteria}'.")
+
+        cache_concursos.salvar_snapshot(loteria_bin_path, fingerprint, loteria.concursos)
+        return len(loteria.concursos)
+
     # cada linha de resultado/concurso esta envolta em um TBODY:
-    table_body = table.find_all("tbody", recursive=False)
-    # logger.debug(f"len(table_body) = {len(table_body)}")
-    if table_body is None or len(table_body) == 0:
+    if len(linhas) == 0:
         logger.fatal(f"*** ATENCAO: O formato do arquivo HTM da loteria "
                      f"'{nome_loteria}' foi modificado! ***")
         return -1
     else:
-        logger.info(f"Encontradas {len(table_body)} linhas de resultados no arquivo HTM da "
+        logger.info(f"Encontradas {len(linhas)} linhas de resultados no arquivo HTM da "
                     f"loteria '{nome_loteria}'.")
 
-    # dentro do TBODY tem uma unica TR contendo os dados relacionados em elementos TD:
-    return loteria.set_resultados(table_body)
+    # cada linha contem os textos dos elementos TD da unica TR do TBODY:
+    qtd_concursos = loteria.set_resultados(linhas)
+
+    # salva o snapshot dos concursos para acelerar a proxima execucao:
+    cache_concursos.salvar_snapshot(loteria_bin_path, fingerprint, loteria.concursos)
+    return qtd_concursos
+
+
+# compara o tempo de parsing do BeautifulSoup com o parser incremental de resultados:
+def benchmark_parser_loteria(loteria: Loteria, repeticoes: int = 3) -> bool:
+    nome_loteria = loteria.get_file_resultados()
+    table_class = app_config.LC_table_class_find.format(loteria.get_tag_resultados())
+    loteria_htm_path = get_path_resultados(nome_loteria)
+    if loteria_htm_path is None:
+        return False
+
+    # mede o melhor tempo de cada abordagem, incluindo o parsing dos concursos:
+    tempo_soup: float = float('inf')
+    tempo_stream: float = float('inf')
+    concursos_soup: list = []
+    concursos_stream: list = []
+    for _ in range(0, repeticoes):
+        inicio: float = time.perf_counter()
+        linhas_soup = extrair_linhas_soup(ler_arquivo_htm(loteria_htm_path), table_class)
+        if linhas_soup is None:
+            logger.fatal(f"*** ATENCAO: O formato do arquivo HTM da loteria "
+                         f"'{nome_loteria}' foi modificado! ***")
+            return False
+        loteria.set_resultados(linhas_soup)
+        tempo_soup = min(tempo_soup, time.perf_counter() - inicio)
+        concursos_soup = loteria.concursos
+
+        inicio = time.perf_counter()
+        linhas_stream = parser_tabela.extrair_linhas_arquivo(loteria_htm_path, table_class)
+        loteria.set_resultados(linhas_stream)
+        tempo_stream = min(tempo_stream, time.perf_counter() - inicio)
+        concursos_stream = loteria.concursos
+
+    # ambas abordagens devem produzir exatamente os mesmos concursos:
+    iguais: bool = concursos_soup == concursos_stream
+    logger.info(f"Benchmark do parsing da loteria '{nome_loteria}' com "
+                f"{formatd(len(concursos_stream))} concursos:\n"
+                f"\t BeautifulSoup (html.parser) = {tempo_soup * 1000:10.1f} ms\n"
+                f"\t Parser incremental          = {tempo_stream * 1000:10.1f} ms\n"
+                f"\t Ganho de desempenho         = {tempo_soup / tempo_stream:10.1f} x\n"
+                f"\t Concursos identicos         = {iguais}")
+    return iguais
 
 
 def read_pares_loteria(id_loteria: str) -> list[tuple[int, ...]] | None:
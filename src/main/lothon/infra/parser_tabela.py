@@ -0,0 +1,300 @@
+"""
+   Package lothon.infra
+   Module  parser_tabela.py
+
+   Parser incremental (orientado a eventos) da TABLE de resultados das loterias,
+   sem construir a arvore DOM completa do arquivo HTML.
+"""
+
+__all__ = [
+    'ParserTabela',
+    'LocalizadorLinhas',
+    'extrair_linhas_arquivo',
+    'extrair_linhas_texto'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from html.parser import HTMLParser
+from typing import Optional
+import codecs
+import io
+import re
+import logging
+
+# Libs/Frameworks modules
+# Own/Project modules
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# tamanho dos blocos de leitura do arquivo HTML para alimentar o parser:
+TAMANHO_BLOCO_LEITURA: int = 1024 * 1024  # 1MB
+
+# elementos HTML sem tag de fechamento, que nao podem ser empilhados:
+TAGS_SEM_FECHAMENTO: frozenset[str] = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr',
+                                                 'img', 'input', 'link', 'meta', 'param',
+                                                 'source', 'track', 'wbr'))
+
+# localizacao das tags TABLE e TBODY (abertura e fechamento) no conteudo binario do HTML:
+REGEX_TAG_TABELA: re.Pattern = re.compile(rb'<(/?)(table|tbody)\b([^>]*)>', re.IGNORECASE)
+REGEX_ATTR_CLASS: re.Pattern = re.compile(rb'\bclass\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))',
+                                          re.IGNORECASE)
+
+
+# ----------------------------------------------------------------------------
+# VARIAVEIS GLOBAIS
+# ----------------------------------------------------------------------------
+
+# obtem uma instancia do logger para o modulo corrente:
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------------
+# CLASSE CONCRETA
+# ----------------------------------------------------------------------------
+
+class ParserTabela(HTMLParser):
+    """
+    Parser orientado a eventos que localiza a TABLE de resultados pela classe CSS e
+    emite, para cada TBODY filho direto da TABLE, a lista de textos dos TD da primeira TR.
+
+    Reproduz a semantica da leitura anterior com BeautifulSoup, sem criar a arvore DOM:
+        table.find_all("tbody", recursive=False) -> tbody.find("tr", recursive=False) ->
+        tr.find_all("td", recursive=False) -> td.text
+    """
+
+    # --- PROPRIEDADES -------------------------------------------------------
+    __slots__ = ('table_class', 'linhas', 'achou_tabela', 'fim_tabela',
+                 'pilha', 'linha', 'celula', 'tem_tr', 'leu_tr')
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __init__(self, table_class: str, dentro_tabela: bool = False):
+        super().__init__(convert_charrefs=True)
+
+        # classe CSS normalizada para identificar a TABLE de resultados:
+        self.table_class: str = ' '.join(table_class.split())
+
+        # linhas de resultados encontradas, cada uma com os textos dos TD de um TBODY:
+        self.linhas: list[list[str]] = []
+        self.achou_tabela: bool = False
+        self.fim_tabela: bool = False
+
+        # pilha de elementos abertos a partir da TABLE de resultados (inclusive):
+        self.pilha: list[str] = []
+        self.linha: Optional[list[str]] = None
+        self.celula: Optional[list[str]] = None
+        self.tem_tr: bool = False
+        self.leu_tr: bool = False
+
+        # o parsing pode ser retomado a partir de um ponto ja dentro da TABLE de resultados:
+        if dentro_tabela:
+            self.achou_tabela = True
+            self.pilha.append('table')
+
+    # --- METODOS ------------------------------------------------------------
+
+    def is_tabela_resultados(self, attrs: list[tuple[str, Optional[str]]]) -> bool:
+        for name, value in attrs:
+            if name == 'class' and value is not None:
+                classes: list[str] = value.split()
+                return ' '.join(classes) == self.table_class or self.table_class in classes
+
+        return False
+
+    def abrir_elemento(self, tag: str):
+        depth: int = len(self.pilha)
+        self.pilha.append(tag)
+
+        # TBODY filho direto da TABLE: inicia nova linha de resultado:
+        if depth == 1 and tag == 'tbody':
+            self.linha = []
+            self.leu_tr = False
+        # apenas a primeira TR do TBODY eh considerada:
+        elif depth == 2 and tag == 'tr' and self.pilha[1] == 'tbody':
+            self.tem_tr = not self.leu_tr
+            self.leu_tr = True
+        # TD filho direto da TR: inicia a coleta do texto da celula:
+        elif depth == 3 and tag == 'td' and self.tem_tr and self.pilha[1] == 'tbody':
+            self.celula = []
+
+    def fechar_elemento(self):
+        tag: str = self.pilha.pop()
+        depth: int = len(self.pilha)
+
+        if depth == 3 and tag == 'td' and self.celula is not None:
+            self.linha.append(''.join(self.celula))
+            self.celula = None
+        elif depth == 2 and tag == 'tr':
+            self.tem_tr = False
+        elif depth == 1 and tag == 'tbody':
+            if self.linha is not None and len(self.linha) > 0:
+                self.linhas.append(self.linha)
+            self.linha = None
+        elif depth == 0:  # fechou a propria TABLE de resultados:
+            self.fim_tabela = True
+
+    # --- EVENTOS DO PARSER --------------------------------------------------
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]):
+        if self.fim_tabela:
+            return
+
+        if len(self.pilha) == 0:
+            # ainda procurando pela TABLE de resultados:
+            if tag == 'table' and self.is_tabela_resultados(attrs):
+                self.achou_tabela = True
+                self.pilha.append(tag)
+        elif tag not in TAGS_SEM_FECHAMENTO:
+            self.abrir_elemento(tag)
+
+    def handle_endtag(self, tag: str):
+        if self.fim_tabela or len(self.pilha) == 0:
+            return
+
+        # tag de fechamento sem abertura correspondente eh ignorada:
+        if tag not in self.pilha:
+            return
+
+        # fecha todos os elementos abertos ate a tag indicada:
+        while len(self.pilha) > 0:
+            if self.pilha[-1] == tag:
+                self.fechar_elemento()
+                break
+            self.fechar_elemento()
+
+    def handle_data(self, data: str):
+        if self.celula is not None:
+            self.celula.append(data)
+
+    # --- PROCESSAMENTO ------------------------------------------------------
+
+    def finalizar(self) -> Optional[list[list[str]]]:
+        self.close()
+
+        # se a TABLE nao foi encontrada, o formato do arquivo mudou:
+        if not self.achou_tabela:
+            return None
+
+        # TBODY ainda aberto no final do arquivo tambem eh considerado:
+        while len(self.pilha) > 0:
+            self.fechar_elemento()
+
+        return self.linhas
+
+
+class LocalizadorLinhas:
+    """
+    Localiza, nos blocos binarios lidos do arquivo HTML, o offset (em bytes) logo apos o
+    ultimo TBODY filho direto da TABLE de resultados, contando os TBODY encontrados
+    (para conferencia com o parser). Alimentado com os mesmos blocos do parser, evita
+    uma leitura adicional do arquivo para a ingestao incremental.
+    """
+
+    # --- PROPRIEDADES -------------------------------------------------------
+    __slots__ = ('table_class', 'offset', 'pendente', 'nivel',
+                 'fim_linhas', 'qtd_linhas', 'fim_tabela')
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __init__(self, table_class: str, offset: int = 0):
+        self.table_class: str = table_class
+
+        # offset (em bytes) do inicio do conteudo pendente, com tag cortada no fim do bloco:
+        self.offset: int = offset
+        self.pendente: bytes = b''
+
+        # nivel de aninhamento de TABLE a partir da TABLE de resultados (inclusive).
+        # se informado o offset, a busca eh retomada ja dentro da TABLE de resultados:
+        self.nivel: int = 1 if offset > 0 else 0
+        self.fim_linhas: int = offset
+        self.qtd_linhas: int = 0
+        self.fim_tabela: bool = False
+
+    # --- PROCESSAMENTO ------------------------------------------------------
+
+    def feed(self, bloco: bytes):
+        if self.fim_tabela:
+            return
+
+        conteudo: bytes = self.pendente + bloco
+        fim_match: int = 0
+        for match in REGEX_TAG_TABELA.finditer(conteudo):
+            fechamento, tag, attrs = match.groups()
+            tag = tag.lower()
+            fim_match = match.end()
+            if self.nivel == 0:
+                # ainda procurando pela TABLE de resultados:
+                if not fechamento and tag == b'table' and is_class_tabela(attrs,
+                                                                         self.table_class):
+                    self.nivel = 1
+            elif tag == b'table':
+                self.nivel += -1 if fechamento else 1
+                if self.nivel == 0:  # fechou a propria TABLE de resultados:
+                    self.fim_tabela = True
+                    self.pendente = b''
+                    return
+            elif fechamento and self.nivel == 1:  # fim de um TBODY filho direto da TABLE
+                self.fim_linhas = self.offset + fim_match
+                self.qtd_linhas += 1
+
+        # a tag iniciada apos o ultimo '>' do bloco pode ter sido cortada, e sera
+        # analisada novamente junto com o proximo bloco:
+        inicio_tag: int = conteudo.find(b'<', max(fim_match, conteudo.rfind(b'>') + 1))
+        corte: int = len(conteudo) if inicio_tag < 0 else inicio_tag
+        self.offset += corte
+        self.pendente = conteudo[corte:]
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+# extrai as linhas de resultados a partir do conteudo HTML ja carregado em memoria:
+def extrair_linhas_texto(content_htm: str, table_class: str) -> Optional[list[list[str]]]:
+    parser: ParserTabela = ParserTabela(table_class)
+    parser.feed(content_htm)
+    return parser.finalizar()
+
+
+# extrai as linhas de resultados lendo o arquivo HTML em blocos, sem carregar todo o conteudo.
+# se informado o offset (em bytes) do fim de um TBODY, o parsing eh retomado a partir dele.
+# se informado o localizador, os mesmos blocos identificam o offset do fim das linhas:
+def extrair_linhas_arquivo(path_arquivo: str, table_class: str, offset: int = 0,
+                           localizador: Optional[LocalizadorLinhas] = None) \
+        -> Optional[list[list[str]]]:
+    parser: ParserTabela = ParserTabela(table_class, dentro_tabela=(offset > 0))
+
+    # decodifica os blocos binarios como o TextIOWrapper (UTF-8 e quebras de linha):
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(),
+                                           translate=True)
+    with open(path_arquivo, "rb") as arquivo:
+        arquivo.seek(offset)
+        while not (parser.fim_tabela and (localizador is None or localizador.fim_tabela)):
+            bloco: bytes = arquivo.read(TAMANHO_BLOCO_LEITURA)
+            if localizador is not None:
+                localizador.feed(bloco)
+            parser.feed(decoder.decode(bloco, final=(len(bloco) == 0)))
+            if len(bloco) == 0:
+                break
+
+    return parser.finalizar()
+
+
+def is_class_tabela(attrs: bytes, table_class: str) -> bool:
+    match = REGEX_ATTR_CLASS.search(attrs)
+    if match is None:
+        return False
+
+    valor: bytes = next(grupo for grupo in match.groups() if grupo is not None)
+    classes: list[str] = valor.decode('utf-8', errors='replace').split()
+    table_class = ' '.join(table_class.split())
+    return ' '.join(classes) == table_class or table_class in classes
+
+# ----------------------------------------------------------------------------
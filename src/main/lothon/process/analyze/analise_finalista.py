@@ -14,19 +14,25 @@ __all__ = [
 
 # Built-in/Generic modules
 # import sys
-from typing import Any
+from collections.abc import Iterator, Sequence
+from typing import Any, Optional
+import itertools as itt
 # import math
 import statistics as stts
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
-from lothon.domain import Loteria, Concurso, Jogo
+from lothon.stats import topos as tp
+from lothon.stats.bitset import BitsetJogos
+from lothon.stats.fatores import FatoresJogos
+from lothon.domain import Loteria, Concurso
 from lothon.process import compute
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import lote_jogos as lj
+from lothon.process.compute import plano_chain as pc
 from lothon.process.analyze.abstract_analyze import AbstractAnalyze
 
 
@@ -48,7 +54,7 @@ class AnaliseFinalista(AbstractAnalyze):
     """
 
     # --- PROPRIEDADES -------------------------------------------------------
-    __slots__ = ('sorteios_literal', 'qtd_concursos')
+    __slots__ = ('sorteios_ordinais', 'qtd_concursos')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -56,7 +62,7 @@ class AnaliseFinalista(AbstractAnalyze):
         super().__init__("Analise Finalista das Estrategias")
 
         # estruturas para a coleta de dados a partir do processamento de analise:
-        self.sorteios_literal: dict[str: int] = None
+        self.sorteios_ordinais: Optional[dict[int, int]] = None
         self.qtd_concursos: int = 0
 
     def setup(self, parms: dict):
@@ -65,25 +71,22 @@ class AnaliseFinalista(AbstractAnalyze):
 
     # --- METODOS ------------------------------------------------------------
 
-    @classmethod
-    def get_ordinal_concurso(cls, bolas: tuple[int, ...], jogos: list[Jogo]) -> int:
-        # procura na lista de jogos para identificar o ordinal do jogo correspondente:
-        for idx, jogo in enumerate(jogos):
-            if bolas == jogo.dezenas:
-                return idx
+    # posicoes dos jogos dos concursos na ordem decrescente dos fatores, apenas para os
+    # jogos computados (nao zerados), fornecidos em ordem crescente de ordinal:
+    def get_posicoes_concursos(self, ordinais: Sequence[int], fatores: Sequence[float],
+                               ordinal_ultimo_concurso: int) -> dict[int, int]:
+        consultas: set[int] = set(self.sorteios_ordinais)
+        consultas.add(ordinal_ultimo_concurso)
+        return tp.calc_posicoes(consultas, ordinais, fatores)
 
-        # se percorreu toda a lista de jogos e nao encontrou, entao informa que ha algo errado:
-        return -1
-
-    def get_ordinais_concursos(self, jogos: list[Jogo]) -> list[int]:
+    def get_ordinais_concursos(self, posicoes: dict[int, int]) -> list[int]:
         ordinais_concursos: list[int] = cb.new_list_int(self.qtd_concursos)
         ordinais_concursos[0] = -1  # para nao cair no teste == 0
 
-        for idx, jogo in enumerate(jogos):
-            # procura no dicionario de literais as dezenas do jogo corrente:
-            id_concurso: int = self.sorteios_literal.get(jogo.to_string(), -1)
-            if id_concurso > 0:
-                ordinais_concursos[id_concurso] = idx
+        for ordinal, id_concurso in self.sorteios_ordinais.items():
+            # procura nas posicoes dos jogos computados o jogo do concurso:
+            if ordinal in posicoes and id_concurso > 0:
+                ordinais_concursos[id_concurso] = posicoes[ordinal]
 
         return ordinais_concursos
 
@@ -101,13 +104,15 @@ class AnaliseFinalista(AbstractAnalyze):
         concursos: list[Concurso] = loteria.concursos[:-1]  # nao processa o ultimo por enquanto
         self.qtd_concursos: int = len(concursos)
         ultimo_concurso: Concurso = loteria.concursos[-1]
-        range_jogos: range = range(1, loteria.qtd_bolas + 1)
 
-        # organiza dicionario com todos os concursos, para pesquisar jogos:
-        self.sorteios_literal: dict[str: int] = {}
+        # organiza dicionario com o ordinal de todos os concursos, para pesquisar jogos:
+        self.sorteios_ordinais: dict[int, int] = {}
         for concurso in concursos:
-            bolas_str: str = cb.to_string(concurso.bolas)
-            self.sorteios_literal[bolas_str] = concurso.id_concurso
+            ordinal: int = cb.rank(concurso.bolas, loteria.qtd_bolas, loteria.qtd_bolas_sorteio)
+            if ordinal > 0:
+                self.sorteios_ordinais[ordinal] = concurso.id_concurso
+        ordinal_ultimo_concurso: int = cb.rank(ultimo_concurso.bolas, loteria.qtd_bolas,
+                                               loteria.qtd_bolas_sorteio)
 
         # inicializa a cadeia de processos para computacao de jogos:
         compute_chain: list[AbstractCompute] = compute.get_process_chain()
@@ -135,6 +140,7 @@ class AnaliseFinalista(AbstractAnalyze):
         # o primeiro item corresponde a buscar ordinais de jogos combinados, sem EVALUATE:
         ncompute_chain: list[AbstractCompute | None] = [cp for cp in compute_chain]
         ncompute_chain.insert(0, None)
+        aceitos_computes: list[BitsetJogos] = []  # bitset dos jogos aceitos por cada compute
         output: str = f"\n\n COMPUTE                INCLUIDOS      ZERADOS    EXCLUIDOS" \
                       f"       MENOR        MAIOR        FAIXA        MEDIA      DESVIO" \
                       f"      #ULTIMO    FATOR\n"
@@ -143,32 +149,29 @@ class AnaliseFinalista(AbstractAnalyze):
             logger.debug(f"{nmproc}: Executando analise EVALUATE dos  "
                          f"{formatd(loteria.qtd_jogos)}  jogos da loteria...")
 
-            # efetua analise geral (evaluate) de todas as combinacoes de jogos da loteria:
-            jogos_computados: list[Jogo] = []
-            qtd_zerados: int = 0
-
-            # gera todas as combinacoes de jogos com ordinal igual a numeracao sequencial:
-            vl_ordinal: int = 0
-            for jogo in itt.combinations(range_jogos, loteria.qtd_bolas_sorteio):
-                vl_ordinal += 1  # primeiro jogo ira comecar do #1
+            # efetua analise geral (evaluate) de todas as combinacoes de jogos da loteria, com
+            # ordinal igual a numeracao sequencial, avaliadas em faixas paralelas que retornam
+            # apenas os ordinais e fatores dos jogos nao zerados:
+            ordinais, fatores = lj.evaluate_metricas([] if cproc is None else [cproc],
+                                                     loteria.qtd_bolas, loteria.qtd_bolas_sorteio)
 
-                # executa o processamento de avaliacao do jogo, para verificar se sera descartado:
-                vl_fator: float = 1.0 if cproc is None else cproc.evaluate(vl_ordinal, jogo)
-                # se a metrica atingir o ponto de corte, entao mantem o jogo para apostar:
-                if vl_fator > 0:
-                    jogos_computados.append(Jogo(vl_ordinal, vl_fator, jogo))
-                else:
-                    qtd_zerados += 1
+            # se a metrica atingir o ponto de corte, entao mantem o jogo para apostar:
+            qtd_zerados: int = cb.qtd_combinacoes(loteria.qtd_bolas, loteria.qtd_bolas_sorteio) \
+                - len(ordinais)
+            if cproc is not None:
+                aceitos_computes.append(BitsetJogos.from_ordinais(loteria.qtd_jogos, ordinais))
 
-            # ordena os jogos processados pelo fator, do maior (maiores chances) para o menor:
-            jogos_computados.sort(key=lambda n: n.fator, reverse=True)
+            # posicoes dos concursos na ordem decrescente dos fatores (maiores chances primeiro),
+            # obtidas por contagem, sem ordenar todos os jogos processados:
+            posicoes: dict[int, int] = self.get_posicoes_concursos(ordinais, fatores,
+                                                                   ordinal_ultimo_concurso)
 
             # para cada concurso, vai atribuir o respectivo ordinal do jogo processado:
-            ordinais_concursos: list[int] = self.get_ordinais_concursos(jogos_computados)
+            ordinais_concursos: list[int] = self.get_ordinais_concursos(posicoes)
 
             # verifica se algum sorteio nao foi localizado / considerado nos jogos:
             qtd_excluidos: int = ordinais_concursos.count(0)
-            qtd_incluidos: int = len(jogos_computados) - qtd_excluidos
+            qtd_incluidos: int = len(ordinais) - qtd_excluidos
 
             # elimina os zerados para nao afetar os calculos estatisticos de media e desvio:
             min_ordinal: float = 0
@@ -184,8 +187,8 @@ class AnaliseFinalista(AbstractAnalyze):
                 mean_ordinal = stts.fmean(ordinais_concursos)
                 stdev_ordinal = stts.pstdev(ordinais_concursos)
 
-            # procura na lista de jogos computados o ordinal correspondente do ultimo sorteio:
-            ultimo_ordinal: int = self.get_ordinal_concurso(ultimo_concurso.bolas, jogos_computados)
+            # procura nos jogos computados a posicao correspondente do ultimo sorteio:
+            ultimo_ordinal: int = posicoes.get(ordinal_ultimo_concurso, -1)
 
             # tambem processa o ultimo sorteio para saber seu fator (metrica):
             ultimo_fator: float = 0 if cproc is None \
@@ -207,57 +210,62 @@ class AnaliseFinalista(AbstractAnalyze):
 
         logger.debug(f"{nmlot}: Finalizou o EVALUATE dos jogos: {output}")
 
+        # os jogos aceitos pela cadeia completa sao os aceitos por todos os computes (AND):
+        if len(aceitos_computes) > 0:
+            aceitos_chain: BitsetJogos = aceitos_computes[0]
+            for aceitos in aceitos_computes[1:]:
+                aceitos_chain &= aceitos
+            logger.debug(f"{nmlot}: Jogos aceitos pela cadeia completa de computes = "
+                         f"{formatd(aceitos_chain.count())}")
+
         # efetua simulacao dos ultimos 100 concursos:
         concursos_passados: list[Concurso] = loteria.concursos[:-100]
         proximos_concursos: list[Concurso] = loteria.concursos[-100:]
-        output: str = f"\n\t CONCURSO     #ORDINAL-JOGO\n"
-        for concurso in proximos_concursos:
-            qtd_passados: int = len(concursos_passados)
-            # executa cada processo de analise em sequencia (chain) para coleta de dados:
-            logger.debug(f"Executando computacao dos  #{formatd(qtd_passados)}  concursos "
-                         f"passados...")
-            for cproc in compute_chain:
-                # executa a analise para cada loteria:
-                cproc.execute(concursos)
-
-            # gera todas as combinacoes de jogos para avaliacao:
-            jogos_computados: list[Jogo] = []
-            vl_ordinal: int = 0
-            for jogo in itt.combinations(range_jogos, loteria.qtd_bolas_sorteio):
-                vl_ordinal += 1  # primeiro jogo ira comecar do #1
 
-                # executa a avaliacao do jogo, para verificar se sera considerado ou descartado:
-                vl_fator: float = 1.0
-                for cproc in compute_chain:
-                    vl_fator *= cproc.evaluate(vl_ordinal, jogo)
-                    # ignora o resto das analises se a metrica zerou:
-                    if vl_fator == 0:
-                        break  # pula para o proximo jogo, acelerando o processamento
+        # executa cada processo de analise em sequencia (chain) apenas com os concursos passados,
+        # pois a cada concurso simulado os computes sao atualizados de forma incremental:
+        logger.debug(f"Executando computacao dos  #{formatd(len(concursos_passados))}  concursos "
+                     f"passados...")
+        for cproc in compute_chain:
+            cproc.execute(concursos_passados)
 
-                # se a metrica atingir o ponto de corte, entao mantem o jogo para apostar:
-                if vl_fator > 0:
-                    jogos_computados.append(Jogo(vl_ordinal, vl_fator, jogo))
+        # ordena a cadeia pelo custo e seletividade de cada compute, medidos em uma amostra, uma
+        # unica vez: os computes planejados sao os mesmos objetos, atualizados a cada concurso:
+        chain_planejada: list[AbstractCompute] = pc.planejar_chain(compute_chain,
+                                                                   loteria.qtd_bolas,
+                                                                   loteria.qtd_bolas_sorteio)
 
-            # ordena os jogos processados pelo fator, do maior (maiores chances) para o menor:
-            jogos_computados.sort(key=lambda n: n.fator, reverse=True)
+        output: str = f"\n\t CONCURSO     #ORDINAL-JOGO\n"
+        for concurso in proximos_concursos:
+            # executa a avaliacao em faixas paralelas, registrando o fator de cada jogo no vetor
+            # indexado pelo ordinal (zero para os jogos zerados pela cadeia):
+            fatores_jogos: FatoresJogos = lj.evaluate_fatores(chain_planejada, loteria.qtd_bolas,
+                                                              loteria.qtd_bolas_sorteio)
 
-            # procura na lista de jogos computados o ordinal correspondente do ultimo sorteio:
-            ultimo_ordinal: int = self.get_ordinal_concurso(concurso.bolas, jogos_computados)
+            # posicao do sorteio na ordem decrescente dos fatores, sem ordenar todos os jogos:
+            ordinal_concurso: int = cb.rank(concurso.bolas, loteria.qtd_bolas,
+                                            loteria.qtd_bolas_sorteio)
+            ultimo_ordinal: int = fatores_jogos.get_posicao(ordinal_concurso)
 
             # printa o resultado da simulacao:
             output += f"\t   {formatd(concurso.id_concurso,6)}  ....  " \
                       f"{formatd(ultimo_ordinal,10)}\n"
 
-            # identifica a frequencia das dezenas nos jogos com maior probabilidade/fator:
+            # apenas os jogos com maiores fatores (maiores chances) serao analisados, percorridos
+            # uma unica vez na ordem dos topos, acumulando a frequencia das dezenas:
+            topos_ordinais: Iterator[int] = iter(fatores_jogos.get_topos(1_000_000))
+            contador_dezenas: list[int] = cb.new_list_int(loteria.qtd_bolas)
+            qtd_contados: int = 0
             vl_dez = 1
             for dez in range(1, 7):
                 vl_dez *= 10
 
-                # contabiliza a frequencia das dezenas em parte dos jogos (vl_dez):
-                contador_dezenas: list[int] = cb.new_list_int(loteria.qtd_bolas)
-                for jogo in jogos_computados[0:vl_dez]:  # 10, 100, 1000, 10000, 100000, 1000000
-                    # registra a frequencia geral de todas as bolas dos concursos anteriores:
-                    cb.count_dezenas(jogo.dezenas, contador_dezenas)
+                # contabiliza apenas os jogos seguintes ate a parte (10, 100, ... 1000000):
+                for ordinal in itt.islice(topos_ordinais, vl_dez - qtd_contados):
+                    jogo: tuple[int, ...] = cb.unrank(ordinal, loteria.qtd_bolas,
+                                                      loteria.qtd_bolas_sorteio)
+                    cb.count_dezenas(jogo, contador_dezenas)
+                qtd_contados = vl_dez
 
                 # identifica as frequencias das dezenas em ordem reversa da frequencia nos sorteios:
                 frequencias_dezenas: dict = cb.to_dict(contador_dezenas, reverse_value=True)
@@ -270,13 +278,22 @@ class AnaliseFinalista(AbstractAnalyze):
                 for dezena in concurso.bolas:
                     ordens_sorteio += (topos_dezenas.index(dezena),)
 
-                logger.debug(f"{nmlot}: ORDENS DAS DEZENAS DO SORTEIO: ", ordens_sorteio)
+                logger.debug(f"{nmlot}: ORDENS DAS DEZENAS DO SORTEIO: {ordens_sorteio}")
 
             # na proxima iteracao considera tambem agora o concurso recem simulado:
             concursos_passados.append(concurso)
+            for cproc in compute_chain:
+                cproc.append_concurso(concurso)
 
         logger.debug(f"{nmlot}: Simulacao dos ultimos 100 concursos: {output}")
 
+        # grava uma unica vez os fatores da cadeia atualizada ate o ultimo concurso, para que as
+        # simulacoes com jogos computados os abram do arquivo, sem refazer o EVALUATE:
+        fatores_jogos: FatoresJogos = lj.evaluate_fatores(chain_planejada, loteria.qtd_bolas,
+                                                          loteria.qtd_bolas_sorteio)
+        lj.salvar_fatores_jogos(loteria.id_loteria, concursos_passados[-1].id_concurso,
+                                fatores_jogos)
+
         _stopWatch = stopwatch(_startWatch)
         logger.info(f"{nmlot}: Tempo para executar {self.id_process.upper()}: {_stopWatch}")
         return 0
@@ -20,7 +20,7 @@ import statistics as stts
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
-from lothon.domain import Loteria, Concurso, SerieSorteio
+from lothon.domain import Loteria, Concurso, SerieSorteio, MatrizSorteios
 from lothon.process.analyze.abstract_analyze import AbstractAnalyze
 from lothon.process.compute.compute_frequencia import ComputeFrequencia
 
@@ -110,18 +110,13 @@ class AnaliseFrequencia(AbstractAnalyze):
         output: str = f"\n\tCONCURSO  FREQUENCIAS:   MENOR   MAIOR   MODA   MEDIA   MEDIANA" \
                       f"    #TOPOS\n"
 
-        # contabiliza as frequencias das dezenas em todos os sorteios ja realizados:
-        concursos_anteriores: list[Concurso] = [concursos[0]]
-        for concurso in concursos[1:]:
-            # uma frequencia para cada bola sorteada no concurso corrente, ignorando zero-index:
-            frequencias_concurso: list[int] = cb.new_list_int(loteria.qtd_bolas_sorteio - 1)
-            for concurso_anterior in concursos_anteriores:
-                # registra a frequencia de cada dezena sorteada no concurso corrente:
-                id_dezena: int = -1
-                for dezena in concurso.bolas:
-                    id_dezena += 1  # na primeira iteracao, vai incrementar para zero
-                    if dezena in concurso_anterior.bolas:
-                        frequencias_concurso[id_dezena] += 1
+        # contabiliza as frequencias das dezenas em todos os sorteios ja realizados,
+        # utilizando a visao colunar para contar a incidencia nos concursos anteriores:
+        matriz: MatrizSorteios = loteria.get_matriz_sorteios()
+        for idx, concurso in enumerate(concursos[1:], start=1):
+            # uma frequencia para cada bola sorteada no concurso corrente:
+            frequencias_concurso: list[int] = [matriz.get_frequencia(dezena, 0, idx)
+                                               for dezena in concurso.bolas]
 
             # formata os valores para o concurso atual:
             frequencias_concurso = sorted(frequencias_concurso)  # agiliza o calculo da mediana
@@ -132,9 +127,6 @@ class AnaliseFrequencia(AbstractAnalyze):
                       f"{formatd(round(stts.fmean(frequencias_concurso)),5)}     " \
                       f"{formatd(round(stts.median(frequencias_concurso)),5)}        " \
                       f"{formatd(cp.topos_concursos[concurso.id_concurso], 2)}\n"
-
-            # adiciona o concurso atual para a proxima iteracao (ai ele sera um concurso anterior):
-            concursos_anteriores.append(concurso)
         # apos percorrer todos os concursos, printa as frequencias medias:
         logger.debug(f"{nmlot}: Frequencias Medias das Dezenas Sorteadas: {output}")
 
@@ -197,15 +189,11 @@ class AnaliseFrequencia(AbstractAnalyze):
         output += f"     VARIANCIA     DESVIO-PADRAO\n"
 
         # acumula os concursos passados para cada concurso atual:
-        qtd_concursos_anteriores: int = qtd_concursos - 100
-        concursos_anteriores: list[Concurso] = concursos[:qtd_concursos_anteriores]
-        for concurso_atual in concursos[qtd_concursos_anteriores:]:
-            # zera os contadores de cada concurso:
-            dezenas_sorteios: list[int] = cb.new_list_int(loteria.qtd_bolas)
-
+        qtd_concursos_anteriores: int = max(qtd_concursos - 100, 0)
+        for pos, concurso_atual in enumerate(concursos[qtd_concursos_anteriores:],
+                                             start=qtd_concursos_anteriores):
             # quantas vezes cada uma das bolas sorteadas do concurso atual repetiu nos anteriores:
-            for concurso_anterior in concursos_anteriores:
-                cb.count_ocorrencias(concurso_anterior.bolas, dezenas_sorteios)
+            dezenas_sorteios: list[int] = matriz.get_ocorrencias(0, pos)
 
             # transforma a lista em dicionario para sortear pela frequencia nos sorteios:
             dezenas_frequencias: dict[int: int] = {}
@@ -235,9 +223,6 @@ class AnaliseFrequencia(AbstractAnalyze):
             varia_rank: float = stts.pvariance(ranking_bolas)
             stdev_rank: float = stts.pstdev(ranking_bolas)
             output += f"     {formatf(varia_rank,'9.3')}         {formatf(stdev_rank,'9.3')}\n"
-
-            # inclui o concurso atual como anterior para a proxima iteracao:
-            concursos_anteriores.append(concurso_atual)
         logger.debug(f"{nmlot}: Ranking de Frequencias da EVOLUTIVA: {output}")
 
         # printa os topos de cada sorteio dos concursos:
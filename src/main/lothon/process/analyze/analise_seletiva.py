@@ -14,19 +14,20 @@ __all__ = [
 
 # Built-in/Generic modules
 # import sys
-from typing import Any
+from typing import Any, Optional
 # import math
 import statistics as stts
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
-from lothon.domain import Loteria, Concurso, Jogo
+from lothon.stats import topos as tp
+from lothon.domain import Loteria, Concurso
 from lothon.process.analyze.abstract_analyze import AbstractAnalyze
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import lote_jogos as lj
 from lothon.process.compute.compute_matricial import ComputeMatricial
 from lothon.process.compute.compute_mediana import ComputeMediana
 from lothon.process.compute.compute_paridade import ComputeParidade
@@ -75,7 +76,7 @@ class AnaliseSeletiva(AbstractAnalyze):
     """
 
     # --- PROPRIEDADES -------------------------------------------------------
-    __slots__ = ('sorteios_literal', 'qtd_concursos')
+    __slots__ = ('sorteios_ordinais', 'qtd_concursos')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -83,7 +84,7 @@ class AnaliseSeletiva(AbstractAnalyze):
         super().__init__("Analise Seletiva das Estrategias")
 
         # estruturas para a coleta de dados a partir do processamento de analise:
-        self.sorteios_literal: dict[str: int] = None
+        self.sorteios_ordinais: Optional[dict[int, int]] = None
         self.qtd_concursos: int = 0
 
     def setup(self, parms: dict):
@@ -92,25 +93,22 @@ class AnaliseSeletiva(AbstractAnalyze):
 
     # --- METODOS ------------------------------------------------------------
 
-    @classmethod
-    def get_ordinal_concurso(cls, bolas: tuple[int, ...], jogos: list[Jogo]) -> int:
-        # procura na lista de jogos para identificar o ordinal do jogo correspondente:
-        for idx, jogo in enumerate(jogos):
-            if bolas == jogo.dezenas:
-                return idx
+    # posicoes dos jogos dos concursos na ordem decrescente dos fatores, apenas para os
+    # jogos computados (nao zerados), fornecidos em ordem crescente de ordinal:
+    def get_posicoes_concursos(self, ordinais: list[int], fatores: list[float],
+                               ordinal_ultimo_concurso: int) -> dict[int, int]:
+        consultas: set[int] = set(self.sorteios_ordinais)
+        consultas.add(ordinal_ultimo_concurso)
+        return tp.calc_posicoes(consultas, ordinais, fatores)
 
-        # se percorreu toda a lista de jogos e nao encontrou, entao informa que ha algo errado:
-        return -1
-
-    def get_ordinais_concursos(self, jogos: list[Jogo]) -> list[int]:
+    def get_ordinais_concursos(self, posicoes: dict[int, int]) -> list[int]:
         ordinais_concursos: list[int] = cb.new_list_int(self.qtd_concursos)
         ordinais_concursos[0] = -1  # para nao cair no teste == 0
 
-        for idx, jogo in enumerate(jogos):
-            # procura no dicionario de literais as dezenas do jogo corrente:
-            id_concurso: int = self.sorteios_literal.get(jogo.to_string(), -1)
-            if id_concurso > 0:
-                ordinais_concursos[id_concurso] = idx
+        for ordinal, id_concurso in self.sorteios_ordinais.items():
+            # procura nas posicoes dos jogos computados o jogo do concurso:
+            if ordinal in posicoes and id_concurso > 0:
+                ordinais_concursos[id_concurso] = posicoes[ordinal]
 
         return ordinais_concursos
 
@@ -128,13 +126,15 @@ class AnaliseSeletiva(AbstractAnalyze):
         concursos: list[Concurso] = loteria.concursos[:-1]  # nao processa o ultimo por enquanto
         self.qtd_concursos: int = len(concursos)
         ultimo_concurso: Concurso = loteria.concursos[-1]
-        range_jogos: range = range(1, loteria.qtd_bolas + 1)
 
-        # organiza dicionario com todos os concursos, para pesquisar jogos:
-        self.sorteios_literal: dict[str: int] = {}
+        # organiza dicionario com o ordinal de todos os concursos, para pesquisar jogos:
+        self.sorteios_ordinais: dict[int, int] = {}
         for concurso in concursos:
-            bolas_str: str = cb.to_string(concurso.bolas)
-            self.sorteios_literal[bolas_str] = concurso.id_concurso
+            ordinal: int = cb.rank(concurso.bolas, loteria.qtd_bolas, loteria.qtd_bolas_sorteio)
+            if ordinal > 0:
+                self.sorteios_ordinais[ordinal] = concurso.id_concurso
+        ordinal_ultimo_concurso: int = cb.rank(ultimo_concurso.bolas, loteria.qtd_bolas,
+                                               loteria.qtd_bolas_sorteio)
 
         # inicializa a cadeia de processos para computacao de jogos:
         compute_chain: list[AbstractCompute] = get_process_chain()
@@ -216,30 +216,34 @@ class AnaliseSeletiva(AbstractAnalyze):
                          f"{formatd(loteria.qtd_jogos)}  jogos da loteria...")
 
             # efetua analise geral (evaluate) de todas as combinacoes de jogos da loteria:
-            jogos_computados: list[Jogo] = []
+            ordinais_computados: list[int] = []
+            fatores_computados: list[float] = []
             qtd_zerados: int = 0
 
             # gera todas as combinacoes de jogos com ordinal igual a numeracao sequencial:
-            vl_ordinal: int = 0
-            for jogo in itt.combinations(range_jogos, loteria.qtd_bolas_sorteio):
-                vl_ordinal += 1  # primeiro jogo ira comecar do #1
-
-                # executa o processamento de avaliacao do jogo, para verificar se sera descartado:
-                vl_fator: float = 1.0 if cproc is None else cproc.eval(vl_ordinal, jogo)
-                # se a metrica atingir o ponto de corte, entao mantem o jogo para apostar:
-                if vl_fator > 0:
-                    jogos_computados.append(Jogo(vl_ordinal, vl_fator, jogo))
-                else:
-                    qtd_zerados += 1
-
-            # ordena os jogos processados pelo fator, do maior (maiores chances) para o menor:
-            jogos_computados.sort(key=lambda n: n.fator, reverse=True)
+            for ordinais, jogos in lj.gerar_lotes(loteria.qtd_bolas, loteria.qtd_bolas_sorteio):
+                # executa a avaliacao do lote de jogos, para verificar quais serao descartados:
+                fatores: list[float] = [1.0] * len(jogos) if cproc is None \
+                    else cproc.eval_batch(ordinais, jogos)
+                for vl_ordinal, vl_fator in zip(ordinais, fatores):
+                    # se a metrica atingir o ponto de corte, entao mantem o jogo para apostar:
+                    if vl_fator > 0:
+                        ordinais_computados.append(vl_ordinal)
+                        fatores_computados.append(vl_fator)
+                    else:
+                        qtd_zerados += 1
+
+            # posicoes dos concursos na ordem decrescente dos fatores (maiores chances primeiro),
+            # obtidas por contagem, sem ordenar todos os jogos processados:
+            posicoes: dict[int, int] = self.get_posicoes_concursos(ordinais_computados,
+                                                                   fatores_computados,
+                                                                   ordinal_ultimo_concurso)
 
             # para cada concurso, vai atribuir o respectivo ordinal do jogo processado:
-            ordinais_concursos: list[int] = self.get_ordinais_concursos(jogos_computados)
+            ordinais_concursos: list[int] = self.get_ordinais_concursos(posicoes)
 
             # verifica se algum sorteio nao foi localizado / considerado nos jogos:
-            qtd_incluidos: int = len(jogos_computados)
+            qtd_incluidos: int = len(ordinais_computados)
             qtd_excluidos: int = ordinais_concursos.count(0)
 
             # elimina os zerados para nao afetar os calculos estatisticos de media e desvio:
@@ -256,8 +260,8 @@ class AnaliseSeletiva(AbstractAnalyze):
                 mean_ordinal = stts.fmean(ordinais_concursos)
                 stdev_ordinal = stts.pstdev(ordinais_concursos)
 
-            # procura na lista de jogos computados o ordinal correspondente do ultimo sorteio:
-            ultimo_ordinal: int = self.get_ordinal_concurso(ultimo_concurso.bolas, jogos_computados)
+            # procura nos jogos computados a posicao correspondente do ultimo sorteio:
+            ultimo_ordinal: int = posicoes.get(ordinal_ultimo_concurso, -1)
 
             # tambem processa o ultimo sorteio para saber seu fator (metrica):
             ultimo_fator: float = 0 if cproc is None \
@@ -22,7 +22,7 @@ import random
 from lothon.infra import console, parser_resultados
 from lothon.stats import combinatoria as cb
 from lothon import domain
-from lothon.domain import Loteria, Concurso
+from lothon.domain import Loteria, Concurso, MatrizSorteios
 from lothon.process.abstract_process import AbstractProcess
 
 
@@ -87,9 +87,8 @@ class AbstractBetting(AbstractProcess, ABC):
                                                                      qtd_topos)
 
         # extrai os topos do ranking com as dezenas com maior frequencia em todos os concursos:
-        topos_frequencias_sorteios: list[int] = cb.calc_topos_frequencia(self.concursos,
-                                                                         self.loteria.qtd_bolas,
-                                                                         qtd_topos)
+        matriz_sorteios: MatrizSorteios = self.loteria.get_matriz_sorteios()
+        topos_frequencias_sorteios: list[int] = cb.calc_topos_matriz(matriz_sorteios, qtd_topos)
 
         # contabiliza as frequencias das dezenas em todos os jogos considerados:
         frequencias_bolas: list[int] = cb.new_list_int(self.loteria.qtd_bolas)
@@ -54,9 +54,8 @@ class BetMesDaSorte(AbstractBetting):
 
     def compute_meses_sorteados(self) -> list[int]:
         # extrai o ranking dos meses a partir dos topos de frequencias e ausencias nos concursos:
-        meses_frequentes: list[int] = cb.calc_topos_frequencia(self.concursos,
-                                                               self.loteria.qtd_bolas,
-                                                               self.loteria.qtd_bolas)
+        meses_frequentes: list[int] = cb.calc_topos_matriz(self.loteria.get_matriz_sorteios(),
+                                                           self.loteria.qtd_bolas)
         meses_ausentes: list[int] = cb.calc_topos_ausencia(self.concursos,
                                                            self.loteria.qtd_bolas,
                                                            self.loteria.qtd_bolas)
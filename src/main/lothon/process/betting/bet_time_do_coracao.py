@@ -54,9 +54,8 @@ class BetTimeDoCoracao(AbstractBetting):
 
     def compute_clubes_sorteados(self) -> list[int]:
         # extrai o ranking dos clubes a partir dos topos de frequencias e ausencias nos concursos:
-        clubes_frequentes: list[int] = cb.calc_topos_frequencia(self.concursos,
-                                                                self.loteria.qtd_bolas,
-                                                                self.loteria.qtd_bolas)
+        clubes_frequentes: list[int] = cb.calc_topos_matriz(self.loteria.get_matriz_sorteios(),
+                                                            self.loteria.qtd_bolas)
         clubes_ausentes: list[int] = cb.calc_topos_ausencia(self.concursos,
                                                             self.loteria.qtd_bolas,
                                                             self.loteria.qtd_bolas)
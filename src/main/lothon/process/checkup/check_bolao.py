@@ -24,6 +24,7 @@ from lothon.util.eve import *
 from lothon.conf import app_config
 from lothon.infra import parser_resultados
 from lothon.domain import Loteria, Concurso
+from lothon.stats.mascara import count_acertos_dezenas
 from lothon.process.checkup.abstract_checkup import AbstractCheckup
 
 # ----------------------------------------------------------------------------
@@ -119,10 +120,7 @@ class CheckBolao(AbstractCheckup):
     def check_premiacao(cls, jogo: tuple[int, ...], concurso: Concurso,
                         acertos_premios: list[int]) -> tuple[int, float]:
         # verifica quantas dezenas acertou no jogo, conferindo com as bolas sorteadas do concurso:
-        qtd_acerto: int = 0
-        for dezena in jogo:
-            if any(bola for bola in concurso.bolas if bola == dezena):
-                qtd_acerto += 1
+        qtd_acerto: int = count_acertos_dezenas(jogo, concurso.mascara)
 
         # verifica se a quantidade de acertos eh premiada:
         if qtd_acerto not in acertos_premios:
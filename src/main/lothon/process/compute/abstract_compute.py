@@ -14,13 +14,24 @@ __all__ = [
 
 # Built-in/Generic modules
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from typing import Optional
 
 # Libs/Frameworks modules
 # Own/Project modules
-from lothon.domain import Concurso
+from lothon.domain import Concurso, SerieSorteio
 from lothon.process.abstract_process import AbstractProcess
 
 
+# ----------------------------------------------------------------------------
+# VARIAVEIS GLOBAIS
+# ----------------------------------------------------------------------------
+
+# numero maximo de concursos retirados ou adicionados de forma incremental (acima disso, a
+# execucao completa eh mais barata, principalmente nos computes que recontam os concursos):
+QTD_MAX_INCREMENTAL: int = 10
+
+
 # ----------------------------------------------------------------------------
 # CLASSE ABSTRATA
 # ----------------------------------------------------------------------------
@@ -32,7 +43,9 @@ class AbstractCompute(AbstractProcess, ABC):
     """
 
     # --- PROPRIEDADES -------------------------------------------------------
-    __slots__ = ('min_threshold', 'qtd_bolas', 'qtd_bolas_sorteio', 'qtd_jogos', 'qtd_zerados')
+    __slots__ = ('min_threshold', 'qtd_bolas', 'qtd_bolas_sorteio', 'qtd_jogos', 'qtd_zerados',
+                 'fatores_eval', 'zerados_eval', 'fatores_evaluate', 'zerados_evaluate',
+                 'concursos_computados')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -46,6 +59,15 @@ class AbstractCompute(AbstractProcess, ABC):
         self.qtd_jogos: int = 0
         self.qtd_zerados: int = 0
 
+        # fatores ja calculados para cada valor da feature do jogo, e se o valor zera o jogo:
+        self.fatores_eval: Optional[list[float]] = None
+        self.zerados_eval: Optional[list[int]] = None
+        self.fatores_evaluate: Optional[list[float]] = None
+        self.zerados_evaluate: Optional[list[int]] = None
+
+        # concursos ja computados no execute(), para a atualizacao incremental:
+        self.concursos_computados: Optional[list[Concurso]] = None
+
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
         super().setup(parms)
@@ -66,6 +88,17 @@ class AbstractCompute(AbstractProcess, ABC):
     def set_concursos_passados(self, concursos: list[Concurso]):
         pass
 
+    # adiciona o concurso seguinte aos ja computados, atualizando os dados do execute() apenas
+    # com o novo concurso, com o mesmo resultado de executar novamente com todos os concursos:
+    @abstractmethod
+    def append_concurso(self, concurso: Concurso) -> int:
+        pass
+
+    # retira o ultimo concurso computado (rollback do append_concurso), retornando-o:
+    @abstractmethod
+    def pop_concurso(self) -> Optional[Concurso]:
+        pass
+
     @abstractmethod
     def rate(self, ordinal: int, jogo: tuple) -> int:
         pass
@@ -78,4 +111,98 @@ class AbstractCompute(AbstractProcess, ABC):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         pass
 
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    # valida se ha concursos computados para adicionar o concurso seguinte:
+    def check_append_concurso(self, concurso: Concurso) -> bool:
+        return self.concursos_computados is not None and len(self.concursos_computados) > 0 \
+            and concurso is not None
+
+    # valida se ha concursos computados para retirar o ultimo (mantendo ao menos um concurso):
+    def check_pop_concurso(self) -> bool:
+        return self.concursos_computados is not None and len(self.concursos_computados) > 1
+
+    # concursos computados com o mesmo id do concurso indicado, do ultimo para o primeiro (como os
+    # dois sorteios de cada concurso da Dupla Sena), pois os registros por id sao compartilhados:
+    def get_sorteios_concurso(self, id_concurso: int) -> list[Concurso]:
+        sorteios: list[Concurso] = []
+        for concurso in reversed(self.concursos_computados):
+            if concurso.id_concurso != id_concurso:
+                break
+            sorteios.append(concurso)
+
+        return sorteios
+
+    # desfaz o add_sorteio() do concurso retirado nas series indicadas por get_indices(), exceto
+    # nas series tambem registradas por outro sorteio de mesmo id (que ainda esta computado):
+    def estornar_series(self, series: list[SerieSorteio], concurso: Concurso,
+                        get_indices: Callable[[Concurso], Iterable[int]], inclusive: bool = False):
+        registradas: set[int] = set()
+        for sorteio in self.get_sorteios_concurso(concurso.id_concurso):
+            registradas.update(get_indices(sorteio))
+
+        for indice in set(get_indices(concurso)) - registradas:
+            series[indice].pop_sorteio(concurso.id_concurso, inclusive)
+
+    # atualiza os concursos computados para os concursos fornecidos: se apenas estendem ou
+    # retiram poucos concursos do final dos ja computados, atualiza de forma incremental,
+    # senao executa a computacao completa:
+    def atualizar_concursos(self, concursos: list[Concurso]) -> int:
+        computados: Optional[list[Concurso]] = self.concursos_computados
+        if computados is not None and len(computados) > 0 and len(concursos) > 0 and \
+                abs(len(concursos) - len(computados)) <= QTD_MAX_INCREMENTAL:
+            qtd_comuns: int = min(len(computados), len(concursos))
+            if concursos[0:qtd_comuns] == computados[0:qtd_comuns]:
+                while len(self.concursos_computados) > len(concursos):
+                    self.pop_concurso()
+                for concurso in concursos[len(self.concursos_computados):]:
+                    self.append_concurso(concurso)
+                return 0
+
+        return self.execute(concursos)
+
+    # --- TABELAS DE FATORES -------------------------------------------------
+
+    # nos computes em que o fator depende apenas de uma feature inteira do jogo (e dos dados
+    # obtidos no execute), tabelar_fatores() registra apos o execute() o fator de cada valor,
+    # calculado pelas funcoes fornecidas. Assim, eval() e evaluate() apenas obtem a feature do
+    # jogo e consultam a tabela com fator_eval() e fator_evaluate().
+
+    def tabelar_fatores(self, qtd_valores: int, eval_valor: Callable[[int], float],
+                        evaluate_valor: Callable[[int], float]):
+        # cada valor que zera o jogo deve continuar sendo contabilizado em qtd_zerados:
+        qtd_zerados: int = self.qtd_zerados
+        self.fatores_eval, self.zerados_eval = [], []
+        self.fatores_evaluate, self.zerados_evaluate = [], []
+        for valor in range(0, qtd_valores):
+            self.qtd_zerados = 0
+            self.fatores_eval.append(eval_valor(valor))
+            self.zerados_eval.append(self.qtd_zerados)
+
+            self.qtd_zerados = 0
+            self.fatores_evaluate.append(evaluate_valor(valor))
+            self.zerados_evaluate.append(self.qtd_zerados)
+
+        self.qtd_zerados = qtd_zerados
+
+    def fator_eval(self, valor: int) -> float:
+        self.qtd_zerados += self.zerados_eval[valor]
+        return self.fatores_eval[valor]
+
+    def fator_evaluate(self, valor: int) -> float:
+        self.qtd_zerados += self.zerados_evaluate[valor]
+        return self.fatores_evaluate[valor]
+
+    # --- AVALIACAO EM LOTE --------------------------------------------------
+
+    # as versoes em lote recebem os jogos em ordem crescente de ordinal e retornam os fatores na
+    # mesma ordem. Por padrao aplicam eval() e evaluate() a cada jogo, que continuam sendo a
+    # referencia; as subclasses podem sobrescreve-las quando o lote puder ser calculado de uma vez.
+
+    def eval_batch(self, ordinais: list[int], jogos: list[tuple]) -> list[float]:
+        return [self.eval(ordinal, jogo) for ordinal, jogo in zip(ordinais, jogos)]
+
+    def evaluate_batch(self, ordinais: list[int], jogos: list[tuple]) -> list[float]:
+        return [self.evaluate(ordinal, jogo) for ordinal, jogo in zip(ordinais, jogos)]
+
 # ----------------------------------------------------------------------------
@@ -20,6 +20,7 @@ import logging
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats.ranking import RankingAusencia
 from lothon.domain import Concurso
 from lothon.process.compute.abstract_compute import AbstractCompute
 
@@ -47,7 +48,8 @@ class ComputeAusencia(AbstractCompute):
     # --- PROPRIEDADES -------------------------------------------------------
     __slots__ = ('topos_concursos', 'topos_dezenas', 'topos_ausentes', 'topos_percentos',
                  'ultimos_topos_repetidos', 'ultimos_topos_percentos',
-                 'qtd_topos_ultimo_concurso', 'qtd_topos_penultimo_concurso')
+                 'qtd_topos_ultimo_concurso', 'qtd_topos_penultimo_concurso',
+                 'topos_sorteios', 'ranking_ausencias')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -63,6 +65,8 @@ class ComputeAusencia(AbstractCompute):
         self.ultimos_topos_percentos: Optional[list[float]] = None
         self.qtd_topos_ultimo_concurso: int = 0
         self.qtd_topos_penultimo_concurso: int = 0
+        self.topos_sorteios: Optional[list[int]] = None
+        self.ranking_ausencias: Optional[RankingAusencia] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
@@ -88,35 +92,72 @@ class ComputeAusencia(AbstractCompute):
         # qtd_items: int = loteria.qtd_bolas
 
         # contabiliza os atrasos evolutivos das dezenas para extrair os topos mais ausentes:
+        self.concursos_computados = list(concursos)
         self.topos_concursos = cb.new_list_int(qtd_concursos)  # registro o topo de cada concurso
         self.topos_ausentes = cb.new_list_int(QTD_TOPOS_RANKING)
         self.ultimos_topos_repetidos = cb.new_list_int(QTD_TOPOS_RANKING)
         self.qtd_topos_ultimo_concurso = -1
         self.qtd_topos_penultimo_concurso = -1
+        self.topos_sorteios = []  # topos de cada sorteio, na ordem dos concursos (exceto o 1o)
 
-        concursos_anteriores: list[Concurso] = concursos[:1]
+        # o ranking das ausencias eh atualizado a cada concurso, sem percorrer os anteriores:
+        self.ranking_ausencias = RankingAusencia(self.qtd_bolas)
+        self.ranking_ausencias.add_sorteio(concursos[0].bolas)
         for concurso in concursos[1:]:
-            # extrai o topo do ranking com as dezenas com maior ausencia:
-            topos_concurso: list[int] = cb.calc_topos_ausencia(concursos_anteriores,
-                                                               self.qtd_bolas, QTD_TOPOS_RANKING)
+            self.contabilizar_concurso(concurso)
 
-            # identifica o numero de dezenas do concurso que estao entre o topo de ausencia:
-            qtd_topos: int = cb.count_recorrencias(concurso.bolas, topos_concurso)
-            self.topos_concursos[concurso.id_concurso] = qtd_topos
-            self.topos_ausentes[qtd_topos] += 1
+        # contabiliza os percentuais e tabela os fatores a partir dos topos dos concursos:
+        self.finalizar_concursos()
 
-            # verifica se repetiu o numero de topos do ultimo concurso:
-            if qtd_topos == self.qtd_topos_ultimo_concurso:
-                self.ultimos_topos_repetidos[qtd_topos] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.qtd_topos_penultimo_concurso = self.qtd_topos_ultimo_concurso
-            self.qtd_topos_ultimo_concurso = qtd_topos
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
 
-            # adiciona o concurso atual para a proxima iteracao (ai ele sera um concurso anterior):
-            concursos_anteriores.append(concurso)
+    def contabilizar_concurso(self, concurso: Concurso):
+        # extrai o topo do ranking com as dezenas com maior ausencia:
+        topos_concurso: list[int] = self.ranking_ausencias.get_topos(QTD_TOPOS_RANKING)
+
+        # identifica o numero de dezenas do concurso que estao entre o topo de ausencia:
+        qtd_topos: int = cb.count_recorrencias(concurso.bolas, topos_concurso)
+        self.topos_concursos[concurso.id_concurso] = qtd_topos
+        self.topos_sorteios.append(qtd_topos)
+        self.topos_ausentes[qtd_topos] += 1
+
+        # verifica se repetiu o numero de topos do ultimo concurso:
+        if qtd_topos == self.qtd_topos_ultimo_concurso:
+            self.ultimos_topos_repetidos[qtd_topos] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.qtd_topos_penultimo_concurso = self.qtd_topos_ultimo_concurso
+        self.qtd_topos_ultimo_concurso = qtd_topos
+
+        # adiciona o concurso atual para a proxima iteracao (ai ele sera um concurso anterior):
+        self.ranking_ausencias.add_sorteio(concurso.bolas)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        self.ranking_ausencias.pop_sorteio()
+        qtd_topos: int = self.topos_sorteios.pop()
+        self.topos_ausentes[qtd_topos] -= 1
+
+        # o topo registrado para o id do concurso volta a ser o do sorteio anterior de mesmo id:
+        sorteios: list[Concurso] = self.get_sorteios_concurso(concurso.id_concurso)
+        self.topos_concursos[concurso.id_concurso] = self.topos_sorteios[-1] \
+            if len(sorteios) > 0 and len(self.topos_sorteios) > 0 else 0
+        del self.topos_concursos[-1]
+
+        # restaura os flags a partir dos topos dos sorteios anteriores:
+        self.qtd_topos_ultimo_concurso = self.topos_sorteios[-1] \
+            if len(self.topos_sorteios) > 0 else -1
+        self.qtd_topos_penultimo_concurso = self.topos_sorteios[-2] \
+            if len(self.topos_sorteios) > 1 else -1
+        if qtd_topos == self.qtd_topos_ultimo_concurso:
+            self.ultimos_topos_repetidos[qtd_topos] -= 1
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
 
         # extrai os topos do ranking com as dezenas com maior ausencia em todos os concursos:
-        self.topos_dezenas = cb.calc_topos_ausencia(concursos, self.qtd_bolas, QTD_TOPOS_RANKING)
+        self.topos_dezenas = self.ranking_ausencias.get_topos(QTD_TOPOS_RANKING)
 
         # contabiliza o percentual dos topos dos concursos:
         self.topos_percentos = cb.new_list_float(QTD_TOPOS_RANKING)
@@ -130,10 +171,33 @@ class ComputeAusencia(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimos_topos_percentos[key] = percent
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.topos_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        self.concursos_computados.append(concurso)
+        self.topos_concursos.append(0)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -147,6 +211,9 @@ class ComputeAusencia(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de topos no jogo:
         qtd_topos: int = self.count_topos_ausencia(jogo)
+        return self.fator_eval(qtd_topos)
+
+    def eval_valor(self, qtd_topos: int) -> float:
         percent: float = self.topos_percentos[qtd_topos]
 
         # ignora valores muito baixos de probabilidade:
@@ -174,6 +241,9 @@ class ComputeAusencia(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de topos no jogo:
         qtd_topos: int = self.count_topos_ausencia(jogo)
+        return self.fator_evaluate(qtd_topos)
+
+    def evaluate_valor(self, qtd_topos: int) -> float:
         percent: float = self.topos_percentos[qtd_topos]
 
         # ignora valores muito baixos de probabilidade:
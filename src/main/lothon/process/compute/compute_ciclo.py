@@ -51,6 +51,7 @@ class ComputeCiclo(AbstractCompute):
     __slots__ = ('frequencias_ciclos', 'ciclos_concursos', 'ciclos_percentos',
                  'ultimos_ciclos_repetidos', 'ultimos_ciclos_percentos',
                  'vl_ciclo_ultimo_concurso', 'vl_ciclo_penultimo_concurso',
+                 'ciclos_fechados', 'ciclos_sorteios', 'dezenas_ciclo', 'qtd_concursos_ciclo',
                  'concursos_passados', 'limit_bolas_ciclo')
 
     # --- INICIALIZACAO ------------------------------------------------------
@@ -66,6 +67,10 @@ class ComputeCiclo(AbstractCompute):
         self.ultimos_ciclos_percentos: Optional[list[float]] = None
         self.vl_ciclo_ultimo_concurso: int = 0
         self.vl_ciclo_penultimo_concurso: int = 0
+        self.ciclos_fechados: Optional[list[int]] = None
+        self.ciclos_sorteios: Optional[list[int]] = None
+        self.dezenas_ciclo: Optional[list[int]] = None
+        self.qtd_concursos_ciclo: int = 0
 
         # estruturas para avaliacao de jogo combinado da loteria:
         self.concursos_passados: Optional[list[Concurso]] = None
@@ -111,55 +116,102 @@ class ComputeCiclo(AbstractCompute):
         else:
             _startWatch = startwatch()
 
-        # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         # nao precisa de sortear 100% das bolas para fechar o ciclo:
         self.limit_bolas_ciclo = self.qtd_bolas - (self.qtd_bolas * LIMIT_BOLAS // 100)
 
         # inicializa as estruturas para registrar os ciclos fechados:
+        self.concursos_computados = list(concursos)
         self.frequencias_ciclos = SerieSorteio(0)
         self.ciclos_concursos = cb.new_list_int(MAX_CICLOS)
         self.ultimos_ciclos_repetidos = cb.new_list_int(MAX_CICLOS)
         self.vl_ciclo_ultimo_concurso = -1
         self.vl_ciclo_penultimo_concurso = -1
+        self.ciclos_fechados = []  # tamanho de cada ciclo fechado, na ordem dos concursos
+        self.ciclos_sorteios = []  # tamanho do ciclo fechado em cada concurso (ou zero)
 
         # contabiliza os ciclos fechados em todos os sorteios ja realizados:
-        dezenas: list[int] = cb.new_list_int(self.qtd_bolas)
-        dezenas[0] = -1
-        qtd_concursos_ciclo: int = 0
+        self.iniciar_ciclo()
         for concurso in concursos:
-            qtd_concursos_ciclo += 1
+            self.contabilizar_concurso(concurso)
 
-            # identifica as bolas sorteadas para fechar o ciclo:
-            cb.count_dezenas(concurso.bolas, dezenas)
+        # contabiliza os percentuais e salva os ultimos concursos para o EVALUATE posterior:
+        self.finalizar_concursos()
 
-            # se ainda tem algum zero, entao nao fechou o ciclo:
-            qtd_falta_ciclo: int = dezenas.count(0)  # quantas dezenas faltam para fechar o ciclo?
-            if qtd_falta_ciclo > self.limit_bolas_ciclo:
-                continue
-
-            # fechando o ciclo, contabiliza o ciclo fechado (onde fecha o ciclo eh inclusivo):
-            self.frequencias_ciclos.add_sorteio(concurso.id_concurso, True)
-
-            # registra o numero de concursos necessario para fechar mais um ciclo:
-            self.ciclos_concursos[qtd_concursos_ciclo] += 1
-            # verifica se repetiu o ciclo do ultimo concurso:
-            if qtd_concursos_ciclo == self.vl_ciclo_ultimo_concurso:
-                self.ultimos_ciclos_repetidos[qtd_concursos_ciclo] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.vl_ciclo_penultimo_concurso = self.vl_ciclo_ultimo_concurso
-            self.vl_ciclo_ultimo_concurso = qtd_concursos_ciclo
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
 
-            # zera contadores para proximo ciclo:
-            dezenas = cb.new_list_int(self.qtd_bolas)
-            dezenas[0] = -1  # p/ nao conflitar com o teste de fechamento do ciclo: 0 in dezena
-            qtd_concursos_ciclo = 0
+    # zera contadores para o proximo ciclo:
+    def iniciar_ciclo(self):
+        self.dezenas_ciclo = cb.new_list_int(self.qtd_bolas)
+        self.dezenas_ciclo[0] = -1  # p/ nao conflitar com o teste de fechamento do ciclo
+        self.qtd_concursos_ciclo = 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        self.qtd_concursos_ciclo += 1
+
+        # identifica as bolas sorteadas para fechar o ciclo:
+        cb.count_dezenas(concurso.bolas, self.dezenas_ciclo)
+
+        # se ainda tem algum zero, entao nao fechou o ciclo:
+        qtd_falta_ciclo: int = self.dezenas_ciclo.count(0)  # quantas dezenas faltam no ciclo?
+        if qtd_falta_ciclo > self.limit_bolas_ciclo:
+            self.ciclos_sorteios.append(0)
+            return
+
+        # fechando o ciclo, contabiliza o ciclo fechado (onde fecha o ciclo eh inclusivo):
+        qtd_concursos_ciclo: int = self.qtd_concursos_ciclo
+        self.frequencias_ciclos.add_sorteio(concurso.id_concurso, True)
+        self.ciclos_fechados.append(qtd_concursos_ciclo)
+        self.ciclos_sorteios.append(qtd_concursos_ciclo)
+
+        # registra o numero de concursos necessario para fechar mais um ciclo:
+        self.ciclos_concursos[qtd_concursos_ciclo] += 1
+        # verifica se repetiu o ciclo do ultimo concurso:
+        if qtd_concursos_ciclo == self.vl_ciclo_ultimo_concurso:
+            self.ultimos_ciclos_repetidos[qtd_concursos_ciclo] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.vl_ciclo_penultimo_concurso = self.vl_ciclo_ultimo_concurso
+        self.vl_ciclo_ultimo_concurso = qtd_concursos_ciclo
+
+        # zera contadores para proximo ciclo:
+        self.iniciar_ciclo()
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        qtd_concursos_ciclo: int = self.ciclos_sorteios.pop()
+        if qtd_concursos_ciclo == 0:  # o concurso nao fechou ciclo, entao apenas sai do ciclo:
+            self.qtd_concursos_ciclo -= 1
+            for bola in concurso.bolas:
+                self.dezenas_ciclo[bola] -= 1
+            return
+
+        # reabre o ciclo fechado pelo concurso, com os concursos anteriores do ciclo:
+        self.frequencias_ciclos.pop_sorteio(concurso.id_concurso, True)
+        self.ciclos_fechados.pop()
+        self.ciclos_concursos[qtd_concursos_ciclo] -= 1
+        self.iniciar_ciclo()
+        if qtd_concursos_ciclo > 1:
+            for anterior in self.concursos_computados[1 - qtd_concursos_ciclo:]:
+                cb.count_dezenas(anterior.bolas, self.dezenas_ciclo)
+        self.qtd_concursos_ciclo = qtd_concursos_ciclo - 1
+
+        # restaura os flags a partir dos ciclos fechados anteriormente:
+        self.vl_ciclo_ultimo_concurso = self.ciclos_fechados[-1] \
+            if len(self.ciclos_fechados) > 0 else -1
+        self.vl_ciclo_penultimo_concurso = self.ciclos_fechados[-2] \
+            if len(self.ciclos_fechados) > 1 else -1
+        if qtd_concursos_ciclo == self.vl_ciclo_ultimo_concurso:
+            self.ultimos_ciclos_repetidos[qtd_concursos_ciclo] -= 1
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
 
         # ja calcula as medidas estatisticas para impressao ao final:
         self.frequencias_ciclos.update_stats()
 
         # calcula o percentual dos ciclos:
-        self.ciclos_percentos: list[float] = cb.new_list_float(MAX_CICLOS)
+        self.ciclos_percentos = cb.new_list_float(MAX_CICLOS)
         for key, value in enumerate(self.ciclos_concursos):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ciclos_percentos[key] = percent
@@ -171,13 +223,34 @@ class ComputeCiclo(AbstractCompute):
             self.ultimos_ciclos_percentos[key] = percent
 
         # salva os ultimos concursos processados ate o momento para o EVALUATE posterior:
-        self.concursos_passados = list(reversed(concursos[-MAX_CICLOS:]))
+        self.concursos_passados = list(reversed(self.concursos_computados[-MAX_CICLOS:]))
 
-        # indica o tempo do processamento:
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.ciclos_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -190,6 +263,9 @@ class ComputeCiclo(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de concursos para fechar um ciclo com o jogo:
         size_ciclo: int = self.count_concursos_ciclo(jogo)
+        return self.fator_eval(size_ciclo)
+
+    def eval_valor(self, size_ciclo: int) -> float:
         percent: float = self.ciclos_percentos[size_ciclo]
 
         # ignora valores muito baixos de probabilidade:
@@ -217,6 +293,9 @@ class ComputeCiclo(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de concursos para fechar um ciclo com o jogo:
         size_ciclo: int = self.count_concursos_ciclo(jogo)
+        return self.fator_evaluate(size_ciclo)
+
+    def evaluate_valor(self, size_ciclo: int) -> float:
         percent: float = self.ciclos_percentos[size_ciclo]
 
         # ignora valores muito baixos de probabilidade:
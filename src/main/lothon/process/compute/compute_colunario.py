@@ -14,15 +14,16 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats import distribuicao as dj
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -33,6 +34,15 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# os colunarios de todas as combinacoes de jogos sao obtidos pela incidencia de cada dezena:
+hj.registrar_provedor('colunario', lambda qtd_bolas, qtd_bolas_sorteio: 9,
+                      dj.dist_colunarios)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -69,13 +79,10 @@ class ComputeColunario(AbstractCompute):
         # absorve os parametros fornecidos:
         super().setup(parms)
 
-        # efetua analise de todas as combinacoes de jogos da loteria:
+        # obtem o histograma de todas as combinacoes de jogos, contabilizado em passo unico:
         qtd_items: int = 9
-        self.colunarios_jogos = cb.new_list_int(qtd_items)
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # contabiliza os colunarios de cada combinacao de jogo:
-            cb.count_colunarios(jogo, self.colunarios_jogos)
+        self.colunarios_jogos = hj.get_histograma('colunario', self.qtd_bolas,
+                                                  self.qtd_bolas_sorteio)
 
         # contabiliza o percentual dos colunarios:
         self.colunarios_percentos = cb.new_list_float(qtd_items)
@@ -94,51 +101,106 @@ class ComputeColunario(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = 9
 
         # contabiliza colunarios de cada sorteio ja realizado:
+        self.concursos_computados = list(concursos)
         self.colunarios_concursos = cb.new_list_int(qtd_items)
         self.str_colunarios_concursos = [None]  # deixa o primeiro item, zero-index, ja preenchido
         self.ultimos_colunarios_repetidos = 0
         self.str_colunarios_ultimo_concurso = ''
         self.str_colunarios_penultimo_concurso = ''
+
+        # contabiliza tambem as frequencias e atrasos dos colunarios em todos os sorteios:
+        self.frequencias_colunarios = cb.new_list_series(qtd_items)
         for concurso in concursos:
-            cb.count_colunarios(concurso.bolas, self.colunarios_concursos)
-            # gera a representacao string do colunario para registro e comparacao:
-            colunarios: list[int] = cb.new_list_int(qtd_items)
-            cb.count_colunarios(concurso.bolas, colunarios)
-            str_colunarios: str = cb.to_string(colunarios)
-            self.str_colunarios_concursos.append(str_colunarios)
-            # verifica se repetiu os colunarios do ultimo concurso:
-            if str_colunarios == self.str_colunarios_ultimo_concurso:
-                self.ultimos_colunarios_repetidos += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.str_colunarios_penultimo_concurso = self.str_colunarios_ultimo_concurso
-            self.str_colunarios_ultimo_concurso = str_colunarios
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza o percentual e os atrasos ainda nao fechados dos colunarios:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f" para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        cb.count_colunarios(concurso.bolas, self.colunarios_concursos)
+        # gera a representacao string do colunario para registro e comparacao:
+        colunarios: list[int] = cb.new_list_int(9)
+        cb.count_colunarios(concurso.bolas, colunarios)
+        str_colunarios: str = cb.to_string(colunarios)
+        self.str_colunarios_concursos.append(str_colunarios)
+        # verifica se repetiu os colunarios do ultimo concurso:
+        if str_colunarios == self.str_colunarios_ultimo_concurso:
+            self.ultimos_colunarios_repetidos += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.str_colunarios_penultimo_concurso = self.str_colunarios_ultimo_concurso
+        self.str_colunarios_ultimo_concurso = str_colunarios
+
+        # contabiliza a frequencia dos colunarios do concurso:
+        for num in concurso.bolas:
+            coluna: int = cb.get_colunario(num)
+            self.frequencias_colunarios[coluna].add_sorteio(concurso.id_concurso)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        for num in concurso.bolas:
+            self.colunarios_concursos[cb.get_colunario(num)] -= 1
+        str_colunarios: str = self.str_colunarios_concursos.pop()
+
+        # restaura os flags a partir dos colunarios dos concursos anteriores:
+        self.str_colunarios_ultimo_concurso = self.str_colunarios_concursos[-1] \
+            if len(self.str_colunarios_concursos) > 1 else ''
+        self.str_colunarios_penultimo_concurso = self.str_colunarios_concursos[-2] \
+            if len(self.str_colunarios_concursos) > 2 else ''
+        if str_colunarios == self.str_colunarios_ultimo_concurso:
+            self.ultimos_colunarios_repetidos -= 1
+
+        # retira o concurso das frequencias dos colunarios:
+        self.estornar_series(self.frequencias_colunarios, concurso,
+                             lambda c: map(cb.get_colunario, c.bolas))
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
 
         # contabiliza o percentual dos colunarios repetidos:
         self.ultimos_colunarios_percentos = round((self.ultimos_colunarios_repetidos /
                                                    qtd_concursos) * 10000) / 100
 
-        # contabiliza as frequencias e atrasos dos colunarios em todos os sorteios ja realizados:
-        self.frequencias_colunarios = cb.new_list_series(qtd_items)
-        for concurso in concursos:
-            # contabiliza a frequencia dos colunarios do concurso:
-            for num in concurso.bolas:
-                coluna: int = cb.get_colunario(num)
-                self.frequencias_colunarios[coluna].add_sorteio(concurso.id_concurso)
-
         # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
         for serie in self.frequencias_colunarios:
             # vai aproveitar e contabilizar as medidas estatisticas para a coluna:
             serie.last_sorteio(ultimo_concurso.id_concurso)
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f" para executar {self.id_process.upper()}: {_stopWatch}")
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        for serie in self.frequencias_colunarios:
+            serie.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_colunarios:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
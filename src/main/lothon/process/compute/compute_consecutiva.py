@@ -14,15 +14,16 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats import distribuicao as dj
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -33,6 +34,15 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# as dezenas consecutivas de todas as combinacoes de jogos sao obtidas pelos blocos de dezenas:
+hj.registrar_provedor('consecutiva', lambda qtd_bolas, qtd_bolas_sorteio: qtd_bolas_sorteio - 1,
+                      dj.dist_consecutivas)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -46,7 +56,7 @@ class ComputeConsecutiva(AbstractCompute):
     __slots__ = ('consecutivas_jogos', 'consecutivas_percentos', 'consecutivas_concursos',
                  'ultimas_consecutivas_repetidas', 'ultimas_consecutivas_percentos',
                  'qtd_consecutivas_ultimo_concurso', 'qtd_consecutivas_penultimo_concurso',
-                 'frequencias_consecutivas')
+                 'frequencias_consecutivas', 'consecutivas_sorteios')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -61,20 +71,17 @@ class ComputeConsecutiva(AbstractCompute):
         self.ultimas_consecutivas_percentos: Optional[list[float]] = None
         self.qtd_consecutivas_ultimo_concurso: int = 0
         self.qtd_consecutivas_penultimo_concurso: int = 0
+        self.consecutivas_sorteios: Optional[list[int]] = None
         self.frequencias_consecutivas: Optional[list[SerieSorteio]] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
         super().setup(parms)
 
-        # efetua analise de todas as combinacoes de jogos da loteria:
+        # obtem o histograma de todas as combinacoes de jogos, contabilizado em passo unico:
         qtd_items: int = self.qtd_bolas_sorteio - 1
-        self.consecutivas_jogos = cb.new_list_int(qtd_items)
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # contabiliza as dezenas consecutivas de cada combinacao de jogo:
-            qtd_consecutivas = cb.count_consecutivas(jogo)
-            self.consecutivas_jogos[qtd_consecutivas] += 1
+        self.consecutivas_jogos = hj.get_histograma('consecutiva', self.qtd_bolas,
+                                                    self.qtd_bolas_sorteio)
 
         # contabiliza o percentual das dezenas consecutivas:
         self.consecutivas_percentos = cb.new_list_float(qtd_items)
@@ -92,24 +99,61 @@ class ComputeConsecutiva(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = self.qtd_bolas_sorteio - 1
 
         # contabiliza as dezenas consecutivas de cada sorteio dos concursos:
+        self.concursos_computados = list(concursos)
         self.consecutivas_concursos = cb.new_list_int(qtd_items)
         self.ultimas_consecutivas_repetidas = cb.new_list_int(qtd_items)
         self.qtd_consecutivas_ultimo_concurso = -1
         self.qtd_consecutivas_penultimo_concurso = -1
+        self.consecutivas_sorteios = []  # consecutivas de cada sorteio, na ordem dos concursos
+        self.frequencias_consecutivas = cb.new_list_series(qtd_items)
         for concurso in concursos:
-            qtd_consecutivas: int = cb.count_consecutivas(concurso.bolas)
-            print("concurso: ", concurso.bolas, " tem consecutivas: ", qtd_consecutivas)
-            self.consecutivas_concursos[qtd_consecutivas] += 1
-            # verifica se repetiu o numero de dezenas consecutivas do ultimo concurso:
-            if qtd_consecutivas == self.qtd_consecutivas_ultimo_concurso:
-                self.ultimas_consecutivas_repetidas[qtd_consecutivas] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.qtd_consecutivas_penultimo_concurso = self.qtd_consecutivas_ultimo_concurso
-            self.qtd_consecutivas_ultimo_concurso = qtd_consecutivas
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza os percentuais e os atrasos ainda nao fechados das consecutivas:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        qtd_consecutivas: int = cb.count_consecutivas(concurso.bolas, ordenadas=True)
+        self.consecutivas_concursos[qtd_consecutivas] += 1
+        # verifica se repetiu o numero de dezenas consecutivas do ultimo concurso:
+        if qtd_consecutivas == self.qtd_consecutivas_ultimo_concurso:
+            self.ultimas_consecutivas_repetidas[qtd_consecutivas] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.qtd_consecutivas_penultimo_concurso = self.qtd_consecutivas_ultimo_concurso
+        self.qtd_consecutivas_ultimo_concurso = qtd_consecutivas
+        self.consecutivas_sorteios.append(qtd_consecutivas)
+
+        # contabiliza o numero de dezenas consecutivas do concurso:
+        self.frequencias_consecutivas[qtd_consecutivas].add_sorteio(concurso.id_concurso)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        qtd_consecutivas: int = self.consecutivas_sorteios.pop()
+        self.consecutivas_concursos[qtd_consecutivas] -= 1
+
+        # restaura os flags a partir dos valores dos concursos anteriores:
+        self.qtd_consecutivas_ultimo_concurso = self.consecutivas_sorteios[-1] \
+            if len(self.consecutivas_sorteios) > 0 else -1
+        self.qtd_consecutivas_penultimo_concurso = self.consecutivas_sorteios[-2] \
+            if len(self.consecutivas_sorteios) > 1 else -1
+        if qtd_consecutivas == self.qtd_consecutivas_ultimo_concurso:
+            self.ultimas_consecutivas_repetidas[qtd_consecutivas] -= 1
+
+        # retira o concurso da frequencia do valor, se outro sorteio de mesmo id nao o registrou:
+        qtd_sorteios: int = len(self.get_sorteios_concurso(concurso.id_concurso))
+        if qtd_sorteios == 0 or qtd_consecutivas not in self.consecutivas_sorteios[-qtd_sorteios:]:
+            self.frequencias_consecutivas[qtd_consecutivas].pop_sorteio(concurso.id_concurso)
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = self.qtd_bolas_sorteio - 1
 
         # contabiliza o percentual das ultimas dezenas consecutivas:
         self.ultimas_consecutivas_percentos = cb.new_list_float(qtd_items)
@@ -117,35 +161,59 @@ class ComputeConsecutiva(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimas_consecutivas_percentos[key] = percent
 
-        # contabiliza frequencias e atrasos das dezenas consecutivas em todos os sorteios realizados
-        self.frequencias_consecutivas = cb.new_list_series(qtd_items)
-        for concurso in concursos:
-            # contabiliza o numero de dezenas consecutivas do concurso:
-            qtd_consecutivas = cb.count_consecutivas(concurso.bolas)
-            self.frequencias_consecutivas[qtd_consecutivas].add_sorteio(concurso.id_concurso)
-
         # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
         for serie in self.frequencias_consecutivas:
             # vai aproveitar e contabilizar as medidas estatisticas para a dezena consecutiva:
             serie.last_sorteio(ultimo_concurso.id_concurso)
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.consecutivas_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        for serie in self.frequencias_consecutivas:
+            serie.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_consecutivas:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
         return  # nada a fazer aqui...
 
     def rate(self, ordinal: int, jogo: tuple) -> int:
-        qtd_consecutivas: int = cb.count_consecutivas(jogo)
+        qtd_consecutivas: int = cb.count_consecutivas(jogo, ordenadas=True)
         return qtd_consecutivas
 
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de dezenas consecutivas no jogo:
-        qtd_consecutivas: int = cb.count_consecutivas(jogo)
+        qtd_consecutivas: int = cb.count_consecutivas(jogo, ordenadas=True)
+        return self.fator_eval(qtd_consecutivas)
+
+    def eval_valor(self, qtd_consecutivas: int) -> float:
         percent: float = self.consecutivas_percentos[qtd_consecutivas]
 
         # ignora valores muito baixos de probabilidade:
@@ -173,7 +241,10 @@ class ComputeConsecutiva(AbstractCompute):
 
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de dezenas consecutivas no jogo:
-        qtd_consecutivas: int = cb.count_consecutivas(jogo)
+        qtd_consecutivas: int = cb.count_consecutivas(jogo, ordenadas=True)
+        return self.fator_evaluate(qtd_consecutivas)
+
+    def evaluate_valor(self, qtd_consecutivas: int) -> float:
         percent: float = self.consecutivas_percentos[qtd_consecutivas]
 
         # ignora valores muito baixos de probabilidade:
@@ -44,7 +44,7 @@ class ComputeDispersao(AbstractCompute):
     """
 
     # --- PROPRIEDADES -------------------------------------------------------
-    __slots__ = ('frequencias_dezenas', 'atrasos_dezenas',
+    __slots__ = ('frequencias_dezenas', 'atrasos_dezenas', 'ultimos_sorteios_dezenas',
                  'dispersoes_concursos', 'dispersoes_percentos',
                  'ultimas_dispersoes_repetidas', 'ultimas_dispersoes_percentos',
                  'vl_dispersao_ultimo_concurso', 'vl_dispersao_penultimo_concurso')
@@ -56,6 +56,7 @@ class ComputeDispersao(AbstractCompute):
 
         # estrutura para a coleta de dados a partir do processamento de analise:
         self.frequencias_dezenas: Optional[list[int]] = None
+        self.ultimos_sorteios_dezenas: Optional[list[int]] = None
         self.atrasos_dezenas: Optional[list[int]] = None
         self.dispersoes_concursos: Optional[list[int]] = None
         self.dispersoes_percentos: Optional[list[float]] = None
@@ -115,28 +116,57 @@ class ComputeDispersao(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = self.qtd_bolas
 
         # zera os contadores de frequencias e atrasos - usa -1 para nao conflitar com teste == 0:
+        self.concursos_computados = list(concursos)
         self.frequencias_dezenas = cb.new_list_int(qtd_items, -1)
-        self.atrasos_dezenas = cb.new_list_int(qtd_items, -1)
-
-        # contabiliza as frequencias e atrasos das dezenas em todos os sorteios ja realizados:
-        for concurso in reversed(concursos):
-            # cada ocorrencia de dezena incrementa sua respectiva frequencia:
-            for dezena in concurso.bolas:
-                self.frequencias_dezenas[dezena] += 1
-                # contabiliza tambem os atrasos, aproveitando a ordem reversa dos concursos:
-                if self.atrasos_dezenas[dezena] == -1:
-                    self.atrasos_dezenas[dezena] = qtd_concursos - concurso.id_concurso
-
-        # contabiliza as dispersoes das variancias das dezenas em todos os sorteios ja realizados:
+        self.ultimos_sorteios_dezenas = cb.new_list_int(qtd_items)
+
+        # contabiliza as frequencias e ultimos sorteios das dezenas em todos os sorteios:
+        for concurso in concursos:
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza as dispersoes dos concursos, a partir das frequencias e atrasos das dezenas:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        # cada ocorrencia de dezena incrementa sua respectiva frequencia:
+        for dezena in concurso.bolas:
+            self.frequencias_dezenas[dezena] += 1
+            self.ultimos_sorteios_dezenas[dezena] = concurso.id_concurso
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        for dezena in concurso.bolas:
+            self.frequencias_dezenas[dezena] -= 1
+
+            # o ultimo sorteio da dezena volta a ser sua ocorrencia anterior nos concursos:
+            self.ultimos_sorteios_dezenas[dezena] = 0
+            for anterior in reversed(self.concursos_computados):
+                if dezena in anterior.bolas:
+                    self.ultimos_sorteios_dezenas[dezena] = anterior.id_concurso
+                    break
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = self.qtd_bolas
+
+        # os atrasos das dezenas sao relativos ao ultimo concurso (-1 se nunca foi sorteada):
+        self.atrasos_dezenas = [-1 if ultimo == 0 else qtd_concursos - ultimo
+                                for ultimo in self.ultimos_sorteios_dezenas]
+
+        # as dispersoes de todos os concursos dependem das frequencias e atrasos atualizados, e
+        # por isso sao sempre recalculadas, mesmo apos adicionar apenas um concurso:
         self.dispersoes_concursos = cb.new_list_int(qtd_items)
         self.ultimas_dispersoes_repetidas = cb.new_list_int(qtd_items)
         self.vl_dispersao_ultimo_concurso = -1
         self.vl_dispersao_penultimo_concurso = -1
-        for concurso in concursos:
+        for concurso in self.concursos_computados:
             faixa_dispersao: int = self.calc_dispersao(concurso.bolas)
             self.dispersoes_concursos[faixa_dispersao] += 1
             # verifica se repetiu a dispersao do ultimo concurso:
@@ -146,16 +176,8 @@ class ComputeDispersao(AbstractCompute):
             self.vl_dispersao_penultimo_concurso = self.vl_dispersao_ultimo_concurso
             self.vl_dispersao_ultimo_concurso = faixa_dispersao
 
-        # como a estrutura de dispersao tem muitos elementos (100), apaga aqueles zerados ao final:
-        # while len(self.dispersoes_concursos) > 0:
-        #     # apaga o ultimo elemento, ate encontrar alguma posicao nao-zerada:
-        #     if self.dispersoes_concursos[-1] == 0:
-        #         del self.dispersoes_concursos[-1]
-        #     else:
-        #         break
-
         # calcula o percentual das dispersoes:
-        self.dispersoes_percentos: list[float] = cb.new_list_float(qtd_items)
+        self.dispersoes_percentos = cb.new_list_float(qtd_items)
         for key, value in enumerate(self.dispersoes_concursos):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.dispersoes_percentos[key] = percent
@@ -166,15 +188,37 @@ class ComputeDispersao(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimas_dispersoes_percentos[key] = percent
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.dispersoes_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
-        # eh preciso processar novamente a computacao para novos calculos de rate e eval.
-        self.execute(concursos)
+        # eh preciso atualizar a computacao para novos calculos de rate e eval:
+        self.atualizar_concursos(concursos)
 
     def rate(self, ordinal: int, jogo: tuple) -> int:
         faixa_dispersao: int = self.calc_dispersao(jogo)
@@ -183,6 +227,9 @@ class ComputeDispersao(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do fator de dispersao do jogo:
         faixa_dispersao: int = self.calc_dispersao(jogo)
+        return self.fator_eval(faixa_dispersao)
+
+    def eval_valor(self, faixa_dispersao: int) -> float:
         percent: float = self.dispersoes_percentos[faixa_dispersao]
 
         # ignora valores muito baixos de probabilidade:
@@ -211,6 +258,9 @@ class ComputeDispersao(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do fator de dispersao do jogo:
         faixa_dispersao: int = self.calc_dispersao(jogo)
+        return self.fator_evaluate(faixa_dispersao)
+
+    def evaluate_valor(self, faixa_dispersao: int) -> float:
         percent: float = self.dispersoes_percentos[faixa_dispersao]
 
         # ignora valores muito baixos de probabilidade:
@@ -14,15 +14,16 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats import distribuicao as dj
 from lothon.domain import Concurso
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -33,6 +34,15 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# as distancias de todas as combinacoes de jogos sao obtidas pela formula fechada:
+hj.registrar_provedor('distancia', lambda qtd_bolas, qtd_bolas_sorteio: qtd_bolas,
+                      dj.dist_distancias)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -45,7 +55,8 @@ class ComputeDistancia(AbstractCompute):
     # --- PROPRIEDADES -------------------------------------------------------
     __slots__ = ('distancias_jogos', 'distancias_percentos', 'distancias_concursos', 
                  'ultimas_distancias_repetidas', 'ultimas_distancias_percentos',
-                 'vl_distancia_ultimo_concurso', 'vl_distancia_penultimo_concurso')
+                 'vl_distancia_ultimo_concurso', 'vl_distancia_penultimo_concurso',
+                 'distancias_sorteios')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -60,19 +71,16 @@ class ComputeDistancia(AbstractCompute):
         self.ultimas_distancias_percentos: Optional[list[float]] = None
         self.vl_distancia_ultimo_concurso: int = 0
         self.vl_distancia_penultimo_concurso: int = 0
+        self.distancias_sorteios: Optional[list[int]] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
         super().setup(parms)
 
-        # efetua analise de todas as combinacoes de jogos da loteria:
+        # obtem o histograma de todas as combinacoes de jogos, contabilizado em passo unico:
         qtd_items: int = self.qtd_bolas
-        self.distancias_jogos = cb.new_list_int(qtd_items)
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # calcula a distancia de cada combinacao de jogo:
-            vl_distancia = cb.calc_distancia(jogo)
-            self.distancias_jogos[vl_distancia] += 1
+        self.distancias_jogos = hj.get_histograma('distancia', self.qtd_bolas,
+                                                  self.qtd_bolas_sorteio)
 
         # contabiliza o percentual das distancias:
         self.distancias_percentos = cb.new_list_float(qtd_items)
@@ -90,23 +98,52 @@ class ComputeDistancia(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = self.qtd_bolas
 
         # calcula a distancia de cada sorteio dos concursos:
+        self.concursos_computados = list(concursos)
         self.distancias_concursos = cb.new_list_int(qtd_items)
         self.ultimas_distancias_repetidas = cb.new_list_int(qtd_items)
         self.vl_distancia_ultimo_concurso = -1
         self.vl_distancia_penultimo_concurso = -1
+        self.distancias_sorteios = []  # distancia de cada sorteio, na ordem dos concursos
         for concurso in concursos:
-            vl_distancia: int = cb.calc_distancia(concurso.bolas)
-            self.distancias_concursos[vl_distancia] += 1
-            # verifica se repetiu a distancia do ultimo concurso:
-            if vl_distancia == self.vl_distancia_ultimo_concurso:
-                self.ultimas_distancias_repetidas[vl_distancia] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.vl_distancia_penultimo_concurso = self.vl_distancia_ultimo_concurso
-            self.vl_distancia_ultimo_concurso = vl_distancia
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza o percentual das ultimas distancias e tabela os fatores:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        vl_distancia: int = cb.calc_distancia(concurso.bolas)
+        self.distancias_concursos[vl_distancia] += 1
+        # verifica se repetiu a distancia do ultimo concurso:
+        if vl_distancia == self.vl_distancia_ultimo_concurso:
+            self.ultimas_distancias_repetidas[vl_distancia] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.vl_distancia_penultimo_concurso = self.vl_distancia_ultimo_concurso
+        self.vl_distancia_ultimo_concurso = vl_distancia
+        self.distancias_sorteios.append(vl_distancia)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        vl_distancia: int = self.distancias_sorteios.pop()
+        self.distancias_concursos[vl_distancia] -= 1
+
+        # restaura os flags a partir dos valores dos concursos anteriores:
+        self.vl_distancia_ultimo_concurso = self.distancias_sorteios[-1] \
+            if len(self.distancias_sorteios) > 0 else -1
+        self.vl_distancia_penultimo_concurso = self.distancias_sorteios[-2] \
+            if len(self.distancias_sorteios) > 1 else -1
+        if vl_distancia == self.vl_distancia_ultimo_concurso:
+            self.ultimas_distancias_repetidas[vl_distancia] -= 1
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = self.qtd_bolas
 
         # contabiliza o percentual das ultimas distancias:
         self.ultimas_distancias_percentos = cb.new_list_float(qtd_items)
@@ -114,10 +151,32 @@ class ComputeDistancia(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimas_distancias_percentos[key] = percent
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.distancias_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -130,6 +189,9 @@ class ComputeDistancia(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende da distancia entre as dezenas:
         vl_distancia: int = cb.calc_distancia(jogo)
+        return self.fator_eval(vl_distancia)
+
+    def eval_valor(self, vl_distancia: int) -> float:
         percent: float = self.distancias_percentos[vl_distancia]
 
         # ignora valores muito baixos de probabilidade:
@@ -158,6 +220,9 @@ class ComputeDistancia(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende da distancia entre as dezenas:
         vl_distancia: int = cb.calc_distancia(jogo)
+        return self.fator_evaluate(vl_distancia)
+
+    def evaluate_valor(self, vl_distancia: int) -> float:
         percent: float = self.distancias_percentos[vl_distancia]
 
         # ignora valores muito baixos de probabilidade:
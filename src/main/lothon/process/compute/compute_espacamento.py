@@ -14,15 +14,16 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats import distribuicao as dj
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -33,6 +34,16 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# os espacamentos de todas as combinacoes de jogos sao obtidos das distancias:
+hj.registrar_provedor('espacamento', lambda qtd_bolas, qtd_bolas_sorteio:
+                      qtd_bolas // (qtd_bolas_sorteio - 1),
+                      dj.dist_espacamentos)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -46,7 +57,7 @@ class ComputeEspacamento(AbstractCompute):
     __slots__ = ('espacamentos_jogos', 'espacamentos_percentos', 'espacamentos_concursos',
                  'ultimos_espacamentos_repetidos', 'ultimos_espacamentos_percentos',
                  'qtd_espacamentos_ultimo_concurso', 'qtd_espacamentos_penultimo_concurso',
-                 'frequencias_espacamentos')
+                 'frequencias_espacamentos', 'espacamentos_sorteios')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -61,20 +72,17 @@ class ComputeEspacamento(AbstractCompute):
         self.ultimos_espacamentos_percentos: Optional[list[float]] = None
         self.qtd_espacamentos_ultimo_concurso: int = 0
         self.qtd_espacamentos_penultimo_concurso: int = 0
+        self.espacamentos_sorteios: Optional[list[int]] = None
         self.frequencias_espacamentos: Optional[list[SerieSorteio]] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
         super().setup(parms)
 
-        # efetua analise de todas as combinacoes de jogos da loteria:
+        # obtem o histograma de todas as combinacoes de jogos, contabilizado em passo unico:
         qtd_items: int = self.qtd_bolas // (self.qtd_bolas_sorteio - 1)
-        self.espacamentos_jogos = cb.new_list_int(qtd_items)
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # calcula o espacamento medio de cada combinacao de jogo:
-            vl_espacamento = cb.calc_espacada(jogo)
-            self.espacamentos_jogos[vl_espacamento] += 1
+        self.espacamentos_jogos = hj.get_histograma('espacamento', self.qtd_bolas,
+                                                    self.qtd_bolas_sorteio)
 
         # contabiliza o percentual dos espacamentos:
         self.espacamentos_percentos = cb.new_list_float(qtd_items)
@@ -92,23 +100,61 @@ class ComputeEspacamento(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = self.qtd_bolas // (self.qtd_bolas_sorteio - 1)
 
         # calcula o espacamento de cada sorteio dos concursos:
+        self.concursos_computados = list(concursos)
         self.espacamentos_concursos = cb.new_list_int(qtd_items)
         self.ultimos_espacamentos_repetidos = cb.new_list_int(qtd_items)
         self.qtd_espacamentos_ultimo_concurso = -1
         self.qtd_espacamentos_penultimo_concurso = -1
+        self.espacamentos_sorteios = []  # espacamento de cada sorteio, na ordem dos concursos
+        self.frequencias_espacamentos = cb.new_list_series(qtd_items)
         for concurso in concursos:
-            vl_espacamento: int = cb.calc_espacada(concurso.bolas)
-            self.espacamentos_concursos[vl_espacamento] += 1
-            # verifica se repetiu o espacamento do ultimo concurso:
-            if vl_espacamento == self.qtd_espacamentos_ultimo_concurso:
-                self.ultimos_espacamentos_repetidos[vl_espacamento] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.qtd_espacamentos_penultimo_concurso = self.qtd_espacamentos_ultimo_concurso
-            self.qtd_espacamentos_ultimo_concurso = vl_espacamento
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza os percentuais e os atrasos ainda nao fechados dos espacamentos:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        vl_espacamento: int = cb.calc_espacada(concurso.bolas)
+        self.espacamentos_concursos[vl_espacamento] += 1
+        # verifica se repetiu o espacamento do ultimo concurso:
+        if vl_espacamento == self.qtd_espacamentos_ultimo_concurso:
+            self.ultimos_espacamentos_repetidos[vl_espacamento] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.qtd_espacamentos_penultimo_concurso = self.qtd_espacamentos_ultimo_concurso
+        self.qtd_espacamentos_ultimo_concurso = vl_espacamento
+        self.espacamentos_sorteios.append(vl_espacamento)
+
+        # contabiliza a frequencia dos espacamentos do concurso:
+        self.frequencias_espacamentos[vl_espacamento].add_sorteio(concurso.id_concurso)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        vl_espacamento: int = self.espacamentos_sorteios.pop()
+        self.espacamentos_concursos[vl_espacamento] -= 1
+
+        # restaura os flags a partir dos valores dos concursos anteriores:
+        self.qtd_espacamentos_ultimo_concurso = self.espacamentos_sorteios[-1] \
+            if len(self.espacamentos_sorteios) > 0 else -1
+        self.qtd_espacamentos_penultimo_concurso = self.espacamentos_sorteios[-2] \
+            if len(self.espacamentos_sorteios) > 1 else -1
+        if vl_espacamento == self.qtd_espacamentos_ultimo_concurso:
+            self.ultimos_espacamentos_repetidos[vl_espacamento] -= 1
+
+        # retira o concurso da frequencia do valor, se outro sorteio de mesmo id nao o registrou:
+        qtd_sorteios: int = len(self.get_sorteios_concurso(concurso.id_concurso))
+        if qtd_sorteios == 0 or vl_espacamento not in self.espacamentos_sorteios[-qtd_sorteios:]:
+            self.frequencias_espacamentos[vl_espacamento].pop_sorteio(concurso.id_concurso)
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = self.qtd_bolas // (self.qtd_bolas_sorteio - 1)
 
         # contabiliza o percentual dos ultims espacamentos:
         self.ultimos_espacamentos_percentos = cb.new_list_float(qtd_items)
@@ -116,23 +162,44 @@ class ComputeEspacamento(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimos_espacamentos_percentos[key] = percent
 
-        # contabiliza as frequencias e atrasos dos espacamentos em todos os sorteios ja realizados:
-        self.frequencias_espacamentos = cb.new_list_series(qtd_items)
-        for concurso in concursos:
-            # contabiliza a frequencia dos espacamentos do concurso:
-            vl_espacamento: int = cb.calc_espacada(concurso.bolas)
-            self.frequencias_espacamentos[vl_espacamento].add_sorteio(concurso.id_concurso)
-
         # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
         for serie in self.frequencias_espacamentos:
             # vai aproveitar e contabilizar as medidas estatisticas para o espacamento:
             serie.last_sorteio(ultimo_concurso.id_concurso)
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.espacamentos_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        for serie in self.frequencias_espacamentos:
+            serie.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_espacamentos:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -145,6 +212,9 @@ class ComputeEspacamento(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de espacamentos no jogo:
         vl_espacamento = cb.calc_espacada(jogo)
+        return self.fator_eval(vl_espacamento)
+
+    def eval_valor(self, vl_espacamento: int) -> float:
         percent: float = self.espacamentos_percentos[vl_espacamento]
 
         # ignora valores muito baixos de probabilidade:
@@ -173,6 +243,9 @@ class ComputeEspacamento(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de espacamentos no jogo:
         vl_espacamento = cb.calc_espacada(jogo)
+        return self.fator_evaluate(vl_espacamento)
+
+    def evaluate_valor(self, vl_espacamento: int) -> float:
         percent: float = self.espacamentos_percentos[vl_espacamento]
 
         # ignora valores muito baixos de probabilidade:
@@ -20,6 +20,7 @@ import logging
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats.ranking import RankingFrequencia
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
 
@@ -48,7 +49,8 @@ class ComputeFrequencia(AbstractCompute):
     __slots__ = ('frequencias_dezenas', 'topos_dezenas', 'topos_concursos',
                  'topos_frequentes', 'topos_percentos',
                  'ultimos_topos_repetidos', 'ultimos_topos_percentos',
-                 'qtd_topos_ultimo_concurso', 'qtd_topos_penultimo_concurso')
+                 'qtd_topos_ultimo_concurso', 'qtd_topos_penultimo_concurso',
+                 'topos_sorteios', 'ranking_frequencias')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -65,6 +67,8 @@ class ComputeFrequencia(AbstractCompute):
         self.ultimos_topos_percentos: Optional[list[float]] = None
         self.qtd_topos_ultimo_concurso: int = 0
         self.qtd_topos_penultimo_concurso: int = 0
+        self.topos_sorteios: Optional[list[int]] = None
+        self.ranking_frequencias: Optional[RankingFrequencia] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
@@ -90,17 +94,8 @@ class ComputeFrequencia(AbstractCompute):
         qtd_items: int = self.qtd_bolas
 
         # contabiliza as frequencias e atrasos das dezenas em todos os sorteios ja realizados:
+        self.concursos_computados = list(concursos)
         self.frequencias_dezenas = cb.new_list_series(qtd_items)
-        for concurso in concursos:
-            # registra o concurso para cada dezena sorteada:
-            for bola in concurso.bolas:
-                self.frequencias_dezenas[bola].add_sorteio(concurso.id_concurso)
-
-        # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
-        for serie in self.frequencias_dezenas[1:]:
-            # vai aproveitar e contabilizar as medidas estatisticas para a bola:
-            serie.last_sorteio(ultimo_concurso.id_concurso)
 
         # contabiliza as frequencias evolutivas das dezenas para extrair os topos mais frequentes:
         self.topos_concursos = cb.new_list_int(qtd_concursos)  # registro o topo de cada concurso
@@ -108,30 +103,79 @@ class ComputeFrequencia(AbstractCompute):
         self.ultimos_topos_repetidos = cb.new_list_int(QTD_TOPOS_RANKING)
         self.qtd_topos_ultimo_concurso = -1
         self.qtd_topos_penultimo_concurso = -1
+        self.topos_sorteios = []  # topos de cada sorteio, na ordem dos concursos (exceto o 1o)
 
-        concursos_anteriores: list[Concurso] = [concursos[0]]
+        # o ranking das frequencias eh atualizado a cada concurso, sem recontar os anteriores:
+        self.ranking_frequencias = RankingFrequencia(self.qtd_bolas)
+        self.registrar_sorteio(concursos[0])
         for concurso in concursos[1:]:
-            # extrai o topo do ranking com as dezenas com maior frequencia:
-            topos_concurso: list[int] = cb.calc_topos_frequencia(concursos_anteriores,
-                                                                 self.qtd_bolas, QTD_TOPOS_RANKING)
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza os percentuais e os atrasos ainda nao fechados das dezenas:
+        self.finalizar_concursos()
 
-            # identifica o numero de dezenas do concurso que estao entre o topo de frequencias:
-            qtd_topos: int = cb.count_recorrencias(concurso.bolas, topos_concurso)
-            self.topos_concursos[concurso.id_concurso] = qtd_topos
-            self.topos_frequentes[qtd_topos] += 1
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
 
-            # verifica se repetiu o numero de topos do ultimo concurso:
-            if qtd_topos == self.qtd_topos_ultimo_concurso:
-                self.ultimos_topos_repetidos[qtd_topos] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.qtd_topos_penultimo_concurso = self.qtd_topos_ultimo_concurso
-            self.qtd_topos_ultimo_concurso = qtd_topos
+    # registra o concurso para cada dezena sorteada, nas series e no ranking das frequencias:
+    def registrar_sorteio(self, concurso: Concurso):
+        for bola in concurso.bolas:
+            self.frequencias_dezenas[bola].add_sorteio(concurso.id_concurso)
+        self.ranking_frequencias.add_sorteio(concurso.bolas)
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        # extrai o topo do ranking com as dezenas com maior frequencia:
+        topos_concurso: list[int] = self.ranking_frequencias.get_topos(QTD_TOPOS_RANKING)
+
+        # identifica o numero de dezenas do concurso que estao entre o topo de frequencias:
+        qtd_topos: int = cb.count_recorrencias(concurso.bolas, topos_concurso)
+        self.topos_concursos[concurso.id_concurso] = qtd_topos
+        self.topos_sorteios.append(qtd_topos)
+        self.topos_frequentes[qtd_topos] += 1
+
+        # verifica se repetiu o numero de topos do ultimo concurso:
+        if qtd_topos == self.qtd_topos_ultimo_concurso:
+            self.ultimos_topos_repetidos[qtd_topos] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.qtd_topos_penultimo_concurso = self.qtd_topos_ultimo_concurso
+        self.qtd_topos_ultimo_concurso = qtd_topos
+
+        # adiciona o concurso atual para a proxima iteracao (ai ele sera um concurso anterior):
+        self.registrar_sorteio(concurso)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        self.ranking_frequencias.remove_sorteio(concurso.bolas)
+        self.estornar_series(self.frequencias_dezenas, concurso, lambda c: c.bolas)
+        qtd_topos: int = self.topos_sorteios.pop()
+        self.topos_frequentes[qtd_topos] -= 1
+
+        # o topo registrado para o id do concurso volta a ser o do sorteio anterior de mesmo id:
+        sorteios: list[Concurso] = self.get_sorteios_concurso(concurso.id_concurso)
+        self.topos_concursos[concurso.id_concurso] = self.topos_sorteios[-1] \
+            if len(sorteios) > 0 and len(self.topos_sorteios) > 0 else 0
+        del self.topos_concursos[-1]
+
+        # restaura os flags a partir dos topos dos sorteios anteriores:
+        self.qtd_topos_ultimo_concurso = self.topos_sorteios[-1] \
+            if len(self.topos_sorteios) > 0 else -1
+        self.qtd_topos_penultimo_concurso = self.topos_sorteios[-2] \
+            if len(self.topos_sorteios) > 1 else -1
+        if qtd_topos == self.qtd_topos_ultimo_concurso:
+            self.ultimos_topos_repetidos[qtd_topos] -= 1
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
 
-            # adiciona o concurso atual para a proxima iteracao (ai ele sera um concurso anterior):
-            concursos_anteriores.append(concurso)
+        # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
+        for serie in self.frequencias_dezenas[1:]:
+            # vai aproveitar e contabilizar as medidas estatisticas para a bola:
+            serie.last_sorteio(ultimo_concurso.id_concurso)
 
         # extrai os topos do ranking com as dezenas com maior frequencia em todos os concursos:
-        self.topos_dezenas = cb.calc_topos_frequencia(concursos, self.qtd_bolas, QTD_TOPOS_RANKING)
+        self.topos_dezenas = self.ranking_frequencias.get_topos(QTD_TOPOS_RANKING)
 
         # contabiliza o percentual dos topos dos concursos:
         self.topos_percentos = cb.new_list_float(QTD_TOPOS_RANKING)
@@ -145,10 +189,39 @@ class ComputeFrequencia(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimos_topos_percentos[key] = percent
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.topos_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        for serie in self.frequencias_dezenas[1:]:
+            serie.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.topos_concursos.append(0)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_dezenas[1:]:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -162,6 +235,9 @@ class ComputeFrequencia(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de topos no jogo:
         qtd_topos: int = self.count_topos_frequencia(jogo)
+        return self.fator_eval(qtd_topos)
+
+    def eval_valor(self, qtd_topos: int) -> float:
         percent: float = self.topos_percentos[qtd_topos]
 
         # ignora valores muito baixos de probabilidade:
@@ -189,6 +265,9 @@ class ComputeFrequencia(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de topos no jogo:
         qtd_topos: int = self.count_topos_frequencia(jogo)
+        return self.fator_evaluate(qtd_topos)
+
+    def evaluate_valor(self, qtd_topos: int) -> float:
         percent: float = self.topos_percentos[qtd_topos]
 
         # ignora valores muito baixos de probabilidade:
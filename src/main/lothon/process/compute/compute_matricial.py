@@ -14,15 +14,16 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats import distribuicao as dj
 from lothon.domain import Concurso
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -33,6 +34,17 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# os pares (maximo de colunas, maximo de linhas) de todas as combinacoes de jogos sao obtidos
+# por programacao dinamica sobre as linhas do volante:
+hj.registrar_provedor('matricial', lambda qtd_bolas, qtd_bolas_sorteio:
+                      (qtd_bolas_sorteio + 1) ** 2 - 1,
+                      dj.dist_matriciais)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -47,7 +59,7 @@ class ComputeMatricial(AbstractCompute):
                  'linhas_jogos', 'linhas_percentos', 'linhas_concursos',
                  'matrizes_jogos', 'matrizes_percentos', 'matrizes_concursos',
                  'ultimas_matrizes_repetidas', 'ultimas_matrizes_percentos',
-                 'matriz_ultimo_concurso', 'matriz_penultimo_concurso')
+                 'matriz_ultimo_concurso', 'matriz_penultimo_concurso', 'matrizes_sorteios')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -68,6 +80,7 @@ class ComputeMatricial(AbstractCompute):
         self.ultimas_matrizes_percentos: Optional[list[float]] = None
         self.matriz_ultimo_concurso: int = 0
         self.matriz_penultimo_concurso: int = 0
+        self.matrizes_sorteios: Optional[list[int]] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
@@ -79,20 +92,18 @@ class ComputeMatricial(AbstractCompute):
         self.linhas_jogos = cb.new_list_int(qtd_items)
         self.matrizes_jogos = cb.new_list_int(qtd_items * 2)
 
-        # identifica o numero maximo de colunas e linhas de cada combinacao de jogo:
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # maximo de colunas
-            vl_max_col: int = cb.max_colunas(jogo)
-            self.colunas_jogos[vl_max_col] += 1
-
-            # maximo de linhas
-            vl_max_lin: int = cb.max_linhas(jogo)
-            self.linhas_jogos[vl_max_lin] += 1
+        # o numero maximo de colunas e linhas das combinacoes de jogos eh obtido em conjunto,
+        # bastando decompor o histograma:
+        pares_jogos: list[int] = hj.get_histograma('matricial', self.qtd_bolas,
+                                                   self.qtd_bolas_sorteio)
+        for indice, qtd_jogos in enumerate(pares_jogos):
+            vl_max_col, vl_max_lin = divmod(indice, qtd_items + 1)
+            self.colunas_jogos[vl_max_col] += qtd_jogos
+            self.linhas_jogos[vl_max_lin] += qtd_jogos
 
             # calculo da matriz:
             vl_max_mtz: int = vl_max_col + vl_max_lin
-            self.matrizes_jogos[vl_max_mtz] += 1
+            self.matrizes_jogos[vl_max_mtz] += qtd_jogos
 
         # contabiliza o percentual das colunas:
         self.colunas_percentos = cb.new_list_float(qtd_items)
@@ -122,35 +133,66 @@ class ComputeMatricial(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = self.qtd_bolas_sorteio
 
         # identifica o numero maximo de colunas e linhas de cada sorteio ja realizado:
+        self.concursos_computados = list(concursos)
         self.colunas_concursos = cb.new_list_int(qtd_items)
         self.linhas_concursos = cb.new_list_int(qtd_items)
         self.matrizes_concursos = cb.new_list_int(qtd_items * 2)
         self.ultimas_matrizes_repetidas = cb.new_list_int(qtd_items * 2)
         self.matriz_ultimo_concurso = -1
         self.matriz_penultimo_concurso = -1
+        self.matrizes_sorteios = []  # matriz de cada sorteio, na ordem dos concursos
         for concurso in concursos:
-            # maximo de colunas
-            vl_max_col: int = cb.max_colunas(concurso.bolas)
-            self.colunas_concursos[vl_max_col] += 1
+            self.contabilizar_concurso(concurso)
 
-            # maximo de linhas
-            vl_max_lin: int = cb.max_linhas(concurso.bolas)
-            self.linhas_concursos[vl_max_lin] += 1
+        # contabiliza o percentual das ultimas matrizes e tabela os fatores:
+        self.finalizar_concursos()
 
-            # calculo da matriz:
-            vl_max_mtz: int = vl_max_col + vl_max_lin
-            self.matrizes_concursos[vl_max_mtz] += 1
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        # maximo de colunas
+        vl_max_col: int = cb.max_colunas(concurso.bolas)
+        self.colunas_concursos[vl_max_col] += 1
 
-            # verifica se repetiu a matriz com maxima coluna e linha do ultimo concurso:
-            if vl_max_mtz == self.matriz_ultimo_concurso:
-                self.ultimas_matrizes_repetidas[vl_max_mtz] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.matriz_penultimo_concurso = self.matriz_ultimo_concurso
-            self.matriz_ultimo_concurso = vl_max_mtz
+        # maximo de linhas
+        vl_max_lin: int = cb.max_linhas(concurso.bolas)
+        self.linhas_concursos[vl_max_lin] += 1
+
+        # calculo da matriz:
+        vl_max_mtz: int = vl_max_col + vl_max_lin
+        self.matrizes_concursos[vl_max_mtz] += 1
+        self.matrizes_sorteios.append(vl_max_mtz)
+
+        # verifica se repetiu a matriz com maxima coluna e linha do ultimo concurso:
+        if vl_max_mtz == self.matriz_ultimo_concurso:
+            self.ultimas_matrizes_repetidas[vl_max_mtz] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.matriz_penultimo_concurso = self.matriz_ultimo_concurso
+        self.matriz_ultimo_concurso = vl_max_mtz
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        self.colunas_concursos[cb.max_colunas(concurso.bolas)] -= 1
+        self.linhas_concursos[cb.max_linhas(concurso.bolas)] -= 1
+        vl_max_mtz: int = self.matrizes_sorteios.pop()
+        self.matrizes_concursos[vl_max_mtz] -= 1
+
+        # restaura os flags a partir das matrizes dos concursos anteriores:
+        self.matriz_ultimo_concurso = self.matrizes_sorteios[-1] \
+            if len(self.matrizes_sorteios) > 0 else -1
+        self.matriz_penultimo_concurso = self.matrizes_sorteios[-2] \
+            if len(self.matrizes_sorteios) > 1 else -1
+        if vl_max_mtz == self.matriz_ultimo_concurso:
+            self.ultimas_matrizes_repetidas[vl_max_mtz] -= 1
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = self.qtd_bolas_sorteio
 
         # contabiliza o percentual das ultimas matrizes de maxima coluna e linha:
         self.ultimas_matrizes_percentos = cb.new_list_float(qtd_items * 2)
@@ -158,10 +200,32 @@ class ComputeMatricial(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimas_matrizes_percentos[key] = percent
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.matrizes_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -180,6 +244,9 @@ class ComputeMatricial(AbstractCompute):
         vl_max_lin: int = cb.max_linhas(jogo)
 
         vl_max_mtz: int = vl_max_col + vl_max_lin
+        return self.fator_eval(vl_max_mtz)
+
+    def eval_valor(self, vl_max_mtz: int) -> float:
         percent_mtz: float = self.matrizes_percentos[vl_max_mtz]
 
         # ignora valores muito baixos de probabilidade:
@@ -210,6 +277,9 @@ class ComputeMatricial(AbstractCompute):
         vl_max_lin: int = cb.max_linhas(jogo)
 
         vl_max_mtz: int = vl_max_col + vl_max_lin
+        return self.fator_evaluate(vl_max_mtz)
+
+    def evaluate_valor(self, vl_max_mtz: int) -> float:
         percent_mtz: float = self.matrizes_percentos[vl_max_mtz]
 
         # ignora valores muito baixos de probabilidade:
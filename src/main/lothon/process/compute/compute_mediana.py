@@ -15,7 +15,6 @@ __all__ = [
 # Built-in/Generic modules
 import math
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
@@ -24,6 +23,7 @@ from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -34,6 +34,15 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# contabiliza a raiz-media de cada combinacao de jogo no passo unico dos histogramas:
+hj.registrar_contador('mediana', lambda qtd_bolas, qtd_bolas_sorteio: round(math.sqrt(qtd_bolas)),
+                      cb.root_mean)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -47,7 +56,7 @@ class ComputeMediana(AbstractCompute):
     __slots__ = ('medias_jogos', 'medias_percentos', 'medias_concursos',
                  'ultimas_medias_repetidas', 'ultimas_medias_percentos',
                  'vl_media_ultimo_concurso', 'vl_media_penultimo_concurso',
-                 'frequencias_medias')
+                 'frequencias_medias', 'medias_sorteios')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -62,20 +71,16 @@ class ComputeMediana(AbstractCompute):
         self.ultimas_medias_percentos: Optional[list[float]] = None
         self.vl_media_ultimo_concurso: int = 0
         self.vl_media_penultimo_concurso: int = 0
+        self.medias_sorteios: Optional[list[int]] = None
         self.frequencias_medias: Optional[list[SerieSorteio]] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
         super().setup(parms)
 
-        # efetua analise de todas as combinacoes de jogos da loteria:
+        # obtem o histograma de todas as combinacoes de jogos, contabilizado em passo unico:
         qtd_items: int = round(math.sqrt(self.qtd_bolas))  # vai depender do valor da ultima bola
-        self.medias_jogos = cb.new_list_int(qtd_items)
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # calcula a raiz-media de cada combinacao de jogo:
-            numero: int = cb.root_mean(jogo)
-            self.medias_jogos[numero] += 1
+        self.medias_jogos = hj.get_histograma('mediana', self.qtd_bolas, self.qtd_bolas_sorteio)
 
         # contabiliza o percentual das raiz-medias:
         self.medias_percentos = cb.new_list_float(qtd_items)
@@ -95,23 +100,61 @@ class ComputeMediana(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = round(math.sqrt(self.qtd_bolas))  # vai depender do valor da ultima bola
 
         # calcula a raiz-media de cada sorteio dos concursos:
+        self.concursos_computados = list(concursos)
         self.medias_concursos = cb.new_list_int(qtd_items)
         self.ultimas_medias_repetidas = cb.new_list_int(qtd_items)
         self.vl_media_ultimo_concurso = -1
         self.vl_media_penultimo_concurso = -1
+        self.medias_sorteios = []  # raiz-media de cada sorteio, na ordem dos concursos
+        self.frequencias_medias = cb.new_list_series(qtd_items)
         for concurso in concursos:
-            vl_media: int = cb.root_mean(concurso.bolas)
-            self.medias_concursos[vl_media] += 1
-            # verifica se repetiu a raiz-media do ultimo concurso:
-            if vl_media == self.vl_media_ultimo_concurso:
-                self.ultimas_medias_repetidas[vl_media] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.vl_media_penultimo_concurso = self.vl_media_ultimo_concurso
-            self.vl_media_ultimo_concurso = vl_media
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza os percentuais e os atrasos ainda nao fechados das raiz-medias:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        vl_media: int = cb.root_mean(concurso.bolas)
+        self.medias_concursos[vl_media] += 1
+        # verifica se repetiu a raiz-media do ultimo concurso:
+        if vl_media == self.vl_media_ultimo_concurso:
+            self.ultimas_medias_repetidas[vl_media] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.vl_media_penultimo_concurso = self.vl_media_ultimo_concurso
+        self.vl_media_ultimo_concurso = vl_media
+        self.medias_sorteios.append(vl_media)
+
+        # contabiliza a raiz-media do concurso:
+        self.frequencias_medias[vl_media].add_sorteio(concurso.id_concurso)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        vl_media: int = self.medias_sorteios.pop()
+        self.medias_concursos[vl_media] -= 1
+
+        # restaura os flags a partir dos valores dos concursos anteriores:
+        self.vl_media_ultimo_concurso = self.medias_sorteios[-1] \
+            if len(self.medias_sorteios) > 0 else -1
+        self.vl_media_penultimo_concurso = self.medias_sorteios[-2] \
+            if len(self.medias_sorteios) > 1 else -1
+        if vl_media == self.vl_media_ultimo_concurso:
+            self.ultimas_medias_repetidas[vl_media] -= 1
+
+        # retira o concurso da frequencia do valor, se outro sorteio de mesmo id nao o registrou:
+        qtd_sorteios: int = len(self.get_sorteios_concurso(concurso.id_concurso))
+        if qtd_sorteios == 0 or vl_media not in self.medias_sorteios[-qtd_sorteios:]:
+            self.frequencias_medias[vl_media].pop_sorteio(concurso.id_concurso)
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = round(math.sqrt(self.qtd_bolas))  # vai depender do valor da ultima bola
 
         # contabiliza o percentual das ultimas raiz-medias:
         self.ultimas_medias_percentos = cb.new_list_float(qtd_items)
@@ -119,23 +162,44 @@ class ComputeMediana(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimas_medias_percentos[key] = percent
 
-        # contabiliza as frequencias e atrasos das raiz-medias em todos os sorteios ja realizados:
-        self.frequencias_medias = cb.new_list_series(qtd_items)
-        for concurso in concursos:
-            # contabiliza a raiz-media do concurso:
-            vl_media = cb.root_mean(concurso.bolas)
-            self.frequencias_medias[vl_media].add_sorteio(concurso.id_concurso)
-
         # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
         for serie in self.frequencias_medias[1:]:  # nao ha raiz-media com zero
             # vai aproveitar e contabilizar as medidas estatisticas para a raiz-media:
             serie.last_sorteio(ultimo_concurso.id_concurso)
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.medias_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        for serie in self.frequencias_medias[1:]:
+            serie.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_medias[1:]:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -148,6 +212,9 @@ class ComputeMediana(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende da raiz-media do jogo:
         vl_media: int = cb.root_mean(jogo)
+        return self.fator_eval(vl_media)
+
+    def eval_valor(self, vl_media: int) -> float:
         percent: float = self.medias_percentos[vl_media]
 
         # ignora valores muito baixos de probabilidade:
@@ -176,6 +243,9 @@ class ComputeMediana(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende da raiz-media do jogo:
         vl_media: int = cb.root_mean(jogo)
+        return self.fator_evaluate(vl_media)
+
+    def evaluate_valor(self, vl_media: int) -> float:
         percent: float = self.medias_percentos[vl_media]
 
         # ignora valores muito baixos de probabilidade:
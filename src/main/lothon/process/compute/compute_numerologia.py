@@ -14,15 +14,16 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats import distribuicao as dj
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -33,6 +34,15 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# as numerologias (raiz digital das somas) sao obtidas da distribuicao dos somatorios:
+hj.registrar_provedor('numerologia', lambda qtd_bolas, qtd_bolas_sorteio: 9,
+                      dj.dist_numerologias)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -46,7 +56,7 @@ class ComputeNumerologia(AbstractCompute):
     __slots__ = ('numerologias_jogos', 'numerologias_percentos', 'numerologias_concursos',
                  'ultimas_numerologias_repetidas', 'ultimas_numerologias_percentos',
                  'vl_numerologia_ultimo_concurso', 'vl_numerologia_penultimo_concurso',
-                 'frequencias_numerologias')
+                 'frequencias_numerologias', 'numerologias_sorteios')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -61,20 +71,17 @@ class ComputeNumerologia(AbstractCompute):
         self.ultimas_numerologias_percentos: Optional[list[float]] = None
         self.vl_numerologia_ultimo_concurso: int = 0
         self.vl_numerologia_penultimo_concurso: int = 0
+        self.numerologias_sorteios: Optional[list[int]] = None
         self.frequencias_numerologias: Optional[list[SerieSorteio]] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
         super().setup(parms)
 
-        # efetua analise de todas as combinacoes de jogos da loteria:
+        # obtem o histograma de todas as combinacoes de jogos, contabilizado em passo unico:
         qtd_items: int = 9  # numero de zero a nove
-        self.numerologias_jogos = cb.new_list_int(qtd_items)
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # calcula a numerologia de cada combinacao de jogo:
-            numero: int = cb.calc_numerology(jogo)
-            self.numerologias_jogos[numero] += 1
+        self.numerologias_jogos = hj.get_histograma('numerologia', self.qtd_bolas,
+                                                    self.qtd_bolas_sorteio)
 
         # contabiliza o percentual das numerologias:
         self.numerologias_percentos = cb.new_list_float(qtd_items)
@@ -95,23 +102,61 @@ class ComputeNumerologia(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = 9  # numero de zero a nove
 
         # calcula a numerologia de cada sorteio dos concursos:
+        self.concursos_computados = list(concursos)
         self.numerologias_concursos = cb.new_list_int(qtd_items)
         self.ultimas_numerologias_repetidas = cb.new_list_int(qtd_items)
         self.vl_numerologia_ultimo_concurso = -1
         self.vl_numerologia_penultimo_concurso = -1
+        self.numerologias_sorteios = []  # numerologia de cada sorteio, na ordem dos concursos
+        self.frequencias_numerologias = cb.new_list_series(qtd_items)
         for concurso in concursos:
-            vl_numerologia: int = cb.calc_numerology(concurso.bolas)
-            self.numerologias_concursos[vl_numerologia] += 1
-            # verifica se repetiu a numerologia do ultimo concurso:
-            if vl_numerologia == self.vl_numerologia_ultimo_concurso:
-                self.ultimas_numerologias_repetidas[vl_numerologia] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.vl_numerologia_penultimo_concurso = self.vl_numerologia_ultimo_concurso
-            self.vl_numerologia_ultimo_concurso = vl_numerologia
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza os percentuais e os atrasos ainda nao fechados das numerologias:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        vl_numerologia: int = cb.calc_numerology(concurso.bolas)
+        self.numerologias_concursos[vl_numerologia] += 1
+        # verifica se repetiu a numerologia do ultimo concurso:
+        if vl_numerologia == self.vl_numerologia_ultimo_concurso:
+            self.ultimas_numerologias_repetidas[vl_numerologia] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.vl_numerologia_penultimo_concurso = self.vl_numerologia_ultimo_concurso
+        self.vl_numerologia_ultimo_concurso = vl_numerologia
+        self.numerologias_sorteios.append(vl_numerologia)
+
+        # contabiliza a numerologia do concurso:
+        self.frequencias_numerologias[vl_numerologia].add_sorteio(concurso.id_concurso)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        vl_numerologia: int = self.numerologias_sorteios.pop()
+        self.numerologias_concursos[vl_numerologia] -= 1
+
+        # restaura os flags a partir dos valores dos concursos anteriores:
+        self.vl_numerologia_ultimo_concurso = self.numerologias_sorteios[-1] \
+            if len(self.numerologias_sorteios) > 0 else -1
+        self.vl_numerologia_penultimo_concurso = self.numerologias_sorteios[-2] \
+            if len(self.numerologias_sorteios) > 1 else -1
+        if vl_numerologia == self.vl_numerologia_ultimo_concurso:
+            self.ultimas_numerologias_repetidas[vl_numerologia] -= 1
+
+        # retira o concurso da frequencia do valor, se outro sorteio de mesmo id nao o registrou:
+        qtd_sorteios: int = len(self.get_sorteios_concurso(concurso.id_concurso))
+        if qtd_sorteios == 0 or vl_numerologia not in self.numerologias_sorteios[-qtd_sorteios:]:
+            self.frequencias_numerologias[vl_numerologia].pop_sorteio(concurso.id_concurso)
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = 9  # numero de zero a nove
 
         # contabiliza o percentual das ultimas numerologias:
         self.ultimas_numerologias_percentos = cb.new_list_float(qtd_items)
@@ -119,23 +164,44 @@ class ComputeNumerologia(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimas_numerologias_percentos[key] = percent
 
-        # contabiliza as frequencias e atrasos das numerologias em todos os sorteios ja realizados:
-        self.frequencias_numerologias = cb.new_list_series(qtd_items)
-        for concurso in concursos:
-            # contabiliza a numerologia do concurso:
-            vl_numerologia = cb.calc_numerology(concurso.bolas)
-            self.frequencias_numerologias[vl_numerologia].add_sorteio(concurso.id_concurso)
-
         # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
         for serie in self.frequencias_numerologias[1:]:  # nao ha numerologia com zero
             # vai aproveitar e contabilizar as medidas estatisticas para a numerologia:
             serie.last_sorteio(ultimo_concurso.id_concurso)
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.numerologias_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        for serie in self.frequencias_numerologias[1:]:
+            serie.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_numerologias[1:]:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -148,6 +214,9 @@ class ComputeNumerologia(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende da numerologia do jogo:
         vl_numerologia: int = cb.calc_numerology(jogo)
+        return self.fator_eval(vl_numerologia)
+
+    def eval_valor(self, vl_numerologia: int) -> float:
         percent: float = self.numerologias_percentos[vl_numerologia]
 
         # ignora valores muito baixos de probabilidade:
@@ -176,6 +245,9 @@ class ComputeNumerologia(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende da numerologia do jogo:
         vl_numerologia: int = cb.calc_numerology(jogo)
+        return self.fator_evaluate(vl_numerologia)
+
+    def evaluate_valor(self, vl_numerologia: int) -> float:
         percent: float = self.numerologias_percentos[vl_numerologia]
 
         # ignora valores muito baixos de probabilidade:
@@ -14,7 +14,6 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
@@ -44,7 +43,8 @@ class ComputeOrdinal(AbstractCompute):
 
     # --- PROPRIEDADES -------------------------------------------------------
     __slots__ = ('ordinais_concursos', 'ordinais_percentos', 'parciais_concursos',
-                 'fracoes_concursos', 'vl_ordinal_ultimo_concurso')
+                 'fracoes_concursos', 'ordinais_sorteios', 'fracoes_sorteios',
+                 'vl_ordinal_ultimo_concurso')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -56,6 +56,8 @@ class ComputeOrdinal(AbstractCompute):
         self.parciais_concursos: Optional[list[int]] = None
         self.fracoes_concursos: Optional[list[int]] = None
         self.ordinais_percentos: Optional[list[float]] = None
+        self.ordinais_sorteios: Optional[list[int]] = None
+        self.fracoes_sorteios: Optional[list[int]] = None
 
         # estruturas para avaliacao de jogo combinado da loteria:
         self.vl_ordinal_ultimo_concurso: Optional[int] = None
@@ -74,64 +76,124 @@ class ComputeOrdinal(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        ultimo_concurso: Concurso = concursos[-1]
         qtd_concursos: int = len(concursos)
         qtd_items: int = qtd_concursos
 
-        # primeiro organiza dicionario com todos os concursos:
-        sorteios_literal: dict[str: int] = {}
-        for concurso in concursos:
-            bolas_str: str = cb.to_string(concurso.bolas)
-            sorteios_literal[bolas_str] = concurso.id_concurso
-
         # efetua analise de todas as combinacoes de jogos da loteria:
+        self.concursos_computados = list(concursos)
         self.ordinais_concursos = cb.new_list_int(qtd_items)
         self.parciais_concursos = cb.new_list_int(self.qtd_jogos // 100000)
 
-        # para cada concurso, vai atribuir o respectivo ordinal das combinacoes de jogos da loteria:
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        ordinal_jogo: int = 0
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            ordinal_jogo += 1  # primeiro jogo ira comecar do #1
-
-            # procura no dicionario de literais o jogo corrente:
-            bolas_str: str = cb.to_string(jogo)
-            id_concurso: int = sorteios_literal.get(bolas_str, -1)
-            if id_concurso > 0:
-                self.ordinais_concursos[id_concurso] = ordinal_jogo
-                self.parciais_concursos[ordinal_jogo // 100000] += 1
-
-        # salva o ordinal do ultimo concurso para o EVALUATE posterior:
-        self.vl_ordinal_ultimo_concurso = self.ordinais_concursos[ultimo_concurso.id_concurso]
+        # para cada concurso, calcula diretamente o ordinal de suas dezenas nas combinacoes de
+        # jogos da loteria, sem precisar percorrer todas as combinacoes:
+        self.ordinais_sorteios = []  # ordinal de cada sorteio, na ordem dos concursos
+        for concurso in concursos:
+            self.contabilizar_concurso(concurso)
 
         # calcula o diferencial em percentual entre o concurso e os demais abaixo e acima:
         self.fracoes_concursos = cb.new_list_int(9)
-        vl_ordinal_anterior: int = self.ordinais_concursos[1]  # ordinal do primeiro concurso
-        for concurso in concursos:
+        self.fracoes_sorteios = []  # fracao diferencial de cada sorteio, na ordem dos concursos
+        self.contabilizar_fracoes(0)
+
+        # calcula os percentuais de cada fracao diferencial:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        ordinal_jogo: int = cb.rank(concurso.bolas, self.qtd_bolas, self.qtd_bolas_sorteio)
+        self.ordinais_sorteios.append(ordinal_jogo)
+        if ordinal_jogo > 0:
+            # nos sorteios duplos (Dupla Sena), prevalece o maior ordinal do concurso:
+            id_concurso: int = concurso.id_concurso
+            if ordinal_jogo > self.ordinais_concursos[id_concurso]:
+                self.ordinais_concursos[id_concurso] = ordinal_jogo
+            self.parciais_concursos[ordinal_jogo // 100000] += 1
+
+    # (re)calcula as fracoes diferenciais dos sorteios a partir da posicao indicada, pois o
+    # ordinal de cada concurso pode mudar com o sorteio seguinte de mesmo id (Dupla Sena):
+    def contabilizar_fracoes(self, inicio: int):
+        for fracao in self.fracoes_sorteios[inicio:]:
+            self.fracoes_concursos[fracao] -= 1
+        del self.fracoes_sorteios[inicio:]
+
+        # ordinal do concurso anterior (no inicio, o ordinal do primeiro concurso):
+        if inicio > 0:
+            vl_ordinal_anterior: int = \
+                self.ordinais_concursos[self.concursos_computados[inicio - 1].id_concurso]
+        else:
+            vl_ordinal_anterior: int = self.ordinais_concursos[1]
+        for concurso in self.concursos_computados[inicio:]:
             idx: int = concurso.id_concurso
             # verifica o ordinal do concurso atual e diferenca com ordinal do anterior:
             vl_ordinal_atual: int = self.ordinais_concursos[idx]  # esta sincronizado com concursos
             dif_ordinal_anterior: int = abs(vl_ordinal_atual - vl_ordinal_anterior)
             faixa_percent_abaixo: int = round((dif_ordinal_anterior / self.qtd_jogos) * 100) // 10
             self.fracoes_concursos[faixa_percent_abaixo] += 1
+            self.fracoes_sorteios.append(faixa_percent_abaixo)
 
             # atualiza o anterior (atual) para a proxima iteracao:
             vl_ordinal_anterior = vl_ordinal_atual
 
+    def finalizar_concursos(self):
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
+        qtd_concursos: int = len(self.concursos_computados)
+
+        # salva o ordinal do ultimo concurso para o EVALUATE posterior:
+        self.vl_ordinal_ultimo_concurso = self.ordinais_concursos[ultimo_concurso.id_concurso]
+
         # calcula os percentuais de cada fracao diferencial:
         self.ordinais_percentos = cb.new_list_float(9)
         for key, value in enumerate(self.fracoes_concursos):
             self.ordinais_percentos[key] = round((value / qtd_concursos) * 10000) / 100
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.ordinais_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # os sorteios anteriores de mesmo id tem as fracoes recalculadas com o novo ordinal:
+        qtd_sorteios: int = len(self.get_sorteios_concurso(concurso.id_concurso))
+        self.concursos_computados.append(concurso)
+        self.ordinais_concursos.append(0)
+        self.contabilizar_concurso(concurso)
+        self.contabilizar_fracoes(len(self.concursos_computados) - 1 - qtd_sorteios)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        ordinal_jogo: int = self.ordinais_sorteios.pop()
+        if ordinal_jogo > 0:
+            self.parciais_concursos[ordinal_jogo // 100000] -= 1
+
+        # o ordinal do id volta a ser o maior entre os sorteios anteriores de mesmo id:
+        qtd_sorteios: int = len(self.get_sorteios_concurso(concurso.id_concurso))
+        self.ordinais_concursos[concurso.id_concurso] = \
+            max(self.ordinais_sorteios[len(self.ordinais_sorteios) - qtd_sorteios:], default=0)
+        del self.ordinais_concursos[-1]
+
+        self.contabilizar_fracoes(len(self.concursos_computados) - qtd_sorteios)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
-        # eh preciso processar novamente a computacao para novos calculos de rate e eval.
-        self.execute(concursos)
+        # eh preciso atualizar a computacao para novos calculos de rate e eval:
+        self.atualizar_concursos(concursos)
 
     def rate(self, ordinal: int, jogo: tuple) -> int:
         dif_ordinal_anterior: int = abs(ordinal - self.vl_ordinal_ultimo_concurso)
@@ -141,6 +203,9 @@ class ComputeOrdinal(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         dif_ordinal_anterior: int = abs(ordinal - self.vl_ordinal_ultimo_concurso)
         faixa_percent_abaixo: int = round((dif_ordinal_anterior / self.qtd_jogos) * 100) // 10
+        return self.fator_eval(faixa_percent_abaixo)
+
+    def eval_valor(self, faixa_percent_abaixo: int) -> float:
         percent: float = self.ordinais_percentos[faixa_percent_abaixo]
 
         # ignora valores muito baixos de probabilidade:
@@ -155,6 +220,9 @@ class ComputeOrdinal(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         dif_ordinal_anterior: int = abs(ordinal - self.vl_ordinal_ultimo_concurso)
         faixa_percent_abaixo: int = round((dif_ordinal_anterior / self.qtd_jogos) * 100) // 10
+        return self.fator_evaluate(faixa_percent_abaixo)
+
+    def evaluate_valor(self, faixa_percent_abaixo: int) -> float:
         percent: float = self.ordinais_percentos[faixa_percent_abaixo]
 
         # ignora valores muito baixos de probabilidade:
@@ -14,7 +14,6 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
@@ -23,6 +22,7 @@ from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -33,6 +33,15 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# contabiliza a paridade de cada combinacao de jogo no passo unico dos histogramas:
+hj.registrar_contador('paridade', lambda qtd_bolas, qtd_bolas_sorteio: qtd_bolas_sorteio,
+                      cb.count_pares)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -46,7 +55,7 @@ class ComputeParidade(AbstractCompute):
     __slots__ = ('paridades_jogos', 'paridades_percentos', 'paridades_concursos',
                  'ultimas_paridades_repetidas', 'ultimas_paridades_percentos',
                  'qtd_pares_ultimo_concurso', 'qtd_pares_penultimo_concurso',
-                 'frequencias_paridades')
+                 'frequencias_paridades', 'paridades_sorteios')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -61,20 +70,16 @@ class ComputeParidade(AbstractCompute):
         self.ultimas_paridades_percentos: Optional[list[float]] = None
         self.qtd_pares_ultimo_concurso: int = 0
         self.qtd_pares_penultimo_concurso: int = 0
+        self.paridades_sorteios: Optional[list[int]] = None
         self.frequencias_paridades: Optional[list[SerieSorteio]] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
         super().setup(parms)
 
-        # efetua analise de todas as combinacoes de jogos da loteria:
+        # obtem o histograma de todas as combinacoes de jogos, contabilizado em passo unico:
         qtd_items: int = self.qtd_bolas_sorteio
-        self.paridades_jogos = cb.new_list_int(qtd_items)
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # contabiliza pares (e impares) de cada combinacao de jogo:
-            qtd_pares: int = cb.count_pares(jogo)
-            self.paridades_jogos[qtd_pares] += 1
+        self.paridades_jogos = hj.get_histograma('paridade', self.qtd_bolas, self.qtd_bolas_sorteio)
 
         # contabiliza o percentual das paridades:
         self.paridades_percentos = cb.new_list_float(qtd_items)
@@ -92,23 +97,61 @@ class ComputeParidade(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = self.qtd_bolas_sorteio
 
         # contabiliza os pares (e impares) de cada sorteio dos concursos:
+        self.concursos_computados = list(concursos)
         self.paridades_concursos = cb.new_list_int(qtd_items)
         self.ultimas_paridades_repetidas = cb.new_list_int(qtd_items)
         self.qtd_pares_ultimo_concurso = -1
         self.qtd_pares_penultimo_concurso = -1
+        self.paridades_sorteios = []  # pares de cada sorteio, na ordem dos concursos
+        self.frequencias_paridades = cb.new_list_series(qtd_items)
         for concurso in concursos:
-            qtd_pares: int = cb.count_pares(concurso.bolas)
-            self.paridades_concursos[qtd_pares] += 1
-            # verifica se repetiu a paridade do ultimo concurso:
-            if qtd_pares == self.qtd_pares_ultimo_concurso:
-                self.ultimas_paridades_repetidas[qtd_pares] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.qtd_pares_penultimo_concurso = self.qtd_pares_ultimo_concurso
-            self.qtd_pares_ultimo_concurso = qtd_pares
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza os percentuais e os atrasos ainda nao fechados das paridades:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        qtd_pares: int = cb.count_pares(concurso.bolas)
+        self.paridades_concursos[qtd_pares] += 1
+        # verifica se repetiu a paridade do ultimo concurso:
+        if qtd_pares == self.qtd_pares_ultimo_concurso:
+            self.ultimas_paridades_repetidas[qtd_pares] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.qtd_pares_penultimo_concurso = self.qtd_pares_ultimo_concurso
+        self.qtd_pares_ultimo_concurso = qtd_pares
+        self.paridades_sorteios.append(qtd_pares)
+
+        # contabiliza o numero de paridades do concurso:
+        self.frequencias_paridades[qtd_pares].add_sorteio(concurso.id_concurso)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        qtd_pares: int = self.paridades_sorteios.pop()
+        self.paridades_concursos[qtd_pares] -= 1
+
+        # restaura os flags a partir dos valores dos concursos anteriores:
+        self.qtd_pares_ultimo_concurso = self.paridades_sorteios[-1] \
+            if len(self.paridades_sorteios) > 0 else -1
+        self.qtd_pares_penultimo_concurso = self.paridades_sorteios[-2] \
+            if len(self.paridades_sorteios) > 1 else -1
+        if qtd_pares == self.qtd_pares_ultimo_concurso:
+            self.ultimas_paridades_repetidas[qtd_pares] -= 1
+
+        # retira o concurso da frequencia do valor, se outro sorteio de mesmo id nao o registrou:
+        qtd_sorteios: int = len(self.get_sorteios_concurso(concurso.id_concurso))
+        if qtd_sorteios == 0 or qtd_pares not in self.paridades_sorteios[-qtd_sorteios:]:
+            self.frequencias_paridades[qtd_pares].pop_sorteio(concurso.id_concurso)
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = self.qtd_bolas_sorteio
 
         # contabiliza o percentual das ultimas paridades:
         self.ultimas_paridades_percentos = cb.new_list_float(qtd_items)
@@ -116,23 +159,44 @@ class ComputeParidade(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimas_paridades_percentos[key] = percent
 
-        # contabiliza as frequencias e atrasos das paridades em todos os sorteios ja realizados:
-        self.frequencias_paridades = cb.new_list_series(qtd_items)
-        for concurso in concursos:
-            # contabiliza o numero de paridades do concurso:
-            qtd_pares = cb.count_pares(concurso.bolas)
-            self.frequencias_paridades[qtd_pares].add_sorteio(concurso.id_concurso)
-
         # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
         for serie in self.frequencias_paridades:
             # vai aproveitar e contabilizar as medidas estatisticas para a paridade:
             serie.last_sorteio(ultimo_concurso.id_concurso)
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.paridades_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        for serie in self.frequencias_paridades:
+            serie.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_paridades:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -145,6 +209,9 @@ class ComputeParidade(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de pares no jogo:
         qt_pares: int = cb.count_pares(jogo)
+        return self.fator_eval(qt_pares)
+
+    def eval_valor(self, qt_pares: int) -> float:
         percent: float = self.paridades_percentos[qt_pares]
 
         # ignora valores muito baixos de probabilidade:
@@ -172,6 +239,9 @@ class ComputeParidade(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de pares no jogo:
         qt_pares: int = cb.count_pares(jogo)
+        return self.fator_evaluate(qt_pares)
+
+    def evaluate_valor(self, qt_pares: int) -> float:
         percent: float = self.paridades_percentos[qt_pares]
 
         # ignora valores muito baixos de probabilidade:
@@ -68,20 +68,61 @@ class ComputePremiacao(AbstractCompute):
             _startWatch = startwatch()
 
         # contabiliza as frequencias e atrasos das dezenas em todos os sorteios ja realizados:
+        self.concursos_computados = list(concursos)
         self.frequencia_premiacoes = SerieSorteio(0)
         for concurso in concursos:
-            # verifica se houve ganhador na premiacao principal:
-            if concurso.get_ganhadores_premio(self.qtd_bolas_sorteio) > 0:
-                self.frequencia_premiacoes.add_sorteio(concurso.id_concurso, True)
+            self.contabilizar_concurso(concurso)
 
         # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
-        self.frequencia_premiacoes.last_sorteio(ultimo_concurso.id_concurso)
+        self.finalizar_concursos()
 
         _stopWatch = stopwatch(_startWatch)
         logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
         return 0
 
+    # verifica se houve ganhador na premiacao principal:
+    def has_premiacao(self, concurso: Concurso) -> bool:
+        return concurso.get_ganhadores_premio(self.qtd_bolas_sorteio) > 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        if self.has_premiacao(concurso):
+            self.frequencia_premiacoes.add_sorteio(concurso.id_concurso, True)
+
+    def finalizar_concursos(self):
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
+        self.frequencia_premiacoes.last_sorteio(ultimo_concurso.id_concurso)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz o atraso ainda nao fechado, que sera contabilizado com o novo concurso:
+        self.frequencia_premiacoes.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
+        return 0
+
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        self.frequencia_premiacoes.undo_last_sorteio(concurso.id_concurso)
+
+        # retira a premiacao, se outro sorteio de mesmo id tambem nao teve ganhador:
+        if self.has_premiacao(concurso) and \
+                not any(map(self.has_premiacao, self.get_sorteios_concurso(concurso.id_concurso))):
+            self.frequencia_premiacoes.pop_sorteio(concurso.id_concurso, True)
+
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS (NAO SE APLICA AQUI) ------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -21,6 +21,7 @@ import logging
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
 from lothon.domain import Concurso
+from lothon.stats.recorrencia import IndiceRecorrencias
 from lothon.process.compute.abstract_compute import AbstractCompute
 
 
@@ -43,7 +44,8 @@ class ComputeRecorrencia(AbstractCompute):
 
     # --- PROPRIEDADES -------------------------------------------------------
     __slots__ = ('recorrencias_concursos', 'recorrencias_percentos',
-                 'concursos_passados')
+                 'recorrencias_sorteios', 'qtd_recorrencias_sorteios',
+                 'concursos_passados', 'indice_passados')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -53,9 +55,12 @@ class ComputeRecorrencia(AbstractCompute):
         # estruturas para a coleta de dados a partir do processamento de analise:
         self.recorrencias_concursos: Optional[list[int]] = None
         self.recorrencias_percentos: Optional[list[float]] = None
+        self.recorrencias_sorteios: Optional[list[int]] = None
+        self.qtd_recorrencias_sorteios: Optional[list[int]] = None
 
         # estruturas para avaliacao de jogo combinado da loteria:
         self.concursos_passados: Optional[list[Concurso]] = None
+        self.indice_passados: Optional[IndiceRecorrencias] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
@@ -71,41 +76,127 @@ class ComputeRecorrencia(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = self.qtd_bolas_sorteio
 
         # salva os concursos analisados ate o momento para o EVALUATE posterior:
-        self.concursos_passados = concursos
+        self.concursos_computados = list(concursos)
+        self.set_concursos_passados(self.concursos_computados)
 
         # contabiliza o maximo de repeticoes das dezenas de cada sorteio dos concursos:
         self.recorrencias_concursos = cb.new_list_int(qtd_items)
-        for concurso in concursos:
-            qt_max_repeticoes: int = cb.max_recorrencias(concurso.bolas, concursos,
-                                                         concurso.id_concurso)  # ignora o atual
+        self.recorrencias_sorteios = []  # maximo de repeticoes de cada sorteio
+        self.qtd_recorrencias_sorteios = []  # quantos concursos atingem o maximo de cada sorteio
+        for posicao, concurso in enumerate(concursos):
+            # ignora o proprio concurso ao contabilizar as repeticoes:
+            qt_max_repeticoes, qtd_maximos = \
+                self.indice_passados.max_recorrencias_qtd(concurso.bolas, posicao)
             self.recorrencias_concursos[qt_max_repeticoes] += 1
+            self.recorrencias_sorteios.append(qt_max_repeticoes)
+            self.qtd_recorrencias_sorteios.append(qtd_maximos)
+
+        # contabiliza o percentual das recorrencias e tabela os fatores:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    # atualiza o maximo de repeticoes do sorteio na posicao, apos recalcula-lo pelo indice:
+    def recontar_recorrencias(self, posicao: int):
+        self.recorrencias_concursos[self.recorrencias_sorteios[posicao]] -= 1
+        qt_max_repeticoes, qtd_maximos = self.indice_passados.max_recorrencias_qtd(
+            self.concursos_computados[posicao].bolas, posicao)
+        self.recorrencias_concursos[qt_max_repeticoes] += 1
+        self.recorrencias_sorteios[posicao] = qt_max_repeticoes
+        self.qtd_recorrencias_sorteios[posicao] = qtd_maximos
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
 
         # contabiliza o percentual das recorrencias:
-        self.recorrencias_percentos = cb.new_list_float(qtd_items)
+        self.recorrencias_percentos = cb.new_list_float(self.qtd_bolas_sorteio)
         for key, value in enumerate(self.recorrencias_concursos):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.recorrencias_percentos[key] = percent
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.recorrencias_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    # o novo concurso apenas pode aumentar o maximo de repeticoes dos sorteios anteriores, entao
+    # basta comparar as repeticoes de cada sorteio com o novo concurso:
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        bolas_concurso: set[int] = set(concurso.bolas)
+        for posicao, anterior in enumerate(self.concursos_computados):
+            qt_repeticoes: int = sum(map(bolas_concurso.__contains__, anterior.bolas))
+            qt_max_repeticoes: int = self.recorrencias_sorteios[posicao]
+            if qt_repeticoes > qt_max_repeticoes:
+                self.recorrencias_concursos[qt_max_repeticoes] -= 1
+                self.recorrencias_concursos[qt_repeticoes] += 1
+                self.recorrencias_sorteios[posicao] = qt_repeticoes
+                self.qtd_recorrencias_sorteios[posicao] = 1
+            elif qt_repeticoes == qt_max_repeticoes:
+                self.qtd_recorrencias_sorteios[posicao] += 1
+
+        # indexa o novo concurso e contabiliza seu maximo de repeticoes nos anteriores:
+        self.concursos_computados.append(concurso)
+        self.indice_passados.add_concurso(concurso)
+        posicao: int = len(self.concursos_computados) - 1
+        qt_max_repeticoes, qtd_maximos = \
+            self.indice_passados.max_recorrencias_qtd(concurso.bolas, posicao)
+        self.recorrencias_concursos[qt_max_repeticoes] += 1
+        self.recorrencias_sorteios.append(qt_max_repeticoes)
+        self.qtd_recorrencias_sorteios.append(qtd_maximos)
+
+        self.finalizar_concursos()
         return 0
 
+    # apenas os sorteios cujo maximo de repeticoes ocorria somente no concurso retirado precisam
+    # ser recalculados pelo indice:
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        self.indice_passados.pop_concurso(concurso)
+        self.recorrencias_concursos[self.recorrencias_sorteios.pop()] -= 1
+        self.qtd_recorrencias_sorteios.pop()
+
+        bolas_concurso: set[int] = set(concurso.bolas)
+        for posicao, anterior in enumerate(self.concursos_computados):
+            qt_repeticoes: int = sum(map(bolas_concurso.__contains__, anterior.bolas))
+            if qt_repeticoes == self.recorrencias_sorteios[posicao]:
+                self.qtd_recorrencias_sorteios[posicao] -= 1
+                if self.qtd_recorrencias_sorteios[posicao] == 0:
+                    self.recontar_recorrencias(posicao)
+
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
         self.concursos_passados = concursos
+        # indexa os concursos por dezena para nao percorrer o historico a cada jogo:
+        self.indice_passados = IndiceRecorrencias(self.qtd_bolas, concursos)
 
     def rate(self, ordinal: int, jogo: tuple) -> int:
-        qt_max_repeticoes: int = cb.max_recorrencias(jogo, self.concursos_passados)
+        qt_max_repeticoes: int = self.indice_passados.max_recorrencias(jogo)
         return qt_max_repeticoes
 
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero maximo de repeticoes nos concursos anteriores:
-        qt_max_repeticoes: int = cb.max_recorrencias(jogo, self.concursos_passados)
+        qt_max_repeticoes: int = self.indice_passados.max_recorrencias(jogo)
+        return self.fator_eval(qt_max_repeticoes)
+
+    def eval_valor(self, qt_max_repeticoes: int) -> float:
         percent: float = self.recorrencias_percentos[qt_max_repeticoes]
 
         # ignora valores muito baixos de probabilidade:
@@ -119,7 +210,10 @@ class ComputeRecorrencia(AbstractCompute):
 
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero maximo de repeticoes nos concursos anteriores:
-        qt_max_repeticoes: int = cb.max_recorrencias(jogo, self.concursos_passados)
+        qt_max_repeticoes: int = self.indice_passados.max_recorrencias(jogo)
+        return self.fator_evaluate(qt_max_repeticoes)
+
+    def evaluate_valor(self, qt_max_repeticoes: int) -> float:
         percent: float = self.recorrencias_percentos[qt_max_repeticoes]
 
         # ignora valores muito baixos de probabilidade:
@@ -131,4 +225,15 @@ class ComputeRecorrencia(AbstractCompute):
         fator_percent: float = to_fator(percent)
         return fator_percent
 
+    # --- AVALIACAO EM LOTE --------------------------------------------------
+
+    # os jogos do lote compartilham as somas das dezenas em comum com o jogo anterior:
+    def eval_batch(self, ordinais: list[int], jogos: list[tuple]) -> list[float]:
+        return [self.fator_eval(qt_max_repeticoes) for qt_max_repeticoes
+                in self.indice_passados.max_recorrencias_lote(jogos)]
+
+    def evaluate_batch(self, ordinais: list[int], jogos: list[tuple]) -> list[float]:
+        return [self.fator_evaluate(qt_max_repeticoes) for qt_max_repeticoes
+                in self.indice_passados.max_recorrencias_lote(jogos)]
+
 # ----------------------------------------------------------------------------
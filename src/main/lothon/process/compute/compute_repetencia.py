@@ -20,6 +20,7 @@ import logging
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats.mascara import count_acertos_dezenas
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
 
@@ -45,7 +46,8 @@ class ComputeRepetencia(AbstractCompute):
     __slots__ = ('repetencias_concursos', 'repetencias_percentos', 'repetencias_series',
                  'ultimas_repetencias_repetidas', 'ultimas_repetencias_percentos',
                  'qtd_repetencias_ultimo_concurso', 'qtd_repetencias_penultimo_concurso',
-                 'frequencias_repetencias', 'ultimo_sorteio')
+                 'frequencias_repetencias', 'repetencias_sorteios',
+                 'ultimo_sorteio', 'mascara_ultimo_sorteio')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -60,10 +62,12 @@ class ComputeRepetencia(AbstractCompute):
         self.ultimas_repetencias_percentos: Optional[list[float]] = None
         self.qtd_repetencias_ultimo_concurso: int = 0
         self.qtd_repetencias_penultimo_concurso: int = 0
+        self.repetencias_sorteios: Optional[list[int]] = None
         self.frequencias_repetencias: Optional[list[SerieSorteio]] = None
 
         # estruturas para avaliacao de jogo combinado da loteria:
         self.ultimo_sorteio: Optional[tuple[int, ...]] = None
+        self.mascara_ultimo_sorteio: int = 0
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
@@ -79,37 +83,78 @@ class ComputeRepetencia(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        ultimo_concurso: Concurso = concursos[-1]
-        qtd_concursos: int = len(concursos)
         qtd_items: int = self.qtd_bolas_sorteio
 
-        # salva o sorteio do ultimo concurso para o EVALUATE posterior:
-        self.ultimo_sorteio = ultimo_concurso.bolas
-
         # zera os contadores de cada repetencia:
+        self.concursos_computados = list(concursos)
         self.repetencias_concursos = cb.new_list_int(qtd_items)
         self.repetencias_series = cb.new_list_series(qtd_items)
         self.frequencias_repetencias = cb.new_list_series(self.qtd_bolas)
         self.ultimas_repetencias_repetidas = cb.new_list_int(qtd_items)
+        self.repetencias_sorteios = []  # repetencia de cada sorteio, na ordem dos concursos
 
         # contabiliza repetencias de cada sorteio com todos os sorteios anteriores:
-        concurso_anterior: Concurso = concursos[0]
         self.qtd_repetencias_ultimo_concurso = -1
         self.qtd_repetencias_penultimo_concurso = -1
-        for concurso in concursos[1:]:
-            qt_repeticoes: int = cb.count_repeticoes(concurso.bolas,
-                                                     concurso_anterior.bolas,
-                                                     self.frequencias_repetencias,
-                                                     concurso.id_concurso)
-            self.repetencias_concursos[qt_repeticoes] += 1
-            self.repetencias_series[qt_repeticoes].add_sorteio(concurso.id_concurso)
-            concurso_anterior = concurso
-            # verifica se repetiu a repetencia do ultimo concurso:
-            if qt_repeticoes == self.qtd_repetencias_ultimo_concurso:
-                self.ultimas_repetencias_repetidas[qt_repeticoes] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.qtd_repetencias_penultimo_concurso = self.qtd_repetencias_ultimo_concurso
-            self.qtd_repetencias_ultimo_concurso = qt_repeticoes
+        for concurso_anterior, concurso in zip(concursos, concursos[1:]):
+            self.contabilizar_concurso(concurso, concurso_anterior)
+
+        # contabiliza os percentuais e os atrasos ainda nao fechados das repetencias:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso, concurso_anterior: Concurso):
+        qt_repeticoes: int = cb.count_repeticoes(concurso.bolas,
+                                                 concurso_anterior.bolas,
+                                                 self.frequencias_repetencias,
+                                                 concurso.id_concurso)
+        self.repetencias_concursos[qt_repeticoes] += 1
+        self.repetencias_series[qt_repeticoes].add_sorteio(concurso.id_concurso)
+        self.repetencias_sorteios.append(qt_repeticoes)
+        # verifica se repetiu a repetencia do ultimo concurso:
+        if qt_repeticoes == self.qtd_repetencias_ultimo_concurso:
+            self.ultimas_repetencias_repetidas[qt_repeticoes] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.qtd_repetencias_penultimo_concurso = self.qtd_repetencias_ultimo_concurso
+        self.qtd_repetencias_ultimo_concurso = qt_repeticoes
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        qt_repeticoes: int = self.repetencias_sorteios.pop()
+        self.repetencias_concursos[qt_repeticoes] -= 1
+
+        # restaura os flags a partir das repetencias dos concursos anteriores:
+        self.qtd_repetencias_ultimo_concurso = self.repetencias_sorteios[-1] \
+            if len(self.repetencias_sorteios) > 0 else -1
+        self.qtd_repetencias_penultimo_concurso = self.repetencias_sorteios[-2] \
+            if len(self.repetencias_sorteios) > 1 else -1
+        if qt_repeticoes == self.qtd_repetencias_ultimo_concurso:
+            self.ultimas_repetencias_repetidas[qt_repeticoes] -= 1
+
+        # os registros por id sao mantidos se outro sorteio de mesmo id tambem os registrou:
+        qtd_sorteios: int = len(self.get_sorteios_concurso(concurso.id_concurso))
+        if qtd_sorteios == 0 or qt_repeticoes not in self.repetencias_sorteios[-qtd_sorteios:]:
+            self.repetencias_series[qt_repeticoes].pop_sorteio(concurso.id_concurso)
+
+        # as dezenas repetidas de cada sorteio sao as que tambem ocorreram no sorteio anterior:
+        computados: list[Concurso] = self.concursos_computados
+        registradas: set[int] = set()
+        for idx in range(max(len(computados) - qtd_sorteios, 1), len(computados)):
+            registradas.update(set(computados[idx].bolas) & set(computados[idx - 1].bolas))
+        for dezena in (set(concurso.bolas) & set(computados[-1].bolas)) - registradas:
+            self.frequencias_repetencias[dezena].pop_sorteio(concurso.id_concurso)
+
+    def finalizar_concursos(self):
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = self.qtd_bolas_sorteio
+
+        # salva o sorteio do ultimo concurso para o EVALUATE posterior:
+        self.ultimo_sorteio = ultimo_concurso.bolas
+        self.mascara_ultimo_sorteio = ultimo_concurso.mascara
 
         # contabiliza o percentual das repetencias:
         self.repetencias_percentos = cb.new_list_float(qtd_items)
@@ -132,22 +177,55 @@ class ComputeRepetencia(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimas_repetencias_percentos[key] = percent
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.repetencias_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        concurso_anterior: Concurso = self.concursos_computados[-1]
+        for serie in self.frequencias_repetencias[1:]:
+            serie.undo_last_sorteio(concurso_anterior.id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso, concurso_anterior)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_repetencias[1:]:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
         self.ultimo_sorteio = concursos[-1].bolas
+        self.mascara_ultimo_sorteio = concursos[-1].mascara
 
     def rate(self, ordinal: int, jogo: tuple) -> int:
-        qt_repeticoes: int = cb.count_dezenas_repetidas(jogo, self.ultimo_sorteio)
+        qt_repeticoes: int = count_acertos_dezenas(jogo, self.mascara_ultimo_sorteio)
         return qt_repeticoes
 
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de repeticoes no jogo:
-        qt_repeticoes: int = cb.count_dezenas_repetidas(jogo, self.ultimo_sorteio)
+        qt_repeticoes: int = count_acertos_dezenas(jogo, self.mascara_ultimo_sorteio)
+        return self.fator_eval(qt_repeticoes)
+
+    def eval_valor(self, qt_repeticoes: int) -> float:
         percent: float = self.repetencias_percentos[qt_repeticoes]
 
         # ignora valores muito baixos de probabilidade:
@@ -175,7 +253,10 @@ class ComputeRepetencia(AbstractCompute):
 
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de repeticoes no jogo:
-        qt_repeticoes: int = cb.count_dezenas_repetidas(jogo, self.ultimo_sorteio)
+        qt_repeticoes: int = count_acertos_dezenas(jogo, self.mascara_ultimo_sorteio)
+        return self.fator_evaluate(qt_repeticoes)
+
+    def evaluate_valor(self, qt_repeticoes: int) -> float:
         percent: float = self.repetencias_percentos[qt_repeticoes]
 
         # ignora valores muito baixos de probabilidade:
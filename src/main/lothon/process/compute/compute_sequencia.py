@@ -14,15 +14,16 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats import distribuicao as dj
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -33,6 +34,15 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# as sequencias de todas as combinacoes de jogos sao obtidas pelos blocos de dezenas:
+hj.registrar_provedor('sequencia', lambda qtd_bolas, qtd_bolas_sorteio: qtd_bolas_sorteio - 1,
+                      dj.dist_sequencias)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -46,7 +56,7 @@ class ComputeSequencia(AbstractCompute):
     __slots__ = ('sequencias_jogos', 'sequencias_percentos', 'sequencias_concursos',
                  'ultimas_sequencias_repetidas', 'ultimas_sequencias_percentos',
                  'qtd_sequencias_ultimo_concurso', 'qtd_sequencias_penultimo_concurso',
-                 'frequencias_sequencias')
+                 'frequencias_sequencias', 'sequencias_sorteios')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -61,20 +71,17 @@ class ComputeSequencia(AbstractCompute):
         self.ultimas_sequencias_percentos: Optional[list[float]] = None
         self.qtd_sequencias_ultimo_concurso: int = 0
         self.qtd_sequencias_penultimo_concurso: int = 0
+        self.sequencias_sorteios: Optional[list[int]] = None
         self.frequencias_sequencias: Optional[list[SerieSorteio]] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
         super().setup(parms)
 
-        # efetua analise de todas as combinacoes de jogos da loteria:
+        # obtem o histograma de todas as combinacoes de jogos, contabilizado em passo unico:
         qtd_items: int = self.qtd_bolas_sorteio - 1
-        self.sequencias_jogos = cb.new_list_int(qtd_items)
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # contabiliza sequencias de cada combinacao de jogo:
-            qt_sequencias = cb.count_sequencias(jogo)
-            self.sequencias_jogos[qt_sequencias] += 1
+        self.sequencias_jogos = hj.get_histograma('sequencia', self.qtd_bolas,
+                                                  self.qtd_bolas_sorteio)
 
         # contabiliza o percentual das sequencias:
         self.sequencias_percentos = cb.new_list_float(qtd_items)
@@ -92,23 +99,61 @@ class ComputeSequencia(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = self.qtd_bolas_sorteio - 1
 
         # contabiliza sequencias de cada sorteio dos concursos:
+        self.concursos_computados = list(concursos)
         self.sequencias_concursos = cb.new_list_int(qtd_items)
         self.ultimas_sequencias_repetidas = cb.new_list_int(qtd_items)
         self.qtd_sequencias_ultimo_concurso = -1
         self.qtd_sequencias_penultimo_concurso = -1
+        self.sequencias_sorteios = []  # sequencias de cada sorteio, na ordem dos concursos
+        self.frequencias_sequencias = cb.new_list_series(qtd_items)
         for concurso in concursos:
-            qt_sequencias: int = cb.count_sequencias(concurso.bolas)
-            self.sequencias_concursos[qt_sequencias] += 1
-            # verifica se repetiu o numero de sequencias do ultimo concurso:
-            if qt_sequencias == self.qtd_sequencias_ultimo_concurso:
-                self.ultimas_sequencias_repetidas[qt_sequencias] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.qtd_sequencias_penultimo_concurso = self.qtd_sequencias_ultimo_concurso
-            self.qtd_sequencias_ultimo_concurso = qt_sequencias
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza os percentuais e os atrasos ainda nao fechados das sequencias:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        qt_sequencias: int = cb.count_sequencias(concurso.bolas, ordenadas=True)
+        self.sequencias_concursos[qt_sequencias] += 1
+        # verifica se repetiu o numero de sequencias do ultimo concurso:
+        if qt_sequencias == self.qtd_sequencias_ultimo_concurso:
+            self.ultimas_sequencias_repetidas[qt_sequencias] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.qtd_sequencias_penultimo_concurso = self.qtd_sequencias_ultimo_concurso
+        self.qtd_sequencias_ultimo_concurso = qt_sequencias
+        self.sequencias_sorteios.append(qt_sequencias)
+
+        # contabiliza o numero de sequencias do concurso:
+        self.frequencias_sequencias[qt_sequencias].add_sorteio(concurso.id_concurso)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        qt_sequencias: int = self.sequencias_sorteios.pop()
+        self.sequencias_concursos[qt_sequencias] -= 1
+
+        # restaura os flags a partir dos valores dos concursos anteriores:
+        self.qtd_sequencias_ultimo_concurso = self.sequencias_sorteios[-1] \
+            if len(self.sequencias_sorteios) > 0 else -1
+        self.qtd_sequencias_penultimo_concurso = self.sequencias_sorteios[-2] \
+            if len(self.sequencias_sorteios) > 1 else -1
+        if qt_sequencias == self.qtd_sequencias_ultimo_concurso:
+            self.ultimas_sequencias_repetidas[qt_sequencias] -= 1
+
+        # retira o concurso da frequencia do valor, se outro sorteio de mesmo id nao o registrou:
+        qtd_sorteios: int = len(self.get_sorteios_concurso(concurso.id_concurso))
+        if qtd_sorteios == 0 or qt_sequencias not in self.sequencias_sorteios[-qtd_sorteios:]:
+            self.frequencias_sequencias[qt_sequencias].pop_sorteio(concurso.id_concurso)
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = self.qtd_bolas_sorteio - 1
 
         # contabiliza o percentual das ultimas sequencias:
         self.ultimas_sequencias_percentos = cb.new_list_float(qtd_items)
@@ -116,35 +161,59 @@ class ComputeSequencia(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimas_sequencias_percentos[key] = percent
 
-        # contabiliza as frequencias e atrasos das sequencias em todos os sorteios ja realizados:
-        self.frequencias_sequencias = cb.new_list_series(qtd_items)
-        for concurso in concursos:
-            # contabiliza o numero de sequencias do concurso:
-            qt_sequencias = cb.count_sequencias(concurso.bolas)
-            self.frequencias_sequencias[qt_sequencias].add_sorteio(concurso.id_concurso)
-
         # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
         for serie in self.frequencias_sequencias:
             # vai aproveitar e contabilizar as medidas estatisticas para a sequencia:
             serie.last_sorteio(ultimo_concurso.id_concurso)
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.sequencias_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        for serie in self.frequencias_sequencias:
+            serie.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_sequencias:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
         return  # nada a fazer aqui...
 
     def rate(self, ordinal: int, jogo: tuple) -> int:
-        qt_sequencias: int = cb.count_sequencias(jogo)
+        qt_sequencias: int = cb.count_sequencias(jogo, ordenadas=True)
         return qt_sequencias
 
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de sequencias no jogo:
-        qt_sequencias: int = cb.count_sequencias(jogo)
+        qt_sequencias: int = cb.count_sequencias(jogo, ordenadas=True)
+        return self.fator_eval(qt_sequencias)
+
+    def eval_valor(self, qt_sequencias: int) -> float:
         percent: float = self.sequencias_percentos[qt_sequencias]
 
         # ignora valores muito baixos de probabilidade:
@@ -172,7 +241,10 @@ class ComputeSequencia(AbstractCompute):
 
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do numero de sequencias no jogo:
-        qt_sequencias: int = cb.count_sequencias(jogo)
+        qt_sequencias: int = cb.count_sequencias(jogo, ordenadas=True)
+        return self.fator_evaluate(qt_sequencias)
+
+    def evaluate_valor(self, qt_sequencias: int) -> float:
         percent: float = self.sequencias_percentos[qt_sequencias]
 
         # ignora valores muito baixos de probabilidade:
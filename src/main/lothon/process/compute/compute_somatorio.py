@@ -14,15 +14,16 @@ __all__ = [
 
 # Built-in/Generic modules
 from typing import Optional
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats import distribuicao as dj
 from lothon.domain import Concurso
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
 
 
 # ----------------------------------------------------------------------------
@@ -33,6 +34,16 @@ from lothon.process.compute.abstract_compute import AbstractCompute
 logger = logging.getLogger(__name__)
 
 
+# ----------------------------------------------------------------------------
+# FEATURES DOS JOGOS
+# ----------------------------------------------------------------------------
+
+# os somatorios de todas as combinacoes de jogos sao obtidos por programacao dinamica:
+hj.registrar_provedor('somatorio', lambda qtd_bolas, qtd_bolas_sorteio:
+                      sum(range(qtd_bolas - qtd_bolas_sorteio + 1, qtd_bolas + 1)) + 1,
+                      dj.dist_somatorios)
+
+
 # ----------------------------------------------------------------------------
 # CLASSE CONCRETA
 # ----------------------------------------------------------------------------
@@ -45,7 +56,8 @@ class ComputeSomatorio(AbstractCompute):
     # --- PROPRIEDADES -------------------------------------------------------
     __slots__ = ('somatorios_jogos', 'somatorios_percentos', 'somatorios_concursos', 
                  'ultimos_somatorios_repetidos', 'ultimos_somatorios_percentos',
-                 'vl_somatorio_ultimo_concurso', 'vl_somatorio_penultimo_concurso')
+                 'vl_somatorio_ultimo_concurso', 'vl_somatorio_penultimo_concurso',
+                 'somatorios_sorteios')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -60,20 +72,17 @@ class ComputeSomatorio(AbstractCompute):
         self.ultimos_somatorios_percentos: Optional[list[float]] = None
         self.vl_somatorio_ultimo_concurso: int = 0
         self.vl_somatorio_penultimo_concurso: int = 0
+        self.somatorios_sorteios: Optional[list[int]] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
         super().setup(parms)
 
-        # efetua analise de todas as combinacoes de jogos da loteria:
+        # obtem o histograma de todas as combinacoes de jogos, contabilizado em passo unico:
         qtd_items: int = sum(range(self.qtd_bolas - self.qtd_bolas_sorteio + 1,
                                    self.qtd_bolas + 1)) + 1  # soma 1 para nao usar zero-index.
-        self.somatorios_jogos = cb.new_list_int(qtd_items)
-        range_jogos: range = range(1, self.qtd_bolas + 1)
-        for jogo in itt.combinations(range_jogos, self.qtd_bolas_sorteio):
-            # contabiliza a somatorio de cada combinacao de jogo:
-            soma_dezenas = cb.soma_dezenas(jogo)
-            self.somatorios_jogos[soma_dezenas] += 1
+        self.somatorios_jogos = hj.get_histograma('somatorio', self.qtd_bolas,
+                                                  self.qtd_bolas_sorteio)
 
         # contabiliza o percentual dos somatorios:
         self.somatorios_percentos = cb.new_list_float(qtd_items)
@@ -91,24 +100,54 @@ class ComputeSomatorio(AbstractCompute):
             _startWatch = startwatch()
 
         # identifica informacoes da loteria:
-        qtd_concursos: int = len(concursos)
         qtd_items: int = sum(range(self.qtd_bolas - self.qtd_bolas_sorteio + 1,
                                    self.qtd_bolas + 1)) + 1  # soma 1 para nao usar zero-index.
 
         # contabiliza a somatorio de cada sorteio dos concursos:
+        self.concursos_computados = list(concursos)
         self.somatorios_concursos = cb.new_list_int(qtd_items)
         self.ultimos_somatorios_repetidos = cb.new_list_int(qtd_items)
         self.vl_somatorio_ultimo_concurso = -1
         self.vl_somatorio_penultimo_concurso = -1
+        self.somatorios_sorteios = []  # somatorio de cada sorteio, na ordem dos concursos
         for concurso in concursos:
-            vl_somatorio = cb.soma_dezenas(concurso.bolas)
-            self.somatorios_concursos[vl_somatorio] += 1
-            # verifica se repetiu o somatorio do ultimo concurso:
-            if vl_somatorio == self.vl_somatorio_ultimo_concurso:
-                self.ultimos_somatorios_repetidos[vl_somatorio] += 1
-            # atualiza ambos flags, para ultimo e penultimo concursos
-            self.vl_somatorio_penultimo_concurso = self.vl_somatorio_ultimo_concurso
-            self.vl_somatorio_ultimo_concurso = vl_somatorio
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza o percentual dos ultimos somatorios e tabela os fatores:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        vl_somatorio = cb.soma_dezenas(concurso.bolas)
+        self.somatorios_concursos[vl_somatorio] += 1
+        # verifica se repetiu o somatorio do ultimo concurso:
+        if vl_somatorio == self.vl_somatorio_ultimo_concurso:
+            self.ultimos_somatorios_repetidos[vl_somatorio] += 1
+        # atualiza ambos flags, para ultimo e penultimo concursos
+        self.vl_somatorio_penultimo_concurso = self.vl_somatorio_ultimo_concurso
+        self.vl_somatorio_ultimo_concurso = vl_somatorio
+        self.somatorios_sorteios.append(vl_somatorio)
+
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        vl_somatorio: int = self.somatorios_sorteios.pop()
+        self.somatorios_concursos[vl_somatorio] -= 1
+
+        # restaura os flags a partir dos valores dos concursos anteriores:
+        self.vl_somatorio_ultimo_concurso = self.somatorios_sorteios[-1] \
+            if len(self.somatorios_sorteios) > 0 else -1
+        self.vl_somatorio_penultimo_concurso = self.somatorios_sorteios[-2] \
+            if len(self.somatorios_sorteios) > 1 else -1
+        if vl_somatorio == self.vl_somatorio_ultimo_concurso:
+            self.ultimos_somatorios_repetidos[vl_somatorio] -= 1
+
+    def finalizar_concursos(self):
+        qtd_concursos: int = len(self.concursos_computados)
+        qtd_items: int = sum(range(self.qtd_bolas - self.qtd_bolas_sorteio + 1,
+                                   self.qtd_bolas + 1)) + 1  # soma 1 para nao usar zero-index.
 
         # contabiliza o percentual dos ultimos somatorios:
         self.ultimos_somatorios_percentos = cb.new_list_float(qtd_items)
@@ -116,10 +155,32 @@ class ComputeSomatorio(AbstractCompute):
             percent: float = round((value / qtd_concursos) * 10000) / 100
             self.ultimos_somatorios_percentos[key] = percent
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        # tabela o fator de cada valor da feature, para avaliar os jogos sem recalcula-lo:
+        self.tabelar_fatores(len(self.somatorios_percentos),
+                             self.eval_valor, self.evaluate_valor)
+
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
@@ -132,6 +193,9 @@ class ComputeSomatorio(AbstractCompute):
     def eval(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do somatorio das dezenas do jogo:
         vl_somatorio: int = cb.soma_dezenas(jogo)
+        return self.fator_eval(vl_somatorio)
+
+    def eval_valor(self, vl_somatorio: int) -> float:
         percent: float = self.somatorios_percentos[vl_somatorio]
 
         # ignora valores muito baixos de probabilidade:
@@ -160,6 +224,9 @@ class ComputeSomatorio(AbstractCompute):
     def evaluate(self, ordinal: int, jogo: tuple) -> float:
         # probabilidade de acerto depende do somatorio das dezenas do jogo:
         vl_somatorio: int = cb.soma_dezenas(jogo)
+        return self.fator_evaluate(vl_somatorio)
+
+    def evaluate_valor(self, vl_somatorio: int) -> float:
         percent: float = self.somatorios_percentos[vl_somatorio]
 
         # ignora valores muito baixos de probabilidade:
@@ -20,6 +20,7 @@ import logging
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats.ranking import RankingFrequencia, RankingAusencia
 from lothon.domain import Concurso, SerieSorteio
 from lothon.process.compute.abstract_compute import AbstractCompute
 
@@ -42,7 +43,8 @@ class ComputeUnitario(AbstractCompute):
     """
 
     # --- PROPRIEDADES -------------------------------------------------------
-    __slots__ = ('frequencias_meses', 'topos_frequentes', 'topos_ausentes')
+    __slots__ = ('frequencias_meses', 'topos_frequentes', 'topos_ausentes',
+                 'ranking_frequencias', 'ranking_ausencias')
 
     # --- INICIALIZACAO ------------------------------------------------------
 
@@ -53,6 +55,8 @@ class ComputeUnitario(AbstractCompute):
         self.frequencias_meses: Optional[list[SerieSorteio]] = None
         self.topos_frequentes: Optional[list[int]] = None
         self.topos_ausentes: Optional[list[int]] = None
+        self.ranking_frequencias: Optional[RankingFrequencia] = None
+        self.ranking_ausencias: Optional[RankingAusencia] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
@@ -72,26 +76,75 @@ class ComputeUnitario(AbstractCompute):
         qtd_items: int = self.qtd_bolas
 
         # contabiliza as frequencias e atrasos dos meses em todos os sorteios ja realizados:
+        self.concursos_computados = list(concursos)
         self.frequencias_meses = cb.new_list_series(qtd_items)
+
+        # os rankings das dezenas sao atualizados a cada concurso, sem recontar os anteriores:
+        self.ranking_frequencias = RankingFrequencia(self.qtd_bolas)
+        self.ranking_ausencias = RankingAusencia(self.qtd_bolas)
         for concurso in concursos:
-            # registra o concurso para cada dezena sorteada:
-            mes_da_sorte: int = concurso.bolas[0]
-            self.frequencias_meses[mes_da_sorte].add_sorteio(concurso.id_concurso)
+            self.contabilizar_concurso(concurso)
+
+        # contabiliza os atrasos ainda nao fechados e extrai os topos dos rankings:
+        self.finalizar_concursos()
+
+        _stopWatch = stopwatch(_startWatch)
+        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+        return 0
+
+    def contabilizar_concurso(self, concurso: Concurso):
+        # registra o concurso para cada dezena sorteada:
+        mes_da_sorte: int = concurso.bolas[0]
+        self.frequencias_meses[mes_da_sorte].add_sorteio(concurso.id_concurso)
+
+        self.ranking_frequencias.add_sorteio(concurso.bolas)
+        self.ranking_ausencias.add_sorteio(concurso.bolas)
 
+    # desfaz o contabilizar_concurso() do ultimo concurso, ja retirado dos concursos computados:
+    def estornar_concurso(self, concurso: Concurso):
+        self.estornar_series(self.frequencias_meses, concurso, lambda c: c.bolas[0:1])
+        self.ranking_frequencias.remove_sorteio(concurso.bolas)
+        self.ranking_ausencias.pop_sorteio()
+
+    def finalizar_concursos(self):
         # registra o ultimo concurso para contabilizar os atrasos ainda nao fechados:
-        ultimo_concurso: Concurso = concursos[-1]
+        ultimo_concurso: Concurso = self.concursos_computados[-1]
         for serie in self.frequencias_meses[1:]:
             # vai aproveitar e contabilizar as medidas estatisticas para cada mes:
             serie.last_sorteio(ultimo_concurso.id_concurso)
 
         # extrai os topos do ranking com as dezenas com maior frequencia em todos os concursos:
-        self.topos_frequentes = cb.calc_topos_frequencia(concursos, self.qtd_bolas)
-        self.topos_ausentes = cb.calc_topos_ausencia(concursos, self.qtd_bolas)
+        self.topos_frequentes = self.ranking_frequencias.get_topos()
+        self.topos_ausentes = self.ranking_ausencias.get_topos()
 
-        _stopWatch = stopwatch(_startWatch)
-        logger.info(f"Tempo para executar {self.id_process.upper()}: {_stopWatch}")
+    # --- ATUALIZACAO INCREMENTAL ---------------------------------------------
+
+    def append_concurso(self, concurso: Concurso) -> int:
+        # valida se possui concursos ja computados:
+        if not self.check_append_concurso(concurso):
+            return -1
+
+        # desfaz os atrasos ainda nao fechados, que serao contabilizados com o novo concurso:
+        for serie in self.frequencias_meses[1:]:
+            serie.undo_last_sorteio(self.concursos_computados[-1].id_concurso)
+
+        self.concursos_computados.append(concurso)
+        self.contabilizar_concurso(concurso)
+        self.finalizar_concursos()
         return 0
 
+    def pop_concurso(self) -> Optional[Concurso]:
+        # valida se possui concursos ja computados, alem do primeiro:
+        if not self.check_pop_concurso():
+            return None
+
+        concurso: Concurso = self.concursos_computados.pop()
+        for serie in self.frequencias_meses[1:]:
+            serie.undo_last_sorteio(concurso.id_concurso)
+        self.estornar_concurso(concurso)
+        self.finalizar_concursos()
+        return concurso
+
     # --- ANALISE E AVALIACAO DE JOGOS ---------------------------------------
 
     def set_concursos_passados(self, concursos: list[Concurso]):
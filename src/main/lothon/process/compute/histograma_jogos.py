@@ -0,0 +1,284 @@
+"""
+   Package lothon.process.compute
+   Module  histograma_jogos.py
+
+   Histogramas das caracteristicas (features) de todas as combinacoes de jogos de uma loteria.
+   Cada computacao registra sua feature, e todas sao contabilizadas em um passo unico sobre
+   as combinacoes, enumeradas em lotes, mantendo os histogramas por geometria da loteria.
+   As features com distribuicao analitica (provedores) dispensam a enumeracao. Se o numero de
+   combinacoes exceder o limite configurado, as demais features sao estimadas por amostragem
+   aleatoria uniforme dos jogos, com intervalos de confianca para cada indice do histograma.
+   Os histogramas sao persistidos em cache, sendo recontabilizadas apenas as features
+   ausentes ou com versao diferente da gravada.
+"""
+
+__all__ = [
+    'registrar_contador',
+    'registrar_acumulador',
+    'registrar_provedor',
+    'get_histograma',
+    'get_intervalos'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from collections import Counter, namedtuple
+from collections.abc import Callable, Iterator
+from statistics import NormalDist
+import itertools as itt
+import random
+import math
+import os
+import logging
+
+# Libs/Frameworks modules
+# Own/Project modules
+from lothon.util.eve import *
+from lothon.conf import app_config
+from lothon.infra import cache_histogramas
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# quantidade de combinacoes de jogos enumeradas e contabilizadas a cada lote:
+TAMANHO_LOTE: int = 100_000
+
+# tipos de features, conforme a forma de contabilizacao do histograma:
+TIPO_CONTADOR: str = 'contador'
+TIPO_ACUMULADOR: str = 'acumulador'
+TIPO_PROVEDOR: str = 'provedor'
+
+
+# ----------------------------------------------------------------------------
+# VARIAVEIS GLOBAIS
+# ----------------------------------------------------------------------------
+
+# obtem uma instancia do logger para o modulo corrente:
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------------
+# ESTRUTURAS DE DADOS
+# ----------------------------------------------------------------------------
+
+# feature registrada por uma computacao:
+#   tamanho(qtd_bolas, qtd_bolas_sorteio) -> maior indice do histograma
+#   funcao(jogo) -> indice a contabilizar (contador), funcao(jogo, histograma) (acumulador),
+#       ou funcao(qtd_bolas, qtd_bolas_sorteio) -> quantidade de jogos por indice (provedor)
+#   versao: deve ser incrementada sempre que a funcao for alterada, invalidando o cache
+Feature = namedtuple('Feature', 'chave tamanho funcao tipo versao')
+
+# features registradas, na ordem de registro:
+_features: dict[str, Feature] = {}
+
+# histogramas ja contabilizados, por geometria (qtd_bolas, qtd_bolas_sorteio) da loteria:
+_histogramas: dict[tuple[int, int], dict[str, list[int]]] = {}
+
+# intervalos de confianca (inferior, superior) dos histogramas estimados por amostragem:
+_intervalos: dict[tuple[int, int], dict[str, list[tuple[int, int]]]] = {}
+
+
+# ----------------------------------------------------------------------------
+# REGISTRO DAS FEATURES
+# ----------------------------------------------------------------------------
+
+# a feature contabiliza uma ocorrencia no indice retornado para cada combinacao de jogo:
+def registrar_contador(chave: str, tamanho: Callable[[int, int], int],
+                       funcao: Callable[[tuple], int], versao: int = 1) -> None:
+    _features[chave] = Feature(chave, tamanho, funcao, TIPO_CONTADOR, versao)
+
+
+# a feature recebe o histograma e contabiliza diretamente cada combinacao de jogo:
+def registrar_acumulador(chave: str, tamanho: Callable[[int, int], int],
+                         funcao: Callable[[tuple, list[int]], None], versao: int = 1) -> None:
+    _features[chave] = Feature(chave, tamanho, funcao, TIPO_ACUMULADOR, versao)
+
+
+# a feature fornece diretamente o histograma, calculado sem enumerar as combinacoes de jogos:
+def registrar_provedor(chave: str, tamanho: Callable[[int, int], int],
+                       funcao: Callable[[int, int], list[int]], versao: int = 1) -> None:
+    _features[chave] = Feature(chave, tamanho, funcao, TIPO_PROVEDOR, versao)
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+# identifica o path do arquivo de histogramas de determinada geometria de loteria:
+def get_path_histogramas(qtd_bolas: int, qtd_bolas_sorteio: int) -> str | None:
+    # sem a configuracao carregada, os histogramas ficam apenas em memoria:
+    if not app_config.DS_histogramas_bin_name:
+        return None
+
+    histogramas_bin_file: str = app_config.DS_histogramas_bin_name.format(qtd_bolas,
+                                                                          qtd_bolas_sorteio)
+    return os.path.join(app_config.DS_cache_path, histogramas_bin_file)
+
+
+# aproveita do cache apenas os histogramas das features registradas com a mesma versao:
+def carregar_histogramas(path_histogramas: str, qtd_bolas: int,
+                         qtd_bolas_sorteio: int) -> dict[str, list[int]]:
+    gravados = cache_histogramas.carregar_histogramas(path_histogramas, qtd_bolas,
+                                                      qtd_bolas_sorteio)
+
+    histogramas: dict[str, list[int]] = {}
+    for chave, (versao, histograma) in gravados.items():
+        feature: Feature = _features.get(chave)
+        if feature is not None and feature.versao == versao and \
+                len(histograma) == feature.tamanho(qtd_bolas, qtd_bolas_sorteio) + 1:
+            histogramas[chave] = histograma
+
+    if len(histogramas) > 0:
+        logger.info(f"Carregados {len(histogramas)} histogramas das combinacoes de jogos "
+                    f"({qtd_bolas}/{qtd_bolas_sorteio}) a partir de '{path_histogramas}'.")
+    return histogramas
+
+
+# gera jogos aleatorios (dezenas ordenadas), com sementes fixas para reproduzir as estimativas:
+def gerar_amostras(qtd_bolas: int, qtd_bolas_sorteio: int, tamanho_amostra: int) -> Iterator:
+    rng: random.Random = random.Random(qtd_bolas * 1000 + qtd_bolas_sorteio)
+    range_jogos: range = range(1, qtd_bolas + 1)
+    for _ in range(0, tamanho_amostra):
+        yield tuple(sorted(rng.sample(range_jogos, qtd_bolas_sorteio)))
+
+
+# intervalo de confianca de Wilson para a proporcao observada na amostra, em qtd de jogos:
+def calc_intervalo(qtd_amostra: int, total_amostra: int, qtd_jogos: int,
+                   z: float) -> tuple[int, int]:
+    proporcao: float = qtd_amostra / total_amostra
+    z2n: float = z * z / total_amostra
+    centro: float = (proporcao + z2n / 2) / (1 + z2n)
+    margem: float = z * math.sqrt(proporcao * (1 - proporcao) / total_amostra +
+                                  z2n / (4 * total_amostra)) / (1 + z2n)
+    return max(0, math.floor((centro - margem) * qtd_jogos)), \
+        min(qtd_jogos, math.ceil((centro + margem) * qtd_jogos))
+
+
+# extrapola os histogramas da amostra para todas as combinacoes de jogos da loteria:
+def estimar_histogramas(histogramas: dict[str, list[int]], tamanho_amostra: int,
+                        qtd_jogos: int) -> dict[str, list[tuple[int, int]]]:
+    z: float = NormalDist().inv_cdf(0.5 + app_config.CP_nivel_confianca / 2)
+
+    intervalos: dict[str, list[tuple[int, int]]] = {}
+    for chave, histograma in histogramas.items():
+        # nos acumuladores, cada jogo pode contabilizar varios indices:
+        total_amostra: int = tamanho_amostra if _features[chave].tipo == TIPO_CONTADOR \
+            else max(sum(histograma), 1)
+        total_jogos: int = qtd_jogos * total_amostra // tamanho_amostra
+
+        intervalos[chave] = [calc_intervalo(qtd, total_amostra, total_jogos, z)
+                             for qtd in histograma]
+        histogramas[chave] = [round(qtd * total_jogos / total_amostra) for qtd in histograma]
+
+    return intervalos
+
+
+# ----------------------------------------------------------------------------
+# CONTABILIZACAO DOS HISTOGRAMAS
+# ----------------------------------------------------------------------------
+
+# percorre uma unica vez todas as combinacoes de jogos, contabilizando as features fornecidas:
+def contabilizar_features(features: list[Feature], qtd_bolas: int,
+                          qtd_bolas_sorteio: int) -> dict[str, list[int]]:
+    _startWatch = startwatch()
+
+    # os contadores sao acumulados em Counter a cada lote, e os acumuladores em listas:
+    contadores: dict[str, Counter] = {f.chave: Counter() for f in features
+                                      if f.tipo == TIPO_CONTADOR}
+    histogramas: dict[str, list[int]] = {f.chave: [0] * (f.tamanho(qtd_bolas,
+                                                                   qtd_bolas_sorteio) + 1)
+                                         for f in features}
+
+    # os provedores ja fornecem as quantidades de jogos de cada indice:
+    for feature in features:
+        if feature.tipo == TIPO_PROVEDOR:
+            histograma: list[int] = histogramas[feature.chave]
+            for indice, qtd in enumerate(feature.funcao(qtd_bolas, qtd_bolas_sorteio)):
+                histograma[indice] += qtd
+
+    # as demais features sao contabilizadas em um so passo pelas combinacoes de jogos, ou por
+    # uma amostra aleatoria de jogos, se houver combinacoes demais para enumerar:
+    features = [f for f in features if f.tipo != TIPO_PROVEDOR]
+    qtd_jogos: int = math.comb(qtd_bolas, qtd_bolas_sorteio)
+    amostragem: bool = qtd_jogos > app_config.CP_limite_enumeracao
+    if amostragem:
+        combinacoes = gerar_amostras(qtd_bolas, qtd_bolas_sorteio, app_config.CP_tamanho_amostra)
+    else:
+        combinacoes = itt.combinations(range(1, qtd_bolas + 1), qtd_bolas_sorteio)
+    while len(features) > 0 and (lote := list(itt.islice(combinacoes, TAMANHO_LOTE))):
+        for feature in features:
+            if feature.tipo == TIPO_ACUMULADOR:
+                histograma: list[int] = histogramas[feature.chave]
+                funcao: Callable = feature.funcao
+                for jogo in lote:
+                    funcao(jogo, histograma)
+            else:
+                contadores[feature.chave].update(map(feature.funcao, lote))
+
+    # transfere as contagens para os histogramas, com os indices ja dimensionados:
+    for chave, contador in contadores.items():
+        histograma: list[int] = histogramas[chave]
+        for indice, qtd in contador.items():
+            histograma[indice] += qtd
+
+    # com a amostragem, os histogramas sao extrapolados e recebem os intervalos de confianca:
+    if amostragem and len(features) > 0:
+        estimados: dict[str, list[int]] = {f.chave: histogramas[f.chave] for f in features}
+        intervalos = estimar_histogramas(estimados, app_config.CP_tamanho_amostra, qtd_jogos)
+        histogramas.update(estimados)
+        _intervalos.setdefault((qtd_bolas, qtd_bolas_sorteio), {}).update(intervalos)
+        logger.info(f"Estimadas {len(features)} features das combinacoes de jogos "
+                    f"({qtd_bolas}/{qtd_bolas_sorteio}) a partir de uma amostra de "
+                    f"{formatd(app_config.CP_tamanho_amostra)} jogos aleatorios.")
+
+    _stopWatch = stopwatch(_startWatch)
+    logger.info(f"Contabilizadas {len(histogramas)} features das combinacoes de jogos "
+                f"({qtd_bolas}/{qtd_bolas_sorteio}), {len(features)} em passo unico: {_stopWatch}")
+    return histogramas
+
+
+def get_histograma(chave: str, qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    if chave not in _features:
+        raise ValueError(f"Feature '{chave}' nao registrada para os histogramas dos jogos.")
+
+    # no primeiro acesso a geometria, verifica os histogramas ja gravados em cache:
+    geometria: tuple[int, int] = (qtd_bolas, qtd_bolas_sorteio)
+    path_histogramas: str | None = get_path_histogramas(qtd_bolas, qtd_bolas_sorteio)
+    histogramas: dict[str, list[int]] = _histogramas.get(geometria)
+    if histogramas is None:
+        histogramas = {} if path_histogramas is None else \
+            carregar_histogramas(path_histogramas, qtd_bolas, qtd_bolas_sorteio)
+        _histogramas[geometria] = histogramas
+
+    # as features registradas ainda nao contabilizadas sao processadas juntas, em passo unico:
+    if chave not in histogramas:
+        pendentes: list[Feature] = [f for f in _features.values() if f.chave not in histogramas]
+        # se a feature eh analitica, nao precisa enumerar as combinacoes para as demais ainda:
+        if _features[chave].tipo == TIPO_PROVEDOR:
+            pendentes = [f for f in pendentes if f.tipo == TIPO_PROVEDOR]
+        histogramas.update(contabilizar_features(pendentes, qtd_bolas, qtd_bolas_sorteio))
+
+        # grava os histogramas exatos da geometria, para evitar nova contabilizacao:
+        if path_histogramas is not None:
+            estimados: dict[str, list[tuple[int, int]]] = _intervalos.get(geometria, {})
+            cache_histogramas.salvar_histogramas(path_histogramas, qtd_bolas, qtd_bolas_sorteio,
+                                                 {k: (_features[k].versao, v)
+                                                  for k, v in histogramas.items()
+                                                  if k not in estimados})
+
+    # retorna uma copia, para que a computacao possa altera-la livremente:
+    return list(histogramas[chave])
+
+
+# intervalos de confianca de cada indice, se o histograma foi estimado por amostragem:
+def get_intervalos(chave: str, qtd_bolas: int,
+                   qtd_bolas_sorteio: int) -> list[tuple[int, int]] | None:
+    intervalos = _intervalos.get((qtd_bolas, qtd_bolas_sorteio), {}).get(chave)
+    return None if intervalos is None else list(intervalos)
+
+# ----------------------------------------------------------------------------
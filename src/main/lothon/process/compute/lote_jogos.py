@@ -0,0 +1,305 @@
+"""
+   Package lothon.process.compute
+   Module  lote_jogos.py
+
+   Avaliacao das combinacoes de jogos em lotes: as combinacoes sao geradas em blocos de jogos
+   consecutivos e cada compute da cadeia avalia o bloco inteiro de uma vez (evaluate_batch),
+   repassando ao proximo compute apenas os jogos que ainda nao foram zerados.
+"""
+
+__all__ = [
+    'TAMANHO_LOTE_JOGOS',
+    'gerar_lotes',
+    'evaluate_lote',
+    'evaluate_faixas',
+    'evaluate_aceitos',
+    'evaluate_metricas',
+    'evaluate_fatores',
+    'get_path_fatores',
+    'salvar_fatores_jogos',
+    'abrir_fatores_jogos'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from collections.abc import Callable, Iterator
+from typing import Any, Optional
+import itertools as itt
+import math
+import os
+import logging
+
+# Libs/Frameworks modules
+# Own/Project modules
+from lothon.util.eve import *
+from lothon.conf import app_config
+from lothon.infra import cache_fatores
+from lothon.stats import combinatoria as cb
+from lothon.stats.bitset import BitsetJogos
+from lothon.stats.fatores import FatoresJogos
+from lothon.process.compute.abstract_compute import AbstractCompute
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# quantidade de jogos avaliados em cada lote, para limitar o uso de memoria:
+TAMANHO_LOTE_JOGOS: int = 100_000
+
+
+# ----------------------------------------------------------------------------
+# VARIAVEIS GLOBAIS
+# ----------------------------------------------------------------------------
+
+# obtem uma instancia do logger para o modulo corrente:
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------------
+# GERACAO E AVALIACAO DOS LOTES
+# ----------------------------------------------------------------------------
+
+# gera as combinacoes de jogos da loteria em lotes de (ordinais, jogos), com o ordinal igual a
+# numeracao sequencial das combinacoes (a partir do #1), podendo iniciar de qualquer ordinal:
+def gerar_lotes(qtd_bolas: int, qtd_bolas_sorteio: int, tamanho_lote: int = TAMANHO_LOTE_JOGOS,
+                ordinal_inicial: int = 1,
+                qtd_jogos: Optional[int] = None) -> Iterator[tuple[list[int], list[tuple]]]:
+    combinacoes: Iterator[tuple] = cb.iter_combinacoes(ordinal_inicial, qtd_bolas,
+                                                       qtd_bolas_sorteio)
+    if qtd_jogos is not None:
+        combinacoes = itt.islice(combinacoes, qtd_jogos)
+
+    vl_ordinal: int = ordinal_inicial
+    while lote := list(itt.islice(combinacoes, tamanho_lote)):
+        yield list(range(vl_ordinal, vl_ordinal + len(lote))), lote
+        vl_ordinal += len(lote)
+
+
+# aplica toda a cadeia de computes ao lote de jogos, exatamente como a avaliacao jogo a jogo:
+# o fator de cada compute multiplica a metrica e, ao zerar, o jogo nao segue para os proximos.
+# Retorna apenas os jogos nao zerados, como (ordinais, jogos, metricas):
+def evaluate_lote(compute_chain: list[AbstractCompute], ordinais: list[int],
+                  jogos: list[tuple]) -> tuple[list[int], list[tuple], list[float]]:
+    metricas: list[float] = [1.0] * len(jogos)
+    for cproc in compute_chain:
+        if len(jogos) == 0:
+            break
+
+        fatores: list[float] = cproc.evaluate_batch(ordinais, jogos)
+        metricas = [metrica * fator for metrica, fator in zip(metricas, fatores)]
+
+        # descarta de uma so vez os jogos cuja metrica zerou neste compute:
+        if 0 in metricas:
+            mantidos: list[bool] = [metrica != 0 for metrica in metricas]
+            ordinais = list(itt.compress(ordinais, mantidos))
+            jogos = list(itt.compress(jogos, mantidos))
+            metricas = list(itt.compress(metricas, mantidos))
+
+    return ordinais, jogos, metricas
+
+
+# ----------------------------------------------------------------------------
+# AVALIACAO PARALELA (SHARDS)
+# ----------------------------------------------------------------------------
+
+# o paralelismo padrao eh definido na configuracao (ou um processo por nucleo):
+def get_qtd_workers(qtd_workers: Optional[int] = None) -> int:
+    if qtd_workers is None:
+        qtd_workers = app_config.CP_qtd_workers
+    if qtd_workers <= 0:
+        qtd_workers = os.cpu_count() or 1
+
+    return qtd_workers
+
+
+# divide os ordinais em mais faixas que processos, para balancear a carga entre eles,
+# retornando cada faixa como (ordinal_inicial, qtd_jogos):
+def dividir_faixas(qtd_jogos: int, qtd_workers: int) -> list[tuple[int, int]]:
+    qtd_faixas: int = min(qtd_workers * 4, max(1, qtd_jogos // TAMANHO_LOTE_JOGOS))
+    faixas: list[tuple[int, int]] = []
+    ordinal_inicial: int = 1
+    for idx in range(0, qtd_faixas):
+        qtd_jogos_faixa: int = qtd_jogos // qtd_faixas + (1 if idx < qtd_jogos % qtd_faixas else 0)
+        faixas.append((ordinal_inicial, qtd_jogos_faixa))
+        ordinal_inicial += qtd_jogos_faixa
+
+    return faixas
+
+
+# cadeia de computes recebida por cada processo do pool, ja com os dados dos concursos:
+_compute_chain_worker: Optional[list[AbstractCompute]] = None
+
+
+# inicializa cada processo do pool com uma copia da cadeia de computes do processo principal:
+def init_worker_chain(compute_chain: list[AbstractCompute]):
+    global _compute_chain_worker
+    _compute_chain_worker = compute_chain
+
+
+# avalia uma faixa de ordinais (shard) em processo separado com a funcao de faixa fornecida,
+# retornando seu resultado e a quantidade de jogos zerados por cada compute nesta faixa:
+def evaluate_faixa_worker(evaluate_faixa: Callable[..., Any], qtd_bolas: int,
+                          qtd_bolas_sorteio: int, ordinal_inicial: int,
+                          qtd_jogos: int) -> tuple[Any, list[int]]:
+    for cproc in _compute_chain_worker:
+        cproc.qtd_zerados = 0
+
+    resultado: Any = evaluate_faixa(_compute_chain_worker, qtd_bolas, qtd_bolas_sorteio,
+                                    ordinal_inicial, qtd_jogos)
+    return resultado, [cproc.qtd_zerados for cproc in _compute_chain_worker]
+
+
+# avalia uma faixa de ordinais, retornando apenas os bits dos jogos nao zerados desta faixa,
+# com o bit i indicando o ordinal (ordinal_inicial + i):
+def evaluate_faixa_aceitos(compute_chain: list[AbstractCompute], qtd_bolas: int,
+                           qtd_bolas_sorteio: int, ordinal_inicial: int,
+                           qtd_jogos: int) -> bytearray:
+    bits_faixa: bytearray = bytearray((qtd_jogos + 7) // 8)
+    for ordinais, jogos in gerar_lotes(qtd_bolas, qtd_bolas_sorteio, TAMANHO_LOTE_JOGOS,
+                                       ordinal_inicial, qtd_jogos):
+        ordinais, _, _ = evaluate_lote(compute_chain, ordinais, jogos)
+        for ordinal in ordinais:
+            posicao: int = ordinal - ordinal_inicial
+            bits_faixa[posicao >> 3] |= 1 << (posicao & 7)
+
+    return bits_faixa
+
+
+# avalia uma faixa de ordinais, retornando os ordinais e metricas dos jogos nao zerados em
+# vetores compactos, sem as tuplas de dezenas:
+def evaluate_faixa_metricas(compute_chain: list[AbstractCompute], qtd_bolas: int,
+                            qtd_bolas_sorteio: int, ordinal_inicial: int,
+                            qtd_jogos: int) -> tuple[array, array]:
+    faixa_ordinais: array = array('Q')
+    faixa_metricas: array = array('d')
+    for ordinais, jogos in gerar_lotes(qtd_bolas, qtd_bolas_sorteio, TAMANHO_LOTE_JOGOS,
+                                       ordinal_inicial, qtd_jogos):
+        ordinais, _, metricas = evaluate_lote(compute_chain, ordinais, jogos)
+        faixa_ordinais.extend(ordinais)
+        faixa_metricas.extend(metricas)
+
+    return faixa_ordinais, faixa_metricas
+
+
+# Efetua a avaliacao de todas as combinacoes de jogos pela cadeia de computes, dividindo os
+# ordinais em faixas (shards) processadas em paralelo por evaluate_faixa(). O resultado de cada
+# faixa eh repassado a juntar_faixa(ordinal_inicial, resultado) na ordem dos ordinais, e os jogos
+# zerados sao somados em cada compute, como na avaliacao serial:
+def evaluate_faixas(compute_chain: list[AbstractCompute], qtd_bolas: int, qtd_bolas_sorteio: int,
+                    evaluate_faixa: Callable[..., Any], juntar_faixa: Callable[[int, Any], None],
+                    qtd_workers: Optional[int] = None):
+    qtd_workers = get_qtd_workers(qtd_workers)
+    qtd_jogos: int = math.comb(qtd_bolas, qtd_bolas_sorteio)
+    faixas: list[tuple[int, int]] = dividir_faixas(qtd_jogos, qtd_workers)
+
+    # com apenas um processo (ou sem computes), a avaliacao eh feita no proprio processo:
+    if qtd_workers > 1 and len(faixas) > 1 and len(compute_chain) > 0:
+        try:
+            with ProcessPoolExecutor(max_workers=qtd_workers,
+                                     initializer=init_worker_chain,
+                                     initargs=(compute_chain,)) as executor:
+                futures = [executor.submit(evaluate_faixa_worker, evaluate_faixa, qtd_bolas,
+                                           qtd_bolas_sorteio, ordinal_inicial, qtd_jogos_faixa)
+                           for ordinal_inicial, qtd_jogos_faixa in faixas]
+                resultados: list[tuple[Any, list[int]]] = [future.result() for future in futures]
+
+            # junta os resultados das faixas apenas apos todas concluirem, na ordem dos ordinais:
+            for (ordinal_inicial, _), (resultado, zerados) in zip(faixas, resultados):
+                juntar_faixa(ordinal_inicial, resultado)
+                for cproc, qtd_zerados in zip(compute_chain, zerados):
+                    cproc.qtd_zerados += qtd_zerados
+
+            logger.info(f"Avaliados os  {formatd(qtd_jogos)}  jogos em {len(faixas)} faixas "
+                        f"utilizando {qtd_workers} processo(s).")
+            return
+
+        # qualquer falha no pool apenas faz a avaliacao ser efetuada no proprio processo:
+        except Exception as ex:
+            logger.warning(f"Nao foi possivel avaliar os jogos em paralelo. ERRO: {repr(ex)}")
+
+    for ordinal_inicial, qtd_jogos_faixa in faixas:
+        juntar_faixa(ordinal_inicial, evaluate_faixa(compute_chain, qtd_bolas, qtd_bolas_sorteio,
+                                                     ordinal_inicial, qtd_jogos_faixa))
+
+
+# Efetua a avaliacao de todas as combinacoes de jogos pela cadeia de computes, retornando apenas
+# o bitset dos ordinais aceitos (jogos nao zerados), sem manter as tuplas de dezenas e as metricas
+# de cada jogo em memoria. Os bits de cada faixa sao encaixados no bitset a partir do ordinal:
+def evaluate_aceitos(compute_chain: list[AbstractCompute], qtd_bolas: int,
+                     qtd_bolas_sorteio: int, qtd_workers: Optional[int] = None) -> BitsetJogos:
+    aceitos: BitsetJogos = BitsetJogos(math.comb(qtd_bolas, qtd_bolas_sorteio))
+    evaluate_faixas(compute_chain, qtd_bolas, qtd_bolas_sorteio, evaluate_faixa_aceitos,
+                    aceitos.add_faixa, qtd_workers)
+    return aceitos
+
+
+# Efetua a avaliacao de todas as combinacoes de jogos pela cadeia de computes, retornando os
+# ordinais e metricas dos jogos nao zerados, na ordem dos ordinais, em vetores compactos:
+def evaluate_metricas(compute_chain: list[AbstractCompute], qtd_bolas: int,
+                      qtd_bolas_sorteio: int, qtd_workers: Optional[int] = None) \
+        -> tuple[array, array]:
+    todos_ordinais: array = array('Q')
+    todas_metricas: array = array('d')
+
+    def juntar_metricas(_: int, resultado: tuple[array, array]):
+        todos_ordinais.extend(resultado[0])
+        todas_metricas.extend(resultado[1])
+
+    evaluate_faixas(compute_chain, qtd_bolas, qtd_bolas_sorteio, evaluate_faixa_metricas,
+                    juntar_metricas, qtd_workers)
+    return todos_ordinais, todas_metricas
+
+
+# Efetua a avaliacao de todas as combinacoes de jogos pela cadeia de computes, registrando a
+# metrica de cada jogo no vetor denso de fatores indexado pelo ordinal, com os jogos zerados
+# mantendo o fator zero:
+def evaluate_fatores(compute_chain: list[AbstractCompute], qtd_bolas: int,
+                     qtd_bolas_sorteio: int, qtd_workers: Optional[int] = None) -> FatoresJogos:
+    fatores: FatoresJogos = FatoresJogos(qtd_bolas, qtd_bolas_sorteio)
+    evaluate_faixas(compute_chain, qtd_bolas, qtd_bolas_sorteio, evaluate_faixa_metricas,
+                    lambda _, resultado: fatores.set_fatores(*resultado), qtd_workers)
+    return fatores
+
+
+def get_path_fatores(id_loteria: str, id_concurso: int) -> Optional[str]:
+    # sem a configuracao carregada, os fatores sao mantidos apenas em memoria:
+    if not app_config.DS_fatores_bin_name:
+        return None
+
+    fatores_bin_file: str = app_config.DS_fatores_bin_name.format(id_loteria, id_concurso)
+    return os.path.join(app_config.DS_cache_path, fatores_bin_file)
+
+
+# grava os fatores computados pela cadeia de computes apos o concurso informado:
+def salvar_fatores_jogos(id_loteria: str, id_concurso: int, fatores_jogos: FatoresJogos) -> int:
+    path_fatores: Optional[str] = get_path_fatores(id_loteria, id_concurso)
+    if path_fatores is None:
+        return -1
+
+    return cache_fatores.salvar_fatores(path_fatores, fatores_jogos.qtd_bolas,
+                                        fatores_jogos.qtd_bolas_sorteio, id_concurso,
+                                        fatores_jogos.fatores)
+
+
+# retorna os fatores gravados pela cadeia de computes apos o concurso informado, mapeados do
+# arquivo, ou None se ainda nao foram computados para este concurso:
+def abrir_fatores_jogos(id_loteria: str, id_concurso: int, qtd_bolas: int,
+                        qtd_bolas_sorteio: int) -> Optional[FatoresJogos]:
+    path_fatores: Optional[str] = get_path_fatores(id_loteria, id_concurso)
+    if path_fatores is None:
+        return None
+
+    fatores: Optional[memoryview] = cache_fatores.abrir_fatores(path_fatores, qtd_bolas,
+                                                                qtd_bolas_sorteio, id_concurso)
+    if fatores is None:
+        return None
+
+    return FatoresJogos(qtd_bolas, qtd_bolas_sorteio, fatores)
+
+# ----------------------------------------------------------------------------
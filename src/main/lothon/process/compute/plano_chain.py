@@ -0,0 +1,188 @@
+"""
+   Package lothon.process.compute
+   Module  plano_chain.py
+
+   Planejamento da ordem dos computes na cadeia de EVALUATE: mede o custo por jogo e a taxa de
+   aprovacao (fator nao zerado) de cada compute em uma amostra de jogos, e ordena a cadeia para
+   minimizar o custo esperado, ja que a avaliacao de um jogo termina no primeiro fator zerado.
+"""
+
+__all__ = [
+    'TAMANHO_AMOSTRA_PLANO',
+    'MedicaoCompute',
+    'calc_custo_esperado',
+    'planejar_chain'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from typing import Optional
+import time
+import math
+import os
+import csv
+import logging
+
+# Libs/Frameworks modules
+# Own/Project modules
+from lothon.util.eve import *
+from lothon.conf import app_config
+from lothon.stats import combinatoria as cb
+from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import histograma_jogos as hj
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# quantidade de jogos aleatorios na amostra para medir os computes da cadeia:
+TAMANHO_AMOSTRA_PLANO: int = 10_000
+
+
+# ----------------------------------------------------------------------------
+# VARIAVEIS GLOBAIS
+# ----------------------------------------------------------------------------
+
+# obtem uma instancia do logger para o modulo corrente:
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------------
+# CLASSE CONCRETA
+# ----------------------------------------------------------------------------
+
+class MedicaoCompute:
+    """
+    Implementacao de classe com as estatisticas de um compute medidas na amostra de jogos:
+    custo medio do evaluate por jogo (em segundos) e proporcao de jogos nao zerados.
+    """
+
+    # --- PROPRIEDADES -------------------------------------------------------
+    __slots__ = ('cproc', 'custo', 'aprovacao')
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __init__(self, cproc: AbstractCompute, custo: float, aprovacao: float):
+        self.cproc: AbstractCompute = cproc
+        self.custo: float = custo
+        self.aprovacao: float = aprovacao
+
+    # --- METODOS ------------------------------------------------------------
+
+    # os filtros mais baratos e que mais rejeitam jogos devem ser aplicados primeiro: em filtros
+    # independentes, a ordem otima eh crescente de custo / taxa de rejeicao.
+    def prioridade(self) -> tuple[float, float]:
+        rejeicao: float = 1 - self.aprovacao
+        return (self.custo / rejeicao if rejeicao > 0 else math.inf), self.custo
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+# mede o evaluate do compute na amostra, sem afetar a contagem de jogos zerados do compute:
+def medir_compute(cproc: AbstractCompute, ordinais: list[int], jogos: list[tuple]) \
+        -> MedicaoCompute:
+    qtd_zerados: int = cproc.qtd_zerados
+    inicio: float = time.perf_counter()
+    fatores: list[float] = cproc.evaluate_batch(ordinais, jogos)
+    custo: float = (time.perf_counter() - inicio) / len(jogos)
+    cproc.qtd_zerados = qtd_zerados
+
+    qtd_aprovados: int = sum(1 for fator in fatores if fator != 0)
+    return MedicaoCompute(cproc, custo, qtd_aprovados / len(jogos))
+
+
+# custo esperado por jogo ao aplicar os computes nesta ordem: cada compute so avalia os jogos
+# aprovados por todos os anteriores (supondo os filtros independentes):
+def calc_custo_esperado(medicoes: list[MedicaoCompute]) -> float:
+    custo_esperado: float = 0.0
+    aprovacao: float = 1.0
+    for medicao in medicoes:
+        custo_esperado += aprovacao * medicao.custo
+        aprovacao *= medicao.aprovacao
+
+    return custo_esperado
+
+
+def get_path_plano(qtd_bolas: int, qtd_bolas_sorteio: int) -> Optional[str]:
+    # sem a configuracao carregada, o plano apenas eh registrado no log:
+    if not app_config.DS_plano_csv_name:
+        return None
+
+    plano_csv_file: str = app_config.DS_plano_csv_name.format(qtd_bolas, qtd_bolas_sorteio)
+    return os.path.join(app_config.DS_cache_path, plano_csv_file)
+
+
+# grava o plano escolhido com as estatisticas medidas de cada compute, na ordem da cadeia:
+def salvar_plano(path_plano: str, medicoes: list[MedicaoCompute]) -> int:
+    try:
+        with open(path_plano, 'w', newline='', encoding='utf-8') as file_csv:
+            # o conteudo do arquivo sera formatado como CSV padrao:
+            csv_writer = csv.writer(file_csv, delimiter=',')
+            csv_writer.writerow(('ordem', 'compute', 'custo_us', 'aprovacao', 'custo_esperado_us'))
+
+            custo_esperado: float = 0.0
+            aprovacao: float = 1.0
+            for ordem, medicao in enumerate(medicoes, 1):
+                custo_esperado += aprovacao * medicao.custo
+                aprovacao *= medicao.aprovacao
+                csv_writer.writerow((ordem, type(medicao.cproc).__name__,
+                                     f"{medicao.custo * 1e6:.3f}", f"{medicao.aprovacao:.6f}",
+                                     f"{custo_esperado * 1e6:.3f}"))
+
+    # o plano eh apenas informativo, entao a falha na gravacao nao interrompe o processamento:
+    except OSError as ex:
+        logger.warning(f"Nao foi possivel gravar o plano da cadeia '{path_plano}'. "
+                       f"ERRO: {repr(ex)}")
+        return -1
+
+    return len(medicoes)
+
+
+# ----------------------------------------------------------------------------
+# PLANEJAMENTO DA CADEIA
+# ----------------------------------------------------------------------------
+
+# Retorna uma nova lista com os computes da cadeia (ja executados sobre os concursos) na ordem
+# de menor custo esperado do EVALUATE, medido em uma amostra aleatoria dos jogos da loteria:
+def planejar_chain(compute_chain: list[AbstractCompute], qtd_bolas: int, qtd_bolas_sorteio: int,
+                   tamanho_amostra: int = TAMANHO_AMOSTRA_PLANO) -> list[AbstractCompute]:
+    if len(compute_chain) < 2:
+        return list(compute_chain)
+
+    # a amostra fica em ordem de ordinal, como os jogos no EVALUATE:
+    tamanho_amostra = min(tamanho_amostra, math.comb(qtd_bolas, qtd_bolas_sorteio))
+    amostra: list[tuple[int, tuple]] = sorted((cb.rank(jogo, qtd_bolas, qtd_bolas_sorteio), jogo)
+                                              for jogo in hj.gerar_amostras(qtd_bolas,
+                                                                            qtd_bolas_sorteio,
+                                                                            tamanho_amostra))
+    ordinais: list[int] = [ordinal for ordinal, _ in amostra]
+    jogos: list[tuple] = [jogo for _, jogo in amostra]
+
+    # mede cada compute isoladamente e ordena pela prioridade (ordenacao estavel):
+    medicoes: list[MedicaoCompute] = [medir_compute(cproc, ordinais, jogos)
+                                      for cproc in compute_chain]
+    planejadas: list[MedicaoCompute] = sorted(medicoes, key=MedicaoCompute.prioridade)
+
+    # registra o plano escolhido e suas estatisticas:
+    output: str = f"\n\n ORDEM  COMPUTE                 CUSTO(us)   APROVACAO\n"
+    for ordem, medicao in enumerate(planejadas, 1):
+        output += f" {formatd(ordem,5)}  {type(medicao.cproc).__name__:<22}  " \
+                  f"{formatf(medicao.custo * 1e6,'9.3')}   " \
+                  f"{formatf(medicao.aprovacao * 100,'8.2')}%\n"
+    logger.debug(f"Plano da cadeia de computes para {qtd_bolas}/{qtd_bolas_sorteio}: custo "
+                 f"esperado por jogo de {formatf(calc_custo_esperado(medicoes) * 1e6,'.3')}us "
+                 f"para {formatf(calc_custo_esperado(planejadas) * 1e6,'.3')}us. {output}")
+
+    path_plano: Optional[str] = get_path_plano(qtd_bolas, qtd_bolas_sorteio)
+    if path_plano is not None:
+        salvar_plano(path_plano, planejadas)
+
+    return [medicao.cproc for medicao in planejadas]
+
+# ----------------------------------------------------------------------------
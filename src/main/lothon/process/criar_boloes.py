@@ -103,7 +103,9 @@ def run():
 
     # relacao de instancias das loterias da caixa e boloes para processamento
     logger.debug("Vai efetuar carga das definicoes das loterias do arquivo de configuracao .INI")
-    # aproveita p/ efetuar leitura dos arquivos HTML com resultados dos sorteios de cada loteria:
+    # efetua o parsing dos arquivos HTML de resultados das loterias em paralelo:
+    domain.load_loterias()
+    # as instancias (singleton) das loterias ja estao com os resultados dos sorteios:
     loterias_caixa: dict[str: AbstractBetting] = {
         "diadesorte": BetDiaDeSorte(domain.get_dia_de_sorte()),
         "duplasena": BetDuplaSena(domain.get_dupla_sena()),
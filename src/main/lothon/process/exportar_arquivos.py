@@ -46,7 +46,9 @@ def run():
     logger.info("Iniciando a exportacao de arquivos CSV com dezenas sorteadas dos concursos...")
 
     logger.debug("Vai efetuar carga das definicoes das loterias do arquivo de configuracao .INI")
-    # Ja aproveita e efetua leitura dos arquivos HTML com resultados dos sorteios de cada loteria:
+    # efetua o parsing dos arquivos HTML de resultados das loterias em paralelo:
+    domain.load_loterias()
+    # as instancias (singleton) das loterias ja estao com os resultados dos sorteios:
     loterias_caixa: dict[str: Loteria] = {
         "diadesorte": domain.get_dia_de_sorte(),         #
         "duplasena": domain.get_dupla_sena(),            #
@@ -16,16 +16,19 @@ __all__ = [
 from typing import Optional, Any
 import math
 import random
-import itertools as itt
 import logging
 
 # Libs/Frameworks modules
 # Own/Project modules
 from lothon.util.eve import *
 from lothon.stats import combinatoria as cb
+from lothon.stats.bitset import BitsetJogos
+from lothon.stats.fatores import FatoresJogos
 from lothon.domain import Loteria, Concurso, Faixa
 from lothon.process import compute
 from lothon.process.compute.abstract_compute import AbstractCompute
+from lothon.process.compute import lote_jogos as lj
+from lothon.process.compute import plano_chain as pc
 from lothon.process.simulate.abstract_simulate import AbstractSimulate
 
 
@@ -62,7 +65,7 @@ class SimuladoComputado(AbstractSimulate):
 
         # cadeia de processos para analise de jogos na simulacao:
         self.compute_chain: Optional[list[AbstractCompute]] = None
-        self.compute_jogos: Optional[list[tuple[int, ...]]] = None
+        self.compute_jogos: Optional[BitsetJogos] = None
 
     def setup(self, parms: dict):
         # absorve os parametros fornecidos:
@@ -154,35 +157,34 @@ class SimuladoComputado(AbstractSimulate):
             cproc.execute(loteria.concursos)
 
         # efetua analise geral (evaluate) de todas as combinacoes de jogos da loteria:
-        self.compute_jogos = []
         qtd_jogos: int = math.comb(loteria.qtd_bolas, loteria.qtd_bolas_sorteio)
         logger.debug(f"{nmlot}: Executando analise EVALUATE dos  "
                      f"{formatd(qtd_jogos)}  jogos combinados da loteria.")
 
-        # contabiliza pares (e impares) de cada combinacao de jogo:
-        range_jogos: range = range(1, loteria.qtd_bolas + 1)
-        vl_ordinal: int = 0
-        for jogo in itt.combinations(range_jogos, loteria.qtd_bolas_sorteio):
-            vl_ordinal += 1  # comeca do ordinal no. 1
-            vl_metrica: float = 1.0
+        # os fatores gravados pela analise da cadeia ate o ultimo concurso dispensam o EVALUATE:
+        fatores_jogos: Optional[FatoresJogos] = lj.abrir_fatores_jogos(
+            loteria.id_loteria, concursos[-1].id_concurso, loteria.qtd_bolas,
+            loteria.qtd_bolas_sorteio)
+        if fatores_jogos is not None:
+            logger.debug(f"{nmlot}: Fatores dos jogos obtidos do arquivo para o concurso "
+                         f"#{concursos[-1].id_concurso}.")
+            self.compute_jogos = fatores_jogos.get_aceitos()
+        else:
+            # ordena a cadeia pelo custo e seletividade de cada compute, medidos em uma amostra:
+            self.compute_chain = pc.planejar_chain(self.compute_chain, loteria.qtd_bolas,
+                                                   loteria.qtd_bolas_sorteio)
+
+            # avalia as combinacoes em faixas paralelas, descartando os jogos zerados pela cadeia:
+            # os jogos mantidos para apostar ficam apenas no bitset de ordinais aceitos:
+            self.compute_jogos = lj.evaluate_aceitos(self.compute_chain, loteria.qtd_bolas,
+                                                     loteria.qtd_bolas_sorteio)
             for cproc in self.compute_chain:
-                # executa o processamento de avaliacao do jogo, para verificar se sera descartado:
-                vl_metrica *= cproc.evaluate(vl_ordinal, jogo)
-                # ignora o resto das analises se a metrica zerou:
-                if vl_metrica == 0:
-                    break  # pula para o proximo jogo, acelerando o processamento
-
-            # se a metrica atingir o ponto de corte, entao mantem o jogo para apostar:
-            if vl_metrica > 0:
-                self.compute_jogos.append(jogo)
+                logger.debug(f"{cproc.id_process}: Jogos Zerados = {formatd(cproc.qtd_zerados)}")
         logger.debug("Finalizou o EVALUATE de todas as combinacoes de jogos...")
 
         # verifica quantos jogos foram descartados e quantos serao considerados:
-        qtd_considerados: int = len(self.compute_jogos)
-        qtd_zerados: int = 0
-        for cproc in self.compute_chain:
-            qtd_zerados += cproc.qtd_zerados
-            logger.debug(f"{cproc.id_process}: Jogos Zerados = {formatd(cproc.qtd_zerados)}")
+        qtd_considerados: int = self.compute_jogos.count()
+        qtd_zerados: int = qtd_jogos - qtd_considerados
 
         logger.debug(f"Resultado da avaliacao dos  {formatd(qtd_jogos)}  jogos combinados:\n"
                      f"\tNumero de jogos descartados (zerado) = {formatd(qtd_zerados)}\n"
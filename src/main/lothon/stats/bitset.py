@@ -0,0 +1,137 @@
+"""
+   Package lothon.stats
+   Module  bitset.py
+
+   Conjunto compacto de jogos de uma loteria, com um bit por ordinal de combinacao (para a
+   Mega-Sena, C(60,6) bits ~ 6 MB), permitindo combinar, comparar e gravar os jogos aceitos
+   por cada compute ou por toda a cadeia sem materializar as tuplas de dezenas.
+"""
+
+__all__ = [
+    'BitsetJogos'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from collections.abc import Iterable, Iterator
+
+# Libs/Frameworks modules
+# Own/Project modules
+
+
+# ----------------------------------------------------------------------------
+# CLASSE CONCRETA
+# ----------------------------------------------------------------------------
+
+class BitsetJogos:
+    """
+    Implementacao de classe para o conjunto de ordinais (de 1 a qtd_jogos) das combinacoes de
+    jogos, com o bit i do bytearray (little-endian) indicando se o ordinal i pertence ao conjunto.
+    As operacoes entre conjuntos sao feitas sobre os bytes inteiros, convertidos em int.
+    """
+
+    # --- PROPRIEDADES -------------------------------------------------------
+    __slots__ = ('qtd_jogos', 'bits')
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __init__(self, qtd_jogos: int, bits: bytearray = None):
+        self.qtd_jogos: int = qtd_jogos
+        tamanho: int = (qtd_jogos + 1 + 7) // 8  # adiciona 1 para o zero-index
+        if bits is None:
+            bits = bytearray(tamanho)
+        elif len(bits) != tamanho:
+            raise ValueError(f"Tamanho invalido do bitset: {len(bits)} bytes para "
+                             f"{qtd_jogos} jogos.")
+        self.bits: bytearray = bits
+
+    @classmethod
+    def from_ordinais(cls, qtd_jogos: int, ordinais: Iterable[int]) -> 'BitsetJogos':
+        bitset: BitsetJogos = cls(qtd_jogos)
+        bitset.add_ordinais(ordinais)
+        return bitset
+
+    @classmethod
+    def from_bytes(cls, qtd_jogos: int, conteudo: bytes) -> 'BitsetJogos':
+        return cls(qtd_jogos, bytearray(conteudo))
+
+    # --- METODOS ------------------------------------------------------------
+
+    def add(self, ordinal: int):
+        self.bits[ordinal >> 3] |= 1 << (ordinal & 7)
+
+    def add_ordinais(self, ordinais: Iterable[int]):
+        bits: bytearray = self.bits
+        for ordinal in ordinais:
+            bits[ordinal >> 3] |= 1 << (ordinal & 7)
+
+    # une ao conjunto os bits de uma faixa de ordinais, com o bit i da faixa indicando o ordinal
+    # (ordinal_inicial + i), convertendo em int apenas os bytes do trecho da faixa:
+    def add_faixa(self, ordinal_inicial: int, bits_faixa: bytes):
+        inicio: int = ordinal_inicial >> 3
+        fim: int = min(inicio + len(bits_faixa) + 1, len(self.bits))
+        trecho: int = int.from_bytes(bits_faixa, 'little') << (ordinal_inicial & 7)
+        trecho |= int.from_bytes(self.bits[inicio:fim], 'little')
+        self.bits[inicio:fim] = trecho.to_bytes(fim - inicio, 'little')
+
+    def discard(self, ordinal: int):
+        self.bits[ordinal >> 3] &= ~(1 << (ordinal & 7)) & 0xFF
+
+    def to_int(self) -> int:
+        return int.from_bytes(self.bits, 'little')
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.bits)
+
+    def count(self) -> int:
+        return self.to_int().bit_count()
+
+    # combina dois conjuntos da mesma loteria com a operacao de bits fornecida:
+    def combinar(self, outro: 'BitsetJogos', operacao) -> 'BitsetJogos':
+        if self.qtd_jogos != outro.qtd_jogos:
+            raise ValueError(f"Bitsets de loterias distintas: {self.qtd_jogos} e "
+                             f"{outro.qtd_jogos} jogos.")
+
+        resultado: int = operacao(self.to_int(), outro.to_int())
+        return BitsetJogos(self.qtd_jogos, bytearray(resultado.to_bytes(len(self.bits), 'little')))
+
+    # --- OPERADORES ---------------------------------------------------------
+
+    def __contains__(self, ordinal: int) -> bool:
+        return 0 < ordinal <= self.qtd_jogos and (self.bits[ordinal >> 3] >> (ordinal & 7)) & 1 == 1
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __eq__(self, outro) -> bool:
+        return isinstance(outro, BitsetJogos) and self.qtd_jogos == outro.qtd_jogos and \
+            self.bits == outro.bits
+
+    def __and__(self, outro: 'BitsetJogos') -> 'BitsetJogos':
+        return self.combinar(outro, int.__and__)
+
+    def __or__(self, outro: 'BitsetJogos') -> 'BitsetJogos':
+        return self.combinar(outro, int.__or__)
+
+    def __xor__(self, outro: 'BitsetJogos') -> 'BitsetJogos':
+        return self.combinar(outro, int.__xor__)
+
+    # jogos deste conjunto que nao estao no outro:
+    def __sub__(self, outro: 'BitsetJogos') -> 'BitsetJogos':
+        return self.combinar(outro, lambda bits, outros: bits & ~outros)
+
+    # percorre os ordinais do conjunto em ordem crescente, 64 bits por vez:
+    def __iter__(self) -> Iterator[int]:
+        bits: bytearray = self.bits
+        for inicio in range(0, len(bits), 8):
+            palavra: int = int.from_bytes(bits[inicio:inicio + 8], 'little')
+            base: int = inicio * 8
+            while palavra:
+                bit: int = palavra & -palavra  # isola o bit menos significativo
+                yield base + bit.bit_length() - 1
+                palavra ^= bit
+
+# ----------------------------------------------------------------------------
@@ -36,6 +36,8 @@ __all__ = [
     'count_colunarios',
     'list_espacos',
     'rank',
+    'unrank',
+    'iter_combinacoes',
     'partial_matches',
     'all_combinations',
 ]
@@ -46,13 +48,16 @@ __all__ = [
 
 # Built-in/Generic modules
 import itertools
+import functools
 import math
 import random
-from collections.abc import Collection
+from collections.abc import Collection, Iterator
 
 # Libs/Frameworks modules
 # Own/Project modules
-from lothon.domain import SerieSorteio, Concurso
+from lothon.domain import SerieSorteio, Concurso, MatrizSorteios
+from lothon.stats.mascara import to_mascara, count_acertos_dezenas
+from lothon.stats.ranking import RankingAusencia
 
 
 # ----------------------------------------------------------------------------
@@ -264,12 +269,7 @@ def rtrim_list(valores: list) -> list:
 
 def count_dezenas_repetidas(bolas1: tuple[int, ...], bolas2: tuple[int, ...]) -> int:
     # aqui nao precisa validar os parametros:
-    qtd_repete: int = 0
-    for num1 in bolas1:
-        if num1 in bolas2:
-            qtd_repete += 1
-
-    return qtd_repete
+    return count_acertos_dezenas(bolas1, to_mascara(bolas2))
 
 
 def count_repeticoes(bolas1: tuple[int, ...], bolas2: tuple[int, ...],
@@ -295,13 +295,15 @@ def count_ocorrencias(bolas: tuple[int, ...], dezenas: list[int]):
     return
 
 
-def count_sequencias(bolas: tuple[int, ...]) -> int:
+def count_sequencias(bolas: tuple[int, ...], ordenadas: bool = False) -> int:
     # valida os parametros:
     if bolas is None or len(bolas) == 0:
         return 0
 
-    # eh preciso ordenar a tupla para verificar se ha sequencia:
-    bolas: tuple[int, ...] = tuple(sorted(bolas))
+    # eh preciso ordenar a tupla para verificar se ha sequencia,
+    # exceto se ja estiver ordenada (como nas combinacoes de jogos e nas bolas dos concursos):
+    if not ordenadas:
+        bolas: tuple[int, ...] = tuple(sorted(bolas))
 
     qtd_sequencias: int = 0
     seq_posterior: int = -1
@@ -313,13 +315,15 @@ def count_sequencias(bolas: tuple[int, ...]) -> int:
     return qtd_sequencias
 
 
-def count_consecutivas(bolas: tuple[int, ...]) -> int:
+def count_consecutivas(bolas: tuple[int, ...], ordenadas: bool = False) -> int:
     # valida os parametros:
     if bolas is None or len(bolas) == 0:
         return 0
 
-    # eh preciso ordenar a tupla para verificar se ha dezenas consecutivas:
-    bolas: tuple[int, ...] = tuple(sorted(bolas))
+    # eh preciso ordenar a tupla para verificar se ha dezenas consecutivas,
+    # exceto se ja estiver ordenada (como nas combinacoes de jogos e nas bolas dos concursos):
+    if not ordenadas:
+        bolas: tuple[int, ...] = tuple(sorted(bolas))
 
     qtd_consecutivas: int = 0
     qtd_sequencias: int = 0
@@ -366,12 +370,7 @@ def count_recorrencias(bolas1: Collection, bolas2: Collection) -> int:
     if bolas1 is None or len(bolas1) == 0 or bolas2 is None or len(bolas2) == 0:
         return 0
 
-    qtd_recorre: int = 0
-    for num1 in bolas1:
-        if num1 in bolas2:
-            qtd_recorre += 1
-
-    return qtd_recorre
+    return count_acertos_dezenas(bolas1, to_mascara(bolas2))
 
 
 def max_recorrencias(bolas: tuple[int, ...], concursos: list[Concurso],
@@ -380,18 +379,16 @@ def max_recorrencias(bolas: tuple[int, ...], concursos: list[Concurso],
     if bolas is None or len(bolas) == 0 or concursos is None or len(concursos) == 0:
         return 0
 
-    # percorre todos os concursos e retorna o numero maximo de recorrencias de [bolas]:
-    qt_max_recorrencias: int = 0
-    for concurso in concursos:
-        # nao deixa comparar com o mesmo concurso:
-        if concurso.id_concurso == id_concurso_ignore:
-            continue
-
-        qt_recorrencias: int = count_recorrencias(bolas, concurso.bolas)
-        if qt_recorrencias > qt_max_recorrencias:
-            qt_max_recorrencias = qt_recorrencias
+    # com dezenas repetidas (como no Super Sete), a contagem deve ser feita dezena a dezena:
+    mascara: int = to_mascara(bolas)
+    if mascara.bit_count() != len(bolas):
+        return max((count_acertos_dezenas(bolas, concurso.mascara) for concurso in concursos
+                    if concurso.id_concurso != id_concurso_ignore), default=0)
 
-    return qt_max_recorrencias
+    # percorre todos os concursos e retorna o numero maximo de recorrencias de [bolas],
+    # sem comparar com o proprio concurso:
+    return max(((mascara & concurso.mascara).bit_count() for concurso in concursos
+                if concurso.id_concurso != id_concurso_ignore), default=0)
 
 
 def check_max_recorrencias(bolas: tuple[int, ...], jogos: list[tuple[int, ...]],
@@ -430,27 +427,26 @@ def calc_topos_frequencia(concursos: list[Concurso], qtd_bolas: int,
     return list_topos
 
 
+# versao de calc_topos_frequencia() sobre a visao colunar dos concursos da loteria, contando
+# as ocorrencias das bolas nas fatias do buffer, sem percorrer os concursos:
+def calc_topos_matriz(matriz: MatrizSorteios, qtd_topos: int = None) -> list[int]:
+    # identifica as frequencias das dezenas em ordem reversa da frequencia nos sorteios:
+    frequencias_dezenas: dict = to_dict(matriz.get_ocorrencias(), reverse_value=True)
+
+    # extrai o topo do ranking com as dezenas com maior frequencia e retorna:
+    list_topos: list[int] = take_keys(frequencias_dezenas, qtd_topos)
+    return list_topos
+
+
 def calc_topos_ausencia(concursos: list[Concurso], qtd_bolas: int,
                         qtd_topos: int = None) -> list[int]:
-    # contabiliza o numero de concursos em que cada dezena ficou ausente ate ser sorteada:
-    ausencias_concursos: list[int] = new_list_int(qtd_bolas, -1)
-    qtd_concursos: int = 0
-    for concurso in reversed(concursos):
-        # registra o sorteio da dezena com o numero de concursos em que ficou ausente:
-        for dezena in concurso.bolas:
-            if ausencias_concursos[dezena] == -1:  # se a dezena ainda estiver ausente:
-                ausencias_concursos[dezena] = qtd_concursos
-        # vai continuar processando enquanto não tiver contado todas as dezenas
-        if -1 in ausencias_concursos:
-            qtd_concursos += 1
-        else:  # nao tendo mais dezenas a processar, ja pode pular fora:
-            break
-
-    # identifica as ausencias das dezenas em ordem reversa do atraso ate o ultimo sorteio:
-    ausencias_dezenas: dict = to_dict(ausencias_concursos, reverse_value=True)
+    # registra o ultimo sorteio de cada dezena, percorrendo os concursos uma unica vez:
+    ranking_ausencias: RankingAusencia = RankingAusencia(qtd_bolas)
+    for concurso in concursos:
+        ranking_ausencias.add_sorteio(concurso.bolas)
 
     # extrai o topo do ranking com as dezenas com maior ausencia e retorna:
-    list_topos: list[int] = take_keys(ausencias_dezenas, qtd_topos)
+    list_topos: list[int] = ranking_ausencias.get_topos(qtd_topos)
     return list_topos
 
 
@@ -695,12 +691,67 @@ def sortear_palpite_digito(qtd_bolas_sorteadas: int) -> tuple[int, ...]:
 # FUNCOES UTILITARIAS PARA MEGA-SENA
 # ----------------------------------------------------------------------------
 
-def rank(c):
-    # Rank for C(60, 6). 'c' must be sorted.
+# tabela com os coeficientes binomiais C(x, j), para x em [0, qtd_bolas] e j em [0, qtd_sorteio]:
+@functools.cache
+def get_tabela_binomiais(qtd_bolas: int, qtd_bolas_sorteio: int) -> tuple[tuple[int, ...], ...]:
+    return tuple(tuple(math.comb(x, j) for j in range(0, qtd_bolas_sorteio + 1))
+                 for x in range(0, qtd_bolas + 1))
+
+
+def rank(jogo: tuple[int, ...], qtd_bolas: int = 60, qtd_bolas_sorteio: int = 6) -> int:
+    # Ordinal (a partir de 1) do jogo na sequencia gerada por itertools.combinations(), obtido
+    # pelo sistema numerico combinatorio. 'jogo' deve estar ordenado.
     # https://en.wikipedia.org/wiki/Combinatorial_number_system
-    return 50063860 - (qtd_combinacoes(60 - c[0], 6) + qtd_combinacoes(60 - c[1], 5) +
-                       qtd_combinacoes(60 - c[2], 4) + qtd_combinacoes(60 - c[3], 3) +
-                       qtd_combinacoes(60 - c[4], 2) + (60 - c[5]))
+    # se nao for uma combinacao valida da loteria, retorna zero (nenhum ordinal):
+    if len(jogo) != qtd_bolas_sorteio:
+        return 0
+
+    tabela: tuple[tuple[int, ...], ...] = get_tabela_binomiais(qtd_bolas, qtd_bolas_sorteio)
+    soma: int = 0
+    anterior: int = 0
+    for idx, dezena in enumerate(jogo):
+        if dezena <= anterior or dezena > qtd_bolas:
+            return 0
+        soma += tabela[qtd_bolas - dezena][qtd_bolas_sorteio - idx]
+        anterior = dezena
+
+    return tabela[qtd_bolas][qtd_bolas_sorteio] - soma
+
+
+def unrank(ordinal: int, qtd_bolas: int = 60, qtd_bolas_sorteio: int = 6) -> tuple[int, ...]:
+    # Jogo correspondente ao ordinal (a partir de 1), operacao inversa de rank().
+    tabela: tuple[tuple[int, ...], ...] = get_tabela_binomiais(qtd_bolas, qtd_bolas_sorteio)
+    if ordinal < 1 or ordinal > tabela[qtd_bolas][qtd_bolas_sorteio]:
+        raise ValueError(f"Ordinal {ordinal} fora do intervalo de jogos da loteria "
+                         f"C({qtd_bolas}, {qtd_bolas_sorteio}).")
+
+    # identifica cada dezena pelo maior binomial que ainda cabe no restante da soma:
+    soma: int = tabela[qtd_bolas][qtd_bolas_sorteio] - ordinal
+    jogo: list[int] = []
+    x: int = qtd_bolas
+    for j in range(qtd_bolas_sorteio, 0, -1):
+        x -= 1
+        while tabela[x][j] > soma:
+            x -= 1
+        soma -= tabela[x][j]
+        jogo.append(qtd_bolas - x)
+
+    return tuple(jogo)
+
+
+def iter_combinacoes(ordinal: int, qtd_bolas: int = 60,
+                     qtd_bolas_sorteio: int = 6) -> Iterator[tuple[int, ...]]:
+    # Combinacoes a partir do ordinal (inclusive), na mesma ordem de itertools.combinations().
+    # Apos o jogo inicial, para cada posicao (da ultima para a primeira) vem os jogos que mantem
+    # as dezenas anteriores e aumentam a dezena da posicao, seguida de dezenas ainda maiores.
+    jogo: tuple[int, ...] = unrank(ordinal, qtd_bolas, qtd_bolas_sorteio)
+    combinacoes: list[Iterator[tuple[int, ...]]] = [iter((jogo,))]
+    for idx in range(qtd_bolas_sorteio - 1, -1, -1):
+        combinacoes.append(map(jogo[:idx].__add__,
+                               itertools.combinations(range(jogo[idx] + 1, qtd_bolas + 1),
+                                                      qtd_bolas_sorteio - idx)))
+
+    return itertools.chain.from_iterable(combinacoes)
 
 
 def partial_matches(s, n):
@@ -0,0 +1,239 @@
+"""
+   Package lothon.stats
+   Module  distribuicao.py
+
+   Distribuicao exata das features sobre todas as combinacoes de jogos de uma loteria,
+   calculada de forma analitica (formula fechada ou programacao dinamica), sem enumerar as
+   combinacoes. Cada distribuicao eh uma lista com a quantidade de jogos para cada valor
+   da feature.
+"""
+
+__all__ = [
+    'dist_somatorios',
+    'dist_numerologias',
+    'dist_distancias',
+    'dist_espacamentos',
+    'dist_grupos',
+    'dist_decenarios',
+    'dist_colunarios',
+    'dist_matriciais',
+    'dist_sequencias',
+    'dist_consecutivas'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from collections import defaultdict
+from collections.abc import Callable
+import math
+
+# Libs/Frameworks modules
+# Own/Project modules
+
+
+# ----------------------------------------------------------------------------
+# SOMATORIO E NUMEROLOGIA
+# ----------------------------------------------------------------------------
+
+# quantidade de jogos com k dezenas distintas de 1 a n para cada soma possivel das dezenas,
+# em O(n.k.soma_maxima), acrescentando uma dezena por vez aos subconjuntos ja contabilizados:
+def dist_somatorios(qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    soma_maxima: int = sum(range(qtd_bolas - qtd_bolas_sorteio + 1, qtd_bolas + 1))
+
+    # somas[j][s] = quantidade de subconjuntos com j dezenas cuja soma eh s:
+    somas: list[list[int]] = [[0] * (soma_maxima + 1) for _ in range(0, qtd_bolas_sorteio + 1)]
+    somas[0][0] = 1
+    for dezena in range(1, qtd_bolas + 1):
+        # percorre do maior para o menor tamanho, para nao usar a dezena duas vezes:
+        for j in range(min(dezena, qtd_bolas_sorteio), 0, -1):
+            atual: list[int] = somas[j]
+            anterior: list[int] = somas[j - 1]
+            somas[j] = atual[:dezena] + [qtd + qtd_sem_dezena for qtd, qtd_sem_dezena
+                                         in zip(atual[dezena:], anterior)]
+
+    return somas[qtd_bolas_sorteio]
+
+
+# a numerologia do jogo eh a raiz digital da soma de suas dezenas (de 1 a 9):
+def dist_numerologias(qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    numerologias: list[int] = [0] * 10
+    for soma, qtd_jogos in enumerate(dist_somatorios(qtd_bolas, qtd_bolas_sorteio)):
+        if soma > 0:
+            numerologias[1 + (soma - 1) % 9] += qtd_jogos
+
+    return numerologias
+
+
+# ----------------------------------------------------------------------------
+# DISTANCIA E ESPACAMENTO
+# ----------------------------------------------------------------------------
+
+# quantidade de jogos para cada distancia d entre a menor e a maior dezena: ha (n - d) pares de
+# extremos com essa distancia, e as demais k-2 dezenas ficam entre eles, em C(d-1, k-2) formas:
+def dist_distancias(qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    distancias: list[int] = [0] * qtd_bolas
+    if qtd_bolas_sorteio == 1:
+        distancias[0] = qtd_bolas
+        return distancias
+
+    for distancia in range(qtd_bolas_sorteio - 1, qtd_bolas):
+        distancias[distancia] = (qtd_bolas - distancia) * \
+            math.comb(distancia - 1, qtd_bolas_sorteio - 2)
+
+    return distancias
+
+
+# o espacamento medio entre as dezenas ordenadas do jogo eh a distancia dividida (inteira)
+# pelos k-1 espacos, entao basta agrupar a distribuicao das distancias:
+def dist_espacamentos(qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    qtd_espacos: int = qtd_bolas_sorteio - 1
+    espacamentos: list[int] = [0] * (qtd_bolas // qtd_espacos + 1)
+    for distancia, qtd_jogos in enumerate(dist_distancias(qtd_bolas, qtd_bolas_sorteio)):
+        espacamentos[distancia // qtd_espacos] += qtd_jogos
+
+    return espacamentos
+
+
+# ----------------------------------------------------------------------------
+# DECENARIOS E COLUNARIOS
+# ----------------------------------------------------------------------------
+
+# incidencia de todas as dezenas dos jogos em cada grupo (como decenarios e colunarios):
+# cada dezena esta presente em C(n-1, k-1) jogos, logo basta contar as dezenas de cada grupo:
+def dist_grupos(qtd_bolas: int, qtd_bolas_sorteio: int,
+                get_grupo: Callable[[int], int]) -> list[int]:
+    qtd_jogos_dezena: int = math.comb(qtd_bolas - 1, qtd_bolas_sorteio - 1)
+
+    dezenas: range = range(1, qtd_bolas + 1)
+    grupos: list[int] = [0] * (max(map(get_grupo, dezenas)) + 1)
+    for dezena in dezenas:
+        grupos[get_grupo(dezena)] += qtd_jogos_dezena
+
+    return grupos
+
+
+def dist_decenarios(qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    return dist_grupos(qtd_bolas, qtd_bolas_sorteio, lambda dezena: (dezena - 1) // 10)
+
+
+def dist_colunarios(qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    return dist_grupos(qtd_bolas, qtd_bolas_sorteio, lambda dezena: dezena % 10)
+
+
+# ----------------------------------------------------------------------------
+# MATRICIAL (LINHAS E COLUNAS DO VOLANTE)
+# ----------------------------------------------------------------------------
+
+# distribui mais uma linha completa do volante sobre as colunas, a partir das quantidades de
+# colunas com cada total de dezenas marcadas: gera (novas quantidades, dezenas na linha, formas)
+def distribuir_linha(colunas: tuple[int, ...], limite: int) -> list[tuple[tuple, int, int]]:
+    parciais: list[tuple[list[int], int, int]] = [(list(colunas), 0, 1)]
+    for total, qtd_colunas in enumerate(colunas):
+        if qtd_colunas == 0:
+            continue
+
+        # escolhe quantas colunas com esse total recebem uma dezena da linha:
+        expandidos: list[tuple[list[int], int, int]] = []
+        for novas, qtd_linha, formas in parciais:
+            for qtd in range(0, min(qtd_colunas, limite - qtd_linha) + 1):
+                if qtd == 0:
+                    expandidos.append((novas, qtd_linha, formas))
+                    continue
+                escolhidas: list[int] = novas.copy()
+                escolhidas[total] -= qtd
+                escolhidas[total + 1] += qtd
+                expandidos.append((escolhidas, qtd_linha + qtd,
+                                   formas * math.comb(qtd_colunas, qtd)))
+        parciais = expandidos
+
+    return [(tuple(novas), qtd_linha, formas) for novas, qtd_linha, formas in parciais]
+
+
+# quantidade de jogos para cada par (maximo de dezenas em uma coluna, maximo em uma linha) do
+# volante, com as dezenas de 1 a n dispostas em linhas de 10 (coluna = dezena % 10), indexado
+# por max_coluna * (k+1) + max_linha. Percorre as linhas mantendo apenas a quantidade de colunas
+# com cada total de dezenas marcadas, pois as linhas completas tratam as colunas igualmente:
+def dist_matriciais(qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    largura: int = qtd_bolas_sorteio + 1
+    qtd_linhas_completas: int = qtd_bolas // 10
+    qtd_dezenas_incompleta: int = qtd_bolas % 10
+    qtd_colunas: int = min(qtd_bolas, 10)
+
+    # inicia pela linha incompleta (se houver), onde cada dezena ocupa uma coluna distinta:
+    # estado = (quantidade de colunas com cada total, maximo de dezenas em uma linha)
+    estados: dict[tuple[tuple[int, ...], int], int] = defaultdict(int)
+    for qtd in range(0, min(qtd_dezenas_incompleta, qtd_bolas_sorteio) + 1):
+        colunas: list[int] = [0] * (largura + 1)
+        colunas[0] = qtd_colunas - qtd
+        colunas[1] += qtd
+        estados[(tuple(colunas), qtd)] += math.comb(qtd_dezenas_incompleta, qtd)
+
+    # as linhas completas tem as mesmas transicoes, entao sao calculadas uma vez por estado:
+    transicoes: dict[tuple[int, ...], list[tuple[tuple, int, int]]] = {}
+    for _ in range(0, qtd_linhas_completas):
+        novos: dict[tuple[tuple[int, ...], int], int] = defaultdict(int)
+        for (colunas, max_linha), qtd_jogos in estados.items():
+            if colunas not in transicoes:
+                marcadas: int = sum(total * qtd for total, qtd in enumerate(colunas))
+                transicoes[colunas] = distribuir_linha(colunas, qtd_bolas_sorteio - marcadas)
+            for novas, qtd_linha, formas in transicoes[colunas]:
+                novos[(novas, max(max_linha, qtd_linha))] += qtd_jogos * formas
+        estados = novos
+
+    # apenas os estados com todas as k dezenas marcadas correspondem a jogos:
+    matriciais: list[int] = [0] * (largura * largura)
+    for (colunas, max_linha), qtd_jogos in estados.items():
+        if sum(total * qtd for total, qtd in enumerate(colunas)) == qtd_bolas_sorteio:
+            max_coluna: int = max(total for total, qtd in enumerate(colunas) if qtd > 0)
+            matriciais[max_coluna * largura + max_linha] += qtd_jogos
+
+    return matriciais
+
+
+# ----------------------------------------------------------------------------
+# SEQUENCIAS E CONSECUTIVAS
+# ----------------------------------------------------------------------------
+
+# as dezenas de um jogo formam blocos de dezenas consecutivas: a quantidade de jogos com
+# k dezenas em r blocos eh C(k-1, r-1), formas de quebrar as dezenas em blocos, vezes
+# C(n-k+1, r), formas de posicionar os blocos separados pelas n-k dezenas nao escolhidas.
+
+# quantidade de jogos para cada numero de pares de dezenas adjacentes (k - r, com r blocos):
+def dist_sequencias(qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    qtd_separadores: int = qtd_bolas - qtd_bolas_sorteio + 1
+
+    sequencias: list[int] = [0] * qtd_bolas_sorteio
+    for qtd_blocos in range(1, qtd_bolas_sorteio + 1):
+        sequencias[qtd_bolas_sorteio - qtd_blocos] = \
+            math.comb(qtd_bolas_sorteio - 1, qtd_blocos - 1) * \
+            math.comb(qtd_separadores, qtd_blocos)
+
+    return sequencias
+
+
+# quantidade de jogos para cada maior bloco de dezenas consecutivas (tamanho do bloco - 1),
+# contando os jogos com todos os blocos limitados a cada tamanho maximo:
+def dist_consecutivas(qtd_bolas: int, qtd_bolas_sorteio: int) -> list[int]:
+    qtd_separadores: int = qtd_bolas - qtd_bolas_sorteio + 1
+
+    consecutivas: list[int] = [0] * qtd_bolas_sorteio
+    qtd_jogos_anterior: int = 0
+    for tamanho_maximo in range(1, qtd_bolas_sorteio + 1):
+        # formas[s] = quantidade de formas de compor s dezenas com r blocos de tamanho limitado:
+        formas: list[int] = [1] + [0] * qtd_bolas_sorteio
+        qtd_jogos: int = 0
+        for qtd_blocos in range(1, qtd_bolas_sorteio + 1):
+            formas = [sum(formas[soma - tamanho]
+                          for tamanho in range(1, min(tamanho_maximo, soma) + 1))
+                      for soma in range(0, qtd_bolas_sorteio + 1)]
+            qtd_jogos += formas[qtd_bolas_sorteio] * math.comb(qtd_separadores, qtd_blocos)
+
+        consecutivas[tamanho_maximo - 1] = qtd_jogos - qtd_jogos_anterior
+        qtd_jogos_anterior = qtd_jogos
+
+    return consecutivas
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,96 @@
+"""
+   Package lothon.stats
+   Module  fatores.py
+
+   Vetor denso com o fator (float32) de cada combinacao de jogos de uma loteria, indexado pelo
+   ordinal do jogo (para a Mega-Sena, C(60,6) fatores ~ 200 MB), com o fator de qualquer jogo
+   obtido em O(1) via rank(), sem instanciar um objeto Jogo por combinacao.
+"""
+
+__all__ = [
+    'FatoresJogos'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from array import array
+from collections.abc import Iterable
+import itertools as itt
+import heapq
+import math
+
+# Libs/Frameworks modules
+# Own/Project modules
+from lothon.stats import combinatoria as cb
+from lothon.stats.bitset import BitsetJogos
+
+
+# ----------------------------------------------------------------------------
+# CLASSE CONCRETA
+# ----------------------------------------------------------------------------
+
+class FatoresJogos:
+    """
+    Implementacao de classe para os fatores de todas as combinacoes de jogos, com o item i do
+    vetor (formato 'f' = float32) contendo o fator do jogo de ordinal i, e zero para os jogos
+    descartados. O vetor pode estar em memoria ou mapeado de um arquivo (somente leitura).
+    """
+
+    # --- PROPRIEDADES -------------------------------------------------------
+    __slots__ = ('qtd_bolas', 'qtd_bolas_sorteio', 'qtd_jogos', 'fatores')
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __init__(self, qtd_bolas: int, qtd_bolas_sorteio: int, fatores: memoryview = None):
+        self.qtd_bolas: int = qtd_bolas
+        self.qtd_bolas_sorteio: int = qtd_bolas_sorteio
+        self.qtd_jogos: int = math.comb(qtd_bolas, qtd_bolas_sorteio)
+        if fatores is None:  # adiciona 1 para o zero-index
+            fatores = memoryview(array('f', bytes(4 * (self.qtd_jogos + 1))))
+        elif len(fatores) != self.qtd_jogos + 1 or fatores.format != 'f':
+            raise ValueError(f"Vetor invalido de fatores: {len(fatores)} itens '{fatores.format}' "
+                             f"para {self.qtd_jogos} jogos.")
+        self.fatores: memoryview = fatores
+
+    # --- METODOS ------------------------------------------------------------
+
+    def set_fatores(self, ordinais: Iterable[int], metricas: Iterable[float]):
+        fatores: memoryview = self.fatores
+        for ordinal, metrica in zip(ordinais, metricas):
+            fatores[ordinal] = metrica
+
+    def get_fator(self, ordinal: int) -> float:
+        return self.fatores[ordinal] if 0 < ordinal <= self.qtd_jogos else 0.0
+
+    def get_fator_jogo(self, dezenas: tuple[int, ...]) -> float:
+        return self.get_fator(cb.rank(dezenas, self.qtd_bolas, self.qtd_bolas_sorteio))
+
+    # quantidade de jogos nao descartados (fator diferente de zero):
+    def count(self) -> int:
+        return sum(map(bool, self.fatores))
+
+    # conjunto dos jogos nao descartados (fator diferente de zero):
+    def get_aceitos(self) -> BitsetJogos:
+        return BitsetJogos.from_ordinais(self.qtd_jogos,
+                                         itt.compress(range(0, self.qtd_jogos + 1), self.fatores))
+
+    # posicao (a partir de 0) do jogo na ordenacao decrescente e estavel dos fatores, contando os
+    # jogos com fator maior e os de fator igual com ordinal menor. Jogo descartado retorna -1:
+    def get_posicao(self, ordinal: int) -> int:
+        fator: float = self.get_fator(ordinal)
+        if fator == 0:
+            return -1
+
+        return sum(map(fator.__lt__, self.fatores)) + \
+            sum(map(fator.__eq__, self.fatores[1:ordinal]))
+
+    # ordinais dos jogos com os maiores fatores, na ordem decrescente e estavel dos fatores:
+    def get_topos(self, qtd_topos: int) -> list[int]:
+        # apenas os jogos nao descartados (fator diferente de zero) sao considerados:
+        ordinais: Iterable[int] = itt.compress(range(0, self.qtd_jogos + 1), self.fatores)
+        return heapq.nlargest(qtd_topos, ordinais, key=self.fatores.__getitem__)
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,76 @@
+"""
+   Package lothon.stats
+   Module  mascara.py
+
+   Representacao de dezenas em mascara de bits (um bit por dezena, ate 100 na Lotomania),
+   com a contagem de acertos entre jogos e sorteios via int.bit_count().
+"""
+
+__all__ = [
+    'to_mascara',
+    'to_mascaras',
+    'to_dezenas',
+    'count_acertos',
+    'count_acertos_dezenas',
+    'count_acertos_lote',
+    'max_acertos_lote'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from collections.abc import Iterable
+
+# Libs/Frameworks modules
+# Own/Project modules
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+# cada dezena corresponde ao bit de mesma posicao (dezenas repetidas ocupam o mesmo bit):
+def to_mascara(dezenas: Iterable[int]) -> int:
+    mascara: int = 0
+    for dezena in dezenas:
+        mascara |= 1 << dezena
+
+    return mascara
+
+
+def to_mascaras(jogos: Iterable[Iterable[int]]) -> list[int]:
+    return [to_mascara(jogo) for jogo in jogos]
+
+
+def to_dezenas(mascara: int) -> tuple[int, ...]:
+    dezenas: list[int] = []
+    while mascara:
+        bit: int = mascara & -mascara  # isola o bit menos significativo
+        dezenas.append(bit.bit_length() - 1)
+        mascara ^= bit
+
+    return tuple(dezenas)
+
+
+# quantidade de dezenas em comum entre duas mascaras:
+def count_acertos(mascara1: int, mascara2: int) -> int:
+    return (mascara1 & mascara2).bit_count()
+
+
+# quantidade de dezenas da tupla presentes na mascara, contando as dezenas repetidas da tupla
+# (como nas colunas do Super Sete), exatamente como na conferencia dezena a dezena:
+def count_acertos_dezenas(dezenas: Iterable[int], mascara: int) -> int:
+    return sum((mascara >> dezena) & 1 for dezena in dezenas)
+
+
+# confere a mascara com todo um lote de mascaras (jogos ou sorteios) de uma so vez:
+def count_acertos_lote(mascara: int, mascaras: Iterable[int]) -> list[int]:
+    return [(mascara & outra).bit_count() for outra in mascaras]
+
+
+def max_acertos_lote(mascara: int, mascaras: Iterable[int]) -> int:
+    return max(((mascara & outra).bit_count() for outra in mascaras), default=0)
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,130 @@
+"""
+   Package lothon.stats
+   Module  ranking.py
+
+   Rankings das dezenas mantidos de forma incremental, a cada concurso acrescentado,
+   evitando recontar todo o historico de concursos para extrair os topos do ranking.
+"""
+
+__all__ = [
+    'RankingFrequencia',
+    'RankingAusencia'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from collections.abc import Iterable
+import bisect
+
+# Libs/Frameworks modules
+# Own/Project modules
+
+
+# ----------------------------------------------------------------------------
+# CLASSE CONCRETA
+# ----------------------------------------------------------------------------
+
+class RankingFrequencia:
+    """
+    Implementacao de classe para manter o ranking das dezenas pela frequencia nos sorteios,
+    em ordem decrescente de frequencia e crescente de dezena (inclusive o zero-index),
+    exatamente como em cb.calc_topos_frequencia(), atualizado em O(log n) por dezena sorteada.
+    """
+
+    # --- PROPRIEDADES -------------------------------------------------------
+    __slots__ = ('frequencias', 'ranking')
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __init__(self, qtd_bolas: int):
+        self.frequencias: list[int] = [0] * (qtd_bolas + 1)  # adiciona 1 para o zero-index
+        self.ranking: list[int] = list(range(0, qtd_bolas + 1))
+
+    # --- METODOS ------------------------------------------------------------
+
+    def chave(self, dezena: int) -> tuple[int, int]:
+        return -self.frequencias[dezena], dezena
+
+    def add_sorteio(self, bolas: Iterable[int]):
+        for dezena in bolas:
+            # retira a dezena de sua posicao atual e a reposiciona com a nova frequencia:
+            posicao: int = bisect.bisect_left(self.ranking, self.chave(dezena), key=self.chave)
+            del self.ranking[posicao]
+            self.frequencias[dezena] += 1
+            bisect.insort_left(self.ranking, dezena, key=self.chave)
+
+    # desfaz o add_sorteio() das dezenas fornecidas:
+    def remove_sorteio(self, bolas: Iterable[int]):
+        for dezena in bolas:
+            posicao: int = bisect.bisect_left(self.ranking, self.chave(dezena), key=self.chave)
+            del self.ranking[posicao]
+            self.frequencias[dezena] -= 1
+            bisect.insort_left(self.ranking, dezena, key=self.chave)
+
+    def get_topos(self, qtd_topos: int = None) -> list[int]:
+        return self.ranking[0:qtd_topos]
+
+
+class RankingAusencia:
+    """
+    Implementacao de classe para manter o ranking das dezenas pela ausencia (atraso) ate o
+    ultimo sorteio, a partir do indice do ultimo sorteio de cada dezena. A ordem eh decrescente
+    de ausencia e crescente de dezena, com as dezenas nunca sorteadas ao final (ausencia -1),
+    exatamente como em cb.calc_topos_ausencia(), atualizado em O(log n) por dezena sorteada.
+    """
+
+    # --- PROPRIEDADES -------------------------------------------------------
+    __slots__ = ('ultimos_sorteios', 'qtd_sorteios', 'ranking', 'sorteios_anteriores')
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __init__(self, qtd_bolas: int):
+        self.ultimos_sorteios: list[int] = [-1] * (qtd_bolas + 1)  # -1 se nunca foi sorteada
+        self.qtd_sorteios: int = 0
+        self.ranking: list[int] = list(range(0, qtd_bolas + 1))
+        # ultimo sorteio anterior de cada dezena sorteada, por sorteio, para desfazer o sorteio:
+        self.sorteios_anteriores: list[tuple[tuple[int, int], ...]] = []
+
+    # --- METODOS ------------------------------------------------------------
+
+    # quanto mais antigo o ultimo sorteio da dezena, maior a ausencia e melhor a posicao:
+    def chave(self, dezena: int) -> tuple[int, int, int]:
+        ultimo_sorteio: int = self.ultimos_sorteios[dezena]
+        return (1, 0, dezena) if ultimo_sorteio < 0 else (0, ultimo_sorteio, dezena)
+
+    def add_sorteio(self, bolas: Iterable[int]):
+        anteriores: list[tuple[int, int]] = []
+        for dezena in bolas:
+            anteriores.append((dezena, self.ultimos_sorteios[dezena]))
+            self.reposicionar(dezena, self.qtd_sorteios)
+
+        self.sorteios_anteriores.append(tuple(anteriores))
+        self.qtd_sorteios += 1
+
+    # desfaz o ultimo add_sorteio(), restaurando o sorteio anterior de cada dezena:
+    def pop_sorteio(self):
+        for dezena, ultimo_sorteio in reversed(self.sorteios_anteriores.pop()):
+            self.reposicionar(dezena, ultimo_sorteio)
+
+        self.qtd_sorteios -= 1
+
+    # retira a dezena de sua posicao atual e a reposiciona com o novo ultimo sorteio:
+    def reposicionar(self, dezena: int, ultimo_sorteio: int):
+        posicao: int = bisect.bisect_left(self.ranking, self.chave(dezena), key=self.chave)
+        del self.ranking[posicao]
+        self.ultimos_sorteios[dezena] = ultimo_sorteio
+        bisect.insort_left(self.ranking, dezena, key=self.chave)
+
+    # numero de sorteios em que cada dezena ficou ausente ate o ultimo sorteio (ou -1 se nunca):
+    def get_ausencias(self) -> list[int]:
+        ultimo_indice: int = self.qtd_sorteios - 1
+        return [-1 if ultimo_sorteio < 0 else ultimo_indice - ultimo_sorteio
+                for ultimo_sorteio in self.ultimos_sorteios]
+
+    def get_topos(self, qtd_topos: int = None) -> list[int]:
+        return self.ranking[0:qtd_topos]
+
+# ----------------------------------------------------------------------------
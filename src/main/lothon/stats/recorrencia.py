@@ -0,0 +1,169 @@
+"""
+   Package lothon.stats
+   Module  recorrencia.py
+
+   Indice invertido das dezenas para os concursos em que foram sorteadas (um bitset de concursos
+   por dezena), para obter o maximo de recorrencias de um jogo em todo o historico somando os
+   bitsets de suas dezenas, sem percorrer os concursos um a um.
+"""
+
+__all__ = [
+    'IndiceRecorrencias'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from collections.abc import Iterable
+
+# Libs/Frameworks modules
+# Own/Project modules
+from lothon.domain import Concurso
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+# os contadores de todos os concursos sao mantidos em planos de bits (bit-sliced): o plano p
+# guarda o bit p do contador de cada concurso. Somar um bitset eh como somar 1 nos contadores
+# dos concursos presentes no bitset, propagando o "vai-um" de plano em plano:
+def somar_bitset(planos: list[int], bitset: int) -> list[int]:
+    somados: list[int] = []
+    for posicao, plano in enumerate(planos):
+        if bitset == 0:  # sem "vai-um", os demais planos nao mudam:
+            somados.extend(planos[posicao:])
+            return somados
+        somados.append(plano ^ bitset)
+        bitset &= plano
+
+    # o ultimo "vai-um" inaugura um novo plano:
+    if bitset != 0:
+        somados.append(bitset)
+    return somados
+
+
+# o maior contador entre os concursos candidatos eh obtido do plano mais significativo para o
+# menos significativo, mantendo apenas os concursos que possuem o bit ligado em cada plano:
+def max_contador(planos: list[int], candidatos: int) -> int:
+    maximo: int = 0
+    for posicao in range(len(planos) - 1, -1, -1):
+        filtrados: int = candidatos & planos[posicao]
+        if filtrados != 0:
+            candidatos = filtrados
+            maximo |= 1 << posicao
+
+    return maximo
+
+
+# versao de max_contador() que retorna tambem os candidatos com o maior contador:
+def max_contador_candidatos(planos: list[int], candidatos: int) -> tuple[int, int]:
+    maximo: int = 0
+    for posicao in range(len(planos) - 1, -1, -1):
+        filtrados: int = candidatos & planos[posicao]
+        if filtrados != 0:
+            candidatos = filtrados
+            maximo |= 1 << posicao
+
+    return maximo, candidatos
+
+
+# ----------------------------------------------------------------------------
+# CLASSE CONCRETA
+# ----------------------------------------------------------------------------
+
+class IndiceRecorrencias:
+    """
+    Implementacao de classe para indexar os concursos por dezena: o bit i do bitset da dezena
+    indica se ela foi sorteada no i-esimo concurso. O maximo de recorrencias de um jogo eh o
+    maior contador apos somar os bitsets de suas k dezenas, exatamente como em
+    cb.max_recorrencias(), inclusive com dezenas repetidas (como no Super Sete).
+    """
+
+    # --- PROPRIEDADES -------------------------------------------------------
+    __slots__ = ('concursos_dezenas', 'todos_concursos')
+
+    # --- INICIALIZACAO ------------------------------------------------------
+
+    def __init__(self, qtd_bolas: int, concursos: list[Concurso]):
+        self.concursos_dezenas: list[int] = [0] * (qtd_bolas + 1)  # adiciona 1 para o zero-index
+        for posicao, concurso in enumerate(concursos):
+            bit_concurso: int = 1 << posicao
+            for dezena in set(concurso.bolas):
+                self.concursos_dezenas[dezena] |= bit_concurso
+
+        self.todos_concursos: int = (1 << len(concursos)) - 1
+
+    # --- METODOS ------------------------------------------------------------
+
+    # indexa o concurso seguinte aos ja indexados:
+    def add_concurso(self, concurso: Concurso):
+        bit_concurso: int = self.todos_concursos + 1
+        for dezena in set(concurso.bolas):
+            self.concursos_dezenas[dezena] |= bit_concurso
+
+        self.todos_concursos |= bit_concurso
+
+    # retira o ultimo concurso indexado:
+    def pop_concurso(self, concurso: Concurso):
+        bit_concurso: int = (self.todos_concursos + 1) >> 1
+        for dezena in set(concurso.bolas):
+            self.concursos_dezenas[dezena] &= ~bit_concurso
+
+        self.todos_concursos ^= bit_concurso
+
+    def somar_dezenas(self, bolas: Iterable[int], planos: list[int] = None) -> list[int]:
+        if planos is None:
+            planos = []
+        for dezena in bolas:
+            planos = somar_bitset(planos, self.concursos_dezenas[dezena])
+
+        return planos
+
+    # numero maximo de recorrencias de [bolas] nos concursos, podendo ignorar um deles (posicao):
+    def max_recorrencias(self, bolas: tuple[int, ...], posicao_ignore: int = -1) -> int:
+        candidatos: int = self.todos_concursos
+        if posicao_ignore >= 0:
+            candidatos &= ~(1 << posicao_ignore)
+
+        return max_contador(self.somar_dezenas(bolas), candidatos)
+
+    # versao de max_recorrencias() que retorna tambem em quantos concursos ocorre o maximo:
+    def max_recorrencias_qtd(self, bolas: tuple[int, ...],
+                             posicao_ignore: int = -1) -> tuple[int, int]:
+        candidatos: int = self.todos_concursos
+        if posicao_ignore >= 0:
+            candidatos &= ~(1 << posicao_ignore)
+
+        maximo, candidatos = max_contador_candidatos(self.somar_dezenas(bolas), candidatos)
+        return maximo, candidatos.bit_count()
+
+    # versao em lote de max_recorrencias(): os jogos em sequencia (como os gerados por
+    # itertools.combinations) compartilham prefixos, cujas somas sao reaproveitadas:
+    def max_recorrencias_lote(self, jogos: Iterable[tuple[int, ...]]) -> list[int]:
+        recorrencias: list[int] = []
+        prefixo: tuple[int, ...] = ()
+        somas_prefixo: list[list[int]] = [[]]  # somas_prefixo[i] = planos das i dezenas iniciais
+        for jogo in jogos:
+            # identifica o tamanho do prefixo em comum com o jogo anterior:
+            comum: int = 0
+            for dezena_jogo, dezena_prefixo in zip(jogo, prefixo):
+                if dezena_jogo != dezena_prefixo:
+                    break
+                comum += 1
+
+            # soma apenas as dezenas apos o prefixo em comum:
+            del somas_prefixo[comum + 1:]
+            planos: list[int] = somas_prefixo[comum]
+            for dezena in jogo[comum:]:
+                planos = somar_bitset(planos, self.concursos_dezenas[dezena])
+                somas_prefixo.append(planos)
+            prefixo = jogo
+
+            recorrencias.append(max_contador(planos, self.todos_concursos))
+
+        return recorrencias
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,64 @@
+"""
+   Package lothon.stats
+   Module  topos.py
+
+   Posicao de jogos na ordem decrescente dos fatores, sem ordenar todos os jogos computados:
+   a posicao de cada jogo eh obtida contando os jogos que o precedem na ordenacao.
+"""
+
+__all__ = [
+    'calc_posicoes'
+]
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from collections import Counter
+from collections.abc import Collection, Sequence
+import bisect
+
+# Libs/Frameworks modules
+# Own/Project modules
+
+
+# ----------------------------------------------------------------------------
+# POSICAO POR CONTAGEM
+# ----------------------------------------------------------------------------
+
+# posicoes (a partir de 0) de varios jogos na ordenacao decrescente e estavel dos fatores, com os
+# jogos em ordem crescente de ordinal, em uma unica contagem dos fatores: a contagem de cada fator
+# fornece os jogos de fator maior, e a contagem de cada trecho entre os ordinais pesquisados
+# fornece os jogos de fator igual que precedem cada um deles.
+# Retorna a posicao apenas dos ordinais encontrados entre os jogos:
+def calc_posicoes(consultas: Collection[int], ordinais: Sequence[int],
+                  fatores: Sequence[float]) -> dict[int, int]:
+    # localiza os ordinais pesquisados, na ordem em que aparecem entre os jogos:
+    indices: list[int] = []
+    for ordinal in sorted(consultas):
+        idx: int = bisect.bisect_left(ordinais, ordinal)
+        if idx < len(ordinais) and ordinais[idx] == ordinal:
+            indices.append(idx)
+
+    # quantidade de jogos com fator maior que cada um dos fatores:
+    contagem: Counter = Counter(fatores)
+    maiores: dict[float, int] = {}
+    acumulado: int = 0
+    for fator in sorted(contagem, reverse=True):
+        maiores[fator] = acumulado
+        acumulado += contagem[fator]
+
+    # percorre os trechos entre os ordinais pesquisados, acumulando os fatores que precedem:
+    posicoes: dict[int, int] = {}
+    anteriores: Counter = Counter()
+    inicio: int = 0
+    for idx in indices:
+        anteriores.update(fatores[inicio:idx])
+        fator: float = fatores[idx]
+        posicoes[ordinais[idx]] = maiores[fator] + anteriores[fator]
+        inicio = idx
+
+    return posicoes
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,124 @@
+"""
+   Package tests
+   Module  conftest.py
+
+   Configuracao comum dos testes: path do pacote lothon, parametros do arquivo INI de
+   desenvolvimento com diretorios temporarios e arquivos HTML de resultados sinteticos.
+"""
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from datetime import date, timedelta
+import os
+import sys
+import random
+
+# Libs/Frameworks modules
+import pytest
+
+# Own/Project modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'main')))
+from lothon.conf import settings, app_config  # noqa: E402
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# diretorio com o arquivo INI de desenvolvimento:
+DIR_CONFIG: str = os.path.join(os.path.dirname(__file__), '..', 'resources', 'dev')
+
+# data do primeiro concurso dos arquivos de resultados sinteticos:
+DATA_INICIAL: date = date(1996, 3, 11)
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+def gerar_valor(rnd: random.Random) -> str:
+    return f"R$ {rnd.randint(0, 9999999):,}".replace(',', '.') + f",{rnd.randint(0, 99):02d}"
+
+
+# colunas de um concurso da Mega-Sena, incluindo TABLE aninhada e entidades HTML:
+def gerar_tds_mega_sena(rnd: random.Random, id_concurso: int, data: date) -> list[str]:
+    bolas: list[int] = rnd.sample(range(1, 61), 6)
+    return ([str(id_concurso), data.strftime('%d/%m/%Y')] +
+            [f"{bola:02d}" for bola in bolas] +
+            [str(rnd.randint(0, 3)) for _ in range(0, 3)] +
+            [gerar_valor(rnd) for _ in range(0, 3)] +
+            ['<table><tbody><tr><td>SAO PAULO</td><td>SP</td></tr></tbody></table>',
+             'S&atilde;o<br>Paulo &amp; Rio'])
+
+
+# colunas de um concurso da Dupla-Sena, com os dois sorteios na mesma linha:
+def gerar_tds_dupla_sena(rnd: random.Random, id_concurso: int, data: date) -> list[str]:
+    bolas1: list[int] = rnd.sample(range(1, 51), 6)
+    bolas2: list[int] = rnd.sample(range(1, 51), 6)
+    return ([str(id_concurso), data.strftime('%d/%m/%Y')] + [str(bola) for bola in bolas1] +
+            ['x', str(rnd.randint(0, 2)), 'y', gerar_valor(rnd), 'z', 'w'] +
+            [v for f in range(1, 4) for v in (str(rnd.randint(0, 50 * f)), gerar_valor(rnd))] +
+            [str(bola) for bola in bolas2] +
+            [v for f in range(0, 4) for v in (str(rnd.randint(0, 50 * f)), gerar_valor(rnd))])
+
+
+GERADORES_TDS: dict = {
+    "megasena": gerar_tds_mega_sena,
+    "duplasena": gerar_tds_dupla_sena
+}
+
+
+# grava o arquivo HTML no formato da pagina de resultados da Caixa, com um TBODY por concurso:
+def gravar_resultados(path_arquivo: str, tag_loteria: str, linhas: list[list[str]]):
+    tbodys: str = ''.join('<tbody>\n<tr>' + ''.join(f"<td>{td}</td>" for td in tds) +
+                          '</tr>\n</tbody>\n' for tds in linhas)
+    with open(path_arquivo, 'w', encoding='utf-8') as htm:
+        htm.write(f'<html><head><meta charset="utf-8"><title>Resultados</title></head>'
+                  f'<body><p>Loterias &amp; Resultados<br>\n'
+                  f'<table class="tabela-resultado {tag_loteria}">'
+                  f'<thead><tr><th>Concurso</th></tr></thead>\n{tbodys}</table>'
+                  f'<table class="outra"><tbody><tr><td>9</td></tr></tbody></table>'
+                  f'</body></html>')
+
+
+# ----------------------------------------------------------------------------
+# FIXTURES
+# ----------------------------------------------------------------------------
+
+@pytest.fixture(scope='session')
+def config_ini():
+    assert settings.setup_config(DIR_CONFIG)
+    return app_config
+
+
+# configuracao INI com as pastas de dados e cache em diretorios temporarios:
+@pytest.fixture
+def config(config_ini, tmp_path, monkeypatch):
+    monkeypatch.setattr(app_config, 'DS_cache_path', str(tmp_path / 'cache'))
+    monkeypatch.setattr(app_config, 'DS_caixa_path', str(tmp_path / 'caixa'))
+    os.makedirs(app_config.DS_cache_path)
+    os.makedirs(app_config.DS_caixa_path)
+    return app_config
+
+
+# gera o arquivo HTML de resultados sinteticos de uma loteria, retornando seu path:
+@pytest.fixture
+def resultados_htm(config):
+    def gerar(id_loteria: str, nome_loteria: str, qtd_concursos: int,
+              semente: int = 7) -> str:
+        rnd: random.Random = random.Random(semente)
+        gerar_tds = GERADORES_TDS[id_loteria]
+        linhas: list[list[str]] = [gerar_tds(rnd, i, DATA_INICIAL + timedelta(days=3 * i))
+                                   for i in range(1, qtd_concursos + 1)]
+
+        path_arquivo: str = os.path.join(config.DS_caixa_path,
+                                         config.LC_loteria_htm_name.format(nome_loteria))
+        gravar_resultados(path_arquivo, id_loteria, linhas)
+        return path_arquivo
+
+    return gerar
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,174 @@
+"""
+   Package tests
+   Module  test_compute_incremental.py
+
+   Estado dos computes atualizados de forma incremental (append_concurso / pop_concurso)
+   comparado com o estado obtido pela computacao completa (execute) dos mesmos concursos.
+"""
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from dataclasses import is_dataclass
+from datetime import date, timedelta
+import importlib
+import math
+import random
+
+# Libs/Frameworks modules
+import pytest
+
+# Own/Project modules
+from lothon.domain import Concurso, Premio, SerieSorteio
+from lothon.domain.sorteio.concurso_duplo import ConcursoDuplo
+from lothon.stats import combinatoria as cb
+from lothon.process.compute.abstract_compute import AbstractCompute
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# loteria pequena, com C(25,6) = 177.100 jogos, para contabilizar os histogramas rapidamente:
+QTD_BOLAS: int = 25
+QTD_BOLAS_SORTEIO: int = 6
+QTD_CONCURSOS: int = 240
+
+# modulos dos computes, com a classe Compute<Nome> de cada um:
+COMPUTES: list[str] = ['ausencia', 'ciclo', 'colunario', 'consecutiva', 'decenario', 'dispersao',
+                       'distancia', 'espacamento', 'frequencia', 'matricial', 'mediana',
+                       'numerologia', 'ordinal', 'paridade', 'premiacao', 'recorrencia',
+                       'repetencia', 'sequencia', 'somatorio', 'unitario']
+
+# sequencias de (concursos executados, concursos adicionados um a um e depois retirados):
+SEQUENCIAS: list[tuple[int, int]] = [(2, 3), (1, 4), (3, 1), (QTD_CONCURSOS - 30, 30)]
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+def gerar_premios(rnd: random.Random) -> dict[int, Premio]:
+    return {acertos: Premio(acertos, rnd.randint(0, 2), 1000.0 * acertos)
+            for acertos in range(QTD_BOLAS_SORTEIO - 2, QTD_BOLAS_SORTEIO + 1)}
+
+
+# concursos aleatorios da loteria, com um ou dois sorteios por concurso:
+def gerar_concursos(duplo: bool) -> list[Concurso]:
+    rnd: random.Random = random.Random(11)
+    concursos: list[Concurso] = []
+    for i in range(1, QTD_CONCURSOS + 1):
+        data: date = date(2000, 1, 1) + timedelta(days=3 * i)
+        bolas: tuple[int, ...] = tuple(rnd.sample(range(1, QTD_BOLAS + 1), QTD_BOLAS_SORTEIO))
+        if duplo:
+            bolas2: tuple[int, ...] = tuple(rnd.sample(range(1, QTD_BOLAS + 1),
+                                                       QTD_BOLAS_SORTEIO))
+            concursos.append(ConcursoDuplo(i, data, bolas, gerar_premios(rnd),
+                                           bolas2, gerar_premios(rnd)))
+        else:
+            concursos.append(Concurso(i, data, bolas, gerar_premios(rnd)))
+    return concursos
+
+
+def new_compute(nome: str) -> AbstractCompute:
+    modulo = importlib.import_module(f"lothon.process.compute.compute_{nome}")
+    cproc: AbstractCompute = getattr(modulo, f"Compute{nome.capitalize()}")()
+    cproc.setup({'qtd_bolas': QTD_BOLAS, 'qtd_bolas_sorteio': QTD_BOLAS_SORTEIO,
+                 'qtd_jogos': math.comb(QTD_BOLAS, QTD_BOLAS_SORTEIO)})
+    return cproc
+
+
+def get_slots(objeto) -> list[str]:
+    slots: list[str] = []
+    for classe in type(objeto).__mro__:
+        slots.extend(s for s in getattr(classe, '__slots__', ()) if s not in slots)
+    return slots
+
+
+# compara recursivamente o estado dos objetos, retornando o caminho da primeira diferenca:
+def comparar(valor, esperado, caminho: str):
+    if type(valor) != type(esperado):
+        return f"{caminho}: {type(valor).__name__} != {type(esperado).__name__}"
+    if isinstance(valor, SerieSorteio):
+        if valor != esperado or valor.get_stats() != esperado.get_stats():
+            return f"{caminho}: {valor} != {esperado}"
+    elif hasattr(valor, '__slots__') and not is_dataclass(valor):
+        for slot in get_slots(valor):
+            diferenca = comparar(getattr(valor, slot, None), getattr(esperado, slot, None),
+                                 f"{caminho}.{slot}")
+            if diferenca:
+                return diferenca
+    elif isinstance(valor, (list, tuple)):
+        if len(valor) != len(esperado):
+            return f"{caminho}: {len(valor)} != {len(esperado)} itens"
+        for idx, (item, item_esperado) in enumerate(zip(valor, esperado)):
+            diferenca = comparar(item, item_esperado, f"{caminho}[{idx}]")
+            if diferenca:
+                return diferenca
+    elif isinstance(valor, dict):
+        if valor.keys() != esperado.keys():
+            return f"{caminho}: chaves distintas"
+        for chave in valor:
+            diferenca = comparar(valor[chave], esperado[chave], f"{caminho}[{chave}]")
+            if diferenca:
+                return diferenca
+    elif valor != esperado:
+        return f"{caminho}: {valor!r} != {esperado!r}"
+    return None
+
+
+def comparar_computes(cproc: AbstractCompute, esperado: AbstractCompute):
+    # os parametros e a contagem de jogos zerados no EVALUATE nao dependem dos concursos:
+    for slot in get_slots(cproc):
+        if slot not in ('options', 'qtd_zerados'):
+            diferenca = comparar(getattr(cproc, slot, None), getattr(esperado, slot, None), slot)
+            assert diferenca is None, diferenca
+
+
+# ----------------------------------------------------------------------------
+# TESTES
+# ----------------------------------------------------------------------------
+
+@pytest.mark.parametrize('duplo', [False, True], ids=['simples', 'duplo'])
+@pytest.mark.parametrize('nome', COMPUTES)
+def test_incremental_igual_execute(config, nome, duplo):
+    concursos: list[Concurso] = gerar_concursos(duplo)
+    cproc: AbstractCompute = new_compute(nome)
+    for qtd_executados, qtd_adicionados in SEQUENCIAS:
+        cproc.execute(concursos[:qtd_executados])
+        adicionados: list[Concurso] = concursos[qtd_executados:qtd_executados + qtd_adicionados]
+        for concurso in adicionados:
+            cproc.append_concurso(concurso)
+
+        completo: AbstractCompute = new_compute(nome)
+        completo.execute(concursos[:qtd_executados + qtd_adicionados])
+        comparar_computes(cproc, completo)
+
+        # retirando os concursos adicionados, volta ao estado dos concursos executados:
+        for concurso in reversed(adicionados):
+            assert cproc.pop_concurso() is concurso
+        completo.execute(concursos[:qtd_executados])
+        comparar_computes(cproc, completo)
+
+        # a avaliacao dos jogos tambem eh a mesma da computacao completa:
+        jogos: list[tuple] = [concurso.bolas for concurso in concursos[-20:]]
+        ordinais: list[int] = [cb.rank(jogo, QTD_BOLAS, QTD_BOLAS_SORTEIO) for jogo in jogos]
+        assert cproc.evaluate_batch(ordinais, jogos) == completo.evaluate_batch(ordinais, jogos)
+
+
+def test_stats_serie_atualizadas(config):
+    serie: SerieSorteio = SerieSorteio(1)
+    for id_concurso in (3, 4, 9, 15, 16, 30):
+        serie.add_sorteio(id_concurso)
+    serie.last_sorteio(40)
+    assert (serie.max_atraso, serie.min_atraso, serie.len_atrasos) == (13, 2, 5)
+
+    # as medidas sao recalculadas apos desfazer o ultimo concurso e retirar um sorteio:
+    serie.undo_last_sorteio(40)
+    serie.pop_sorteio(30)
+    assert (serie.max_atraso, serie.min_atraso, serie.len_atrasos) == (5, 2, 3)
+    assert serie.mean_atraso == pytest.approx(11 / 3)
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,122 @@
+"""
+   Package tests
+   Module  test_lote_jogos.py
+
+   Avaliacao das combinacoes de jogos em faixas (shards), em paralelo ou no proprio processo,
+   comparada com a avaliacao serial dos lotes pela cadeia de computes.
+"""
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from datetime import date, timedelta
+import math
+import random
+
+# Libs/Frameworks modules
+import pytest
+
+# Own/Project modules
+from lothon.domain import Concurso
+from lothon.stats.bitset import BitsetJogos
+from lothon.process.compute import lote_jogos as lj
+from lothon.process.compute.compute_paridade import ComputeParidade
+from lothon.process.compute.compute_sequencia import ComputeSequencia
+from lothon.process.compute.compute_somatorio import ComputeSomatorio
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+# loteria pequena, com C(25,5) = 53.130 jogos, para avaliar todas as combinacoes:
+QTD_BOLAS: int = 25
+QTD_BOLAS_SORTEIO: int = 5
+
+
+# ----------------------------------------------------------------------------
+# FIXTURES
+# ----------------------------------------------------------------------------
+
+# cadeia de computes ja executada sobre concursos aleatorios:
+@pytest.fixture
+def compute_chain(config):
+    rnd: random.Random = random.Random(3)
+    concursos: list[Concurso] = [
+        Concurso(i, date(2000, 1, 1) + timedelta(days=i),
+                 tuple(sorted(rnd.sample(range(1, QTD_BOLAS + 1), QTD_BOLAS_SORTEIO))), {})
+        for i in range(1, 200)]
+
+    parms: dict = {'qtd_bolas': QTD_BOLAS, 'qtd_bolas_sorteio': QTD_BOLAS_SORTEIO,
+                   'qtd_jogos': math.comb(QTD_BOLAS, QTD_BOLAS_SORTEIO)}
+    chain = [ComputeParidade(), ComputeSequencia(), ComputeSomatorio()]
+    for cproc in chain:
+        cproc.setup(parms)
+        cproc.execute(concursos)
+    return chain
+
+
+# ----------------------------------------------------------------------------
+# TESTES
+# ----------------------------------------------------------------------------
+
+@pytest.mark.parametrize('ordinal_inicial', [1, 8, 13, 200])
+def test_add_faixa_igual_ordinais(ordinal_inicial):
+    rnd: random.Random = random.Random(ordinal_inicial)
+    qtd_faixa: int = 37
+    posicoes: list[int] = rnd.sample(range(0, qtd_faixa), 12)
+    bits_faixa: bytearray = bytearray((qtd_faixa + 7) // 8)
+    for posicao in posicoes:
+        bits_faixa[posicao >> 3] |= 1 << (posicao & 7)
+
+    # o bitset ja possui ordinais antes e depois da faixa, que devem ser mantidos:
+    ordinais: list[int] = [ordinal_inicial - 1, ordinal_inicial + qtd_faixa]
+    bitset: BitsetJogos = BitsetJogos.from_ordinais(300, ordinais)
+    bitset.add_faixa(ordinal_inicial, bits_faixa)
+    assert bitset == BitsetJogos.from_ordinais(
+        300, ordinais + [ordinal_inicial + posicao for posicao in posicoes])
+
+
+@pytest.mark.parametrize('qtd_workers', [1, 2, 3])
+def test_evaluate_faixas_igual_serial(compute_chain, monkeypatch, qtd_workers):
+    # lotes menores geram mais faixas, com ordinais iniciais fora do limite dos bytes:
+    monkeypatch.setattr(lj, 'TAMANHO_LOTE_JOGOS', 1000)
+
+    serial: list[tuple[int, float]] = []
+    for ordinais, jogos in lj.gerar_lotes(QTD_BOLAS, QTD_BOLAS_SORTEIO):
+        ordinais, _, metricas = lj.evaluate_lote(compute_chain, ordinais, jogos)
+        serial.extend(zip(ordinais, metricas))
+    zerados: list[int] = [cproc.qtd_zerados for cproc in compute_chain]
+    assert 0 < len(serial) < math.comb(QTD_BOLAS, QTD_BOLAS_SORTEIO)
+
+    for cproc in compute_chain:
+        cproc.qtd_zerados = 0
+    aceitos: BitsetJogos = lj.evaluate_aceitos(compute_chain, QTD_BOLAS, QTD_BOLAS_SORTEIO,
+                                               qtd_workers)
+    assert list(aceitos) == [ordinal for ordinal, _ in serial]
+    assert [cproc.qtd_zerados for cproc in compute_chain] == zerados
+
+    ordinais, metricas = lj.evaluate_metricas(compute_chain, QTD_BOLAS, QTD_BOLAS_SORTEIO,
+                                              qtd_workers)
+    assert list(zip(ordinais, metricas)) == serial
+
+    fatores = lj.evaluate_fatores(compute_chain, QTD_BOLAS, QTD_BOLAS_SORTEIO, qtd_workers)
+    assert [ordinal for ordinal in range(0, fatores.qtd_jogos + 1)
+            if fatores.get_fator(ordinal) > 0] == [ordinal for ordinal, _ in serial]
+
+
+def test_fatores_gravados_uma_vez(compute_chain, config):
+    fatores = lj.evaluate_fatores(compute_chain, QTD_BOLAS, QTD_BOLAS_SORTEIO, 1)
+    assert lj.abrir_fatores_jogos('teste', 199, QTD_BOLAS, QTD_BOLAS_SORTEIO) is None
+    assert lj.salvar_fatores_jogos('teste', 199, fatores) > 0
+
+    # os fatores abertos do arquivo sao os mesmos, apenas para o concurso gravado:
+    gravados = lj.abrir_fatores_jogos('teste', 199, QTD_BOLAS, QTD_BOLAS_SORTEIO)
+    assert gravados.fatores.tolist() == fatores.fatores.tolist()
+    assert gravados.get_aceitos() == lj.evaluate_aceitos(compute_chain, QTD_BOLAS,
+                                                         QTD_BOLAS_SORTEIO, 1)
+    assert lj.abrir_fatores_jogos('teste', 198, QTD_BOLAS, QTD_BOLAS_SORTEIO) is None
+
+# ----------------------------------------------------------------------------
@@ -0,0 +1,75 @@
+"""
+   Package tests
+   Module  test_matriz_sorteios.py
+
+   Contagens da visao colunar dos concursos comparadas com a iteracao dos concursos.
+"""
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+from datetime import date, timedelta
+import random
+
+# Libs/Frameworks modules
+import pytest
+
+# Own/Project modules
+from lothon.domain import Concurso, MatrizSorteios
+from lothon.stats import combinatoria as cb
+
+
+# ----------------------------------------------------------------------------
+# FUNCOES HELPERS
+# ----------------------------------------------------------------------------
+
+# concursos aleatorios, com bolas repetidas e bola zero no caso do Super Sete:
+def gerar_concursos(qtd_bolas: int, qtd_bolas_sorteio: int, repete: bool) -> list[Concurso]:
+    rnd: random.Random = random.Random(qtd_bolas)
+    concursos: list[Concurso] = []
+    for i in range(1, 301):
+        if repete:
+            bolas = tuple(rnd.randint(0, qtd_bolas) for _ in range(0, qtd_bolas_sorteio))
+        else:
+            bolas = tuple(sorted(rnd.sample(range(1, qtd_bolas + 1), qtd_bolas_sorteio)))
+        concursos.append(Concurso(i, date(2000, 1, 1) + timedelta(days=i), bolas, {}))
+    return concursos
+
+
+# ----------------------------------------------------------------------------
+# TESTES
+# ----------------------------------------------------------------------------
+
+@pytest.mark.parametrize('qtd_bolas, qtd_bolas_sorteio, repete',
+                         [(60, 6, False), (25, 15, False), (9, 7, True)])
+def test_contagens_iguais_concursos(qtd_bolas, qtd_bolas_sorteio, repete):
+    concursos: list[Concurso] = gerar_concursos(qtd_bolas, qtd_bolas_sorteio, repete)
+    matriz = MatrizSorteios(concursos, qtd_bolas, qtd_bolas_sorteio)
+
+    for inicio, fim in ((0, None), (10, 200), (150, 151), (50, 50)):
+        trecho: list[Concurso] = concursos[inicio:fim]
+        ocorrencias: list[int] = cb.new_list_int(qtd_bolas)
+        for concurso in trecho:
+            cb.count_dezenas(concurso.bolas, ocorrencias)
+
+        assert matriz.get_ocorrencias(inicio, fim) == ocorrencias
+        assert matriz.get_frequencias(inicio, fim) == \
+            [sum(1 for c in trecho if bola in c.bolas) for bola in range(0, qtd_bolas + 1)]
+
+    # a coluna zero da incidencia so eh preenchida quando ha bola zero:
+    assert (matriz.get_frequencia(0) > 0) == repete
+    for bola in range(0, qtd_bolas + 1):
+        ultimo: int = max((i for i, c in enumerate(concursos) if bola in c.bolas), default=-1)
+        assert matriz.get_ultimo_sorteio(bola) == ultimo
+
+
+@pytest.mark.parametrize('qtd_topos', [None, 5, 10])
+def test_topos_matriz_iguais_concursos(qtd_topos):
+    concursos: list[Concurso] = gerar_concursos(60, 6, False)
+    matriz = MatrizSorteios(concursos, 60, 6)
+    assert cb.calc_topos_matriz(matriz, qtd_topos) == \
+        cb.calc_topos_frequencia(concursos, 60, qtd_topos)
+
+# ----------------------------------------------------------------------------
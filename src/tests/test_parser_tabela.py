@@ -0,0 +1,158 @@
+"""
+   Package tests
+   Module  test_parser_tabela.py
+
+   Equivalencia do parser incremental da TABLE de resultados com o parsing anterior,
+   efetuado com BeautifulSoup (html.parser).
+"""
+
+# ----------------------------------------------------------------------------
+# DEPENDENCIAS
+# ----------------------------------------------------------------------------
+
+# Built-in/Generic modules
+# Libs/Frameworks modules
+import pytest
+
+# Own/Project modules
+from lothon.domain import MegaSena, DuplaSena, get_tuple_loteria
+from lothon.infra import parser_tabela, parser_resultados, cache_concursos
+
+
+# ----------------------------------------------------------------------------
+# CONSTANTES
+# ----------------------------------------------------------------------------
+
+LOTERIAS: list[tuple] = [(MegaSena, "megasena"), (DuplaSena, "duplasena")]
+
+# conteudos HTML com situacoes que o parser deve tratar como o BeautifulSoup:
+HTML_CASOS: list[str] = [
+    # apenas a primeira TR de cada TBODY eh considerada:
+    '<table class="tabela-resultado megasena"><tbody><tr><td>1</td><td>a</td></tr>'
+    '<tr><td>2</td></tr></tbody><tbody><tr><td>3</td></tr></tbody></table>',
+    # TABLE aninhada dentro de um TD, com seu proprio TBODY:
+    '<div><table class="tabela-resultado megasena"><tbody><tr><td>1</td>'
+    '<td><table><tbody><tr><td>x</td><td>y</td></tr></tbody></table></td></tr></tbody>'
+    '</table></div>',
+    # entidades, comentarios e elementos sem fechamento dentro das celulas:
+    '<table class="tabela-resultado  megasena"><tbody><tr><td>S&atilde;o<br>Jos&eacute;</td>'
+    '<td><!-- nada -->&#49;&amp;<img src="a.png">2</td></tr></tbody></table>',
+    # TABLE de resultados identificada entre varias classes CSS, apos outras TABLE:
+    '<table class="tabela-resultado"><tbody><tr><td>0</td></tr></tbody></table>'
+    '<table class="megasena"><tbody><tr><td>9</td></tr></tbody></table>'
+    '<table class="x tabela-resultado megasena y"><tbody><tr><td>5</td></tr></tbody></table>',
+    # arquivo sem a TABLE de resultados:
+    '<html><body><table class="outra"><tbody><tr><td>1</td></tr></tbody></table></body></html>'
+]
+
+
+# ----------------------------------------------------------------------------
+# TESTES
+# ----------------------------------------------------------------------------
+
+@pytest.mark.parametrize('content_htm', HTML_CASOS)
+def test_linhas_texto_iguais_soup(content_htm):
+    table_class: str = 'tabela-resultado megasena'
+    assert parser_tabela.extrair_linhas_texto(content_htm, table_class) == \
+        parser_resultados.extrair_linhas_soup(content_htm, table_class)
+
+
+def test_linhas_vazias_ignoradas():
+    # TBODY sem TD nao gera linha (com BeautifulSoup, geraria linha vazia sem concurso):
+    content_htm: str = ('<table class="tabela-resultado megasena"><tbody><tr><td>1</td></tr>'
+                        '</tbody><tbody><tr></tr></tbody><tbody></tbody>'
+                        '<tbody><tr><td>3</td></tr></tbody></table>')
+    assert parser_tabela.extrair_linhas_texto(content_htm, 'tabela-resultado megasena') == \
+        [['1'], ['3']]
+
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 7, 4096, parser_tabela.TAMANHO_BLOCO_LEITURA])
+@pytest.mark.parametrize('classe_loteria, id_loteria', LOTERIAS)
+def test_linhas_arquivo_iguais_soup(resultados_htm, config, monkeypatch,
+                                    classe_loteria, id_loteria, tamanho_bloco):
+    loteria = classe_loteria.from_tuple(get_tuple_loteria(id_loteria))
+    path_htm: str = resultados_htm(id_loteria, loteria.get_file_resultados(), 120)
+    table_class: str = config.LC_table_class_find.format(loteria.get_tag_resultados())
+
+    # o arquivo lido em blocos pequenos corta tags, entidades e textos entre os blocos:
+    monkeypatch.setattr(parser_tabela, 'TAMANHO_BLOCO_LEITURA', tamanho_bloco)
+    linhas = parser_tabela.extrair_linhas_arquivo(path_htm, table_class)
+
+    linhas_soup = parser_resultados.extrair_linhas_soup(
+        parser_resultados.ler_arquivo_htm(path_htm), table_class)
+    assert len(linhas) == 120
+    assert linhas == linhas_soup
+
+
+@pytest.mark.parametrize('classe_loteria, id_loteria', LOTERIAS)
+def test_concursos_iguais_soup(resultados_htm, config, classe_loteria, id_loteria):
+    loteria = classe_loteria.from_tuple(get_tuple_loteria(id_loteria))
+    path_htm: str = resultados_htm(id_loteria, loteria.get_file_resultados(), 250)
+    table_class: str = config.LC_table_class_find.format(loteria.get_tag_resultados())
+
+    # concursos obtidos pelo parsing anterior, com BeautifulSoup:
+    loteria.set_resultados(parser_resultados.extrair_linhas_soup(
+        parser_resultados.ler_arquivo_htm(path_htm), table_class))
+    concursos_soup = loteria.concursos
+
+    # concursos obtidos pelo parser incremental utilizado na carga das loterias:
+    loteria = classe_loteria.from_tuple(get_tuple_loteria(id_loteria))
+    assert parser_resultados.parse_concursos_loteria(loteria) == len(concursos_soup)
+    assert loteria.concursos == concursos_soup
+
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 7, parser_tabela.TAMANHO_BLOCO_LEITURA])
+def test_localizador_fim_linhas(resultados_htm, config, monkeypatch, tamanho_bloco):
+    loteria = MegaSena.from_tuple(get_tuple_loteria("megasena"))
+    path_htm: str = resultados_htm("megasena", loteria.get_file_resultados(), 80)
+    table_class: str = config.LC_table_class_find.format(loteria.get_tag_resultados())
+
+    # o fim das linhas eh o ultimo TBODY antes do fechamento da TABLE de resultados:
+    with open(path_htm, 'rb') as arquivo:
+        conteudo: bytes = arquivo.read()
+    fim_tabela: int = conteudo.index(b'<table class="outra">')
+    fim_linhas: int = conteudo.rindex(b'</tbody>', 0, fim_tabela) + len(b'</tbody>')
+
+    monkeypatch.setattr(parser_tabela, 'TAMANHO_BLOCO_LEITURA', tamanho_bloco)
+    localizador = parser_tabela.LocalizadorLinhas(table_class)
+    linhas = parser_tabela.extrair_linhas_arquivo(path_htm, table_class, 0, localizador)
+    assert (localizador.fim_linhas, localizador.qtd_linhas) == (fim_linhas, len(linhas))
+
+    # retomando a partir do fim de um TBODY, apenas as linhas seguintes sao localizadas:
+    offset: int = conteudo.index(b'</tbody>\n<tbody>') + len(b'</tbody>')
+    localizador = parser_tabela.LocalizadorLinhas(table_class, offset)
+    linhas = parser_tabela.extrair_linhas_arquivo(path_htm, table_class, offset, localizador)
+    assert (localizador.fim_linhas, localizador.qtd_linhas) == (fim_linhas, 79)
+    assert len(linhas) == 79
+
+
+@pytest.mark.parametrize('classe_loteria, id_loteria', LOTERIAS)
+def test_ingestao_incremental(resultados_htm, config, classe_loteria, id_loteria):
+    loteria = classe_loteria.from_tuple(get_tuple_loteria(id_loteria))
+    resultados_htm(id_loteria, loteria.get_file_resultados(), 100)
+    assert parser_resultados.parse_concursos_loteria(loteria) == len(loteria.concursos)
+
+    # o arquivo recebe novas linhas, mantendo o conteudo ja processado:
+    path_htm: str = resultados_htm(id_loteria, loteria.get_file_resultados(), 130)
+    path_bin: str = parser_resultados.get_path_snapshot(id_loteria)
+    assert cache_concursos.carregar_snapshot(path_bin, path_htm).incremental
+
+    loteria_incremental = classe_loteria.from_tuple(get_tuple_loteria(id_loteria))
+    parser_resultados.parse_concursos_loteria(loteria_incremental)
+    loteria.set_resultados(parser_tabela.extrair_linhas_arquivo(
+        path_htm, config.LC_table_class_find.format(loteria.get_tag_resultados())))
+    assert loteria_incremental.concursos == loteria.concursos
+
+    # o snapshot atualizado ja contem todos os concursos do arquivo:
+    snapshot = cache_concursos.carregar_snapshot(path_bin, path_htm)
+    assert not snapshot.incremental
+    assert snapshot.concursos == loteria.concursos
+
+
+@pytest.mark.parametrize('classe_loteria, id_loteria', LOTERIAS)
+def test_benchmark_parser(resultados_htm, classe_loteria, id_loteria):
+    loteria = classe_loteria.from_tuple(get_tuple_loteria(id_loteria))
+    resultados_htm(id_loteria, loteria.get_file_resultados(), 50)
+    assert parser_resultados.benchmark_parser_loteria(loteria, repeticoes=1)
+
+# ----------------------------------------------------------------------------